@@ -0,0 +1,85 @@
+"""Micro-benchmark of the logging overhead paid by BasePage.click over a 1,000-click run.
+
+Run from the project root with:  python -m benchmarks.bench_logging
+"""
+
+import logging
+import os
+import tempfile
+import timeit
+
+from pages.base_page import BasePage
+from utils.logger import Logger
+
+CLICKS = 1000
+LOCATOR = ("id", "login-button")
+
+
+class FakeElement:
+    def is_displayed(self):
+        return True
+
+    def is_enabled(self):
+        return True
+
+    def click(self):
+        pass
+
+
+class FakeDriver:
+    def find_element(self, by, value):
+        return FakeElement()
+
+
+def eager_click_logging(logger, locator):
+    """The logging calls BasePage.click made before lazy formatting: f-strings and str.center every time."""
+    centered_name = "click".center(30, "-")
+    logger.logger.info(f"Method Name: {centered_name}")
+    logger.logger.info(f"Clicking on a WebElement that has this locator: {locator}")
+    logger.logger.info(f"Successfully clicked on a WebElement that has this locator: {locator}")
+
+
+def make_logger(name, level, quiet=False):
+    logger = Logger(name, log_level=level, log_file_path=tempfile.mkdtemp(), quiet=quiet)
+    for handler in logger.logger.handlers:
+        if type(handler) is logging.StreamHandler:
+            handler.setStream(open(os.devnull, "w"))
+    return logger
+
+
+def run_clicks(logger):
+    page = BasePage(FakeDriver())
+    page.logger = logger
+    return min(timeit.repeat(lambda: page.click(LOCATOR), number=CLICKS, repeat=5))
+
+
+def run_logging_only(callable_):
+    return min(timeit.repeat(callable_, number=CLICKS, repeat=5))
+
+
+def main():
+    info_logger = make_logger("bench.info", logging.INFO)
+    warning_logger = make_logger("bench.warning", logging.WARNING)
+    quiet_logger = make_logger("bench.quiet", logging.INFO, quiet=True)
+
+    eager = run_logging_only(lambda: eager_click_logging(warning_logger, LOCATOR))
+    lazy = run_logging_only(
+        lambda: (
+            warning_logger.log_method_entry("click"),
+            warning_logger.info("Clicking on a WebElement that has this locator: %s", LOCATOR),
+            warning_logger.info("Successfully clicked on a WebElement that has this locator: %s", LOCATOR),
+        )
+    )
+    print(f"Logging overhead of {CLICKS} clicks with INFO disabled:")
+    print(f"  eager f-strings + str.center : {eager * 1000:8.3f} ms ({eager / CLICKS * 1e6:.2f} us/click)")
+    print(f"  lazy, level-gated            : {lazy * 1000:8.3f} ms ({lazy / CLICKS * 1e6:.2f} us/click)")
+    print(f"  removed per click            : {(eager - lazy) / CLICKS * 1e6:.2f} us")
+    print()
+    print(f"BasePage.click x {CLICKS} against an in-memory driver:")
+    for label, logger in (("INFO", info_logger), ("INFO, quiet", quiet_logger), ("WARNING", warning_logger)):
+        total = run_clicks(logger)
+        print(f"  {label:<12}: {total * 1000:8.3f} ms ({total / CLICKS * 1e6:.2f} us/click)")
+
+
+if __name__ == "__main__":
+    main()
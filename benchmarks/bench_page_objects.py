@@ -0,0 +1,193 @@
+"""Benchmark suite for the page-object layer, run against the bundled local SauceDemo replica.
+
+Measures driver startup per browser, the latency of the BasePage primitives, dropdown selection and a full
+login -> add to cart -> checkout flow. Results are written as JSON and compared against a saved baseline.
+
+Run from the project root with:  python -m benchmarks.bench_page_objects --browser chrome
+Save the current numbers as the new baseline with:  python -m benchmarks.bench_page_objects --save-baseline
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+from selenium.webdriver.common.by import By
+
+import variables
+from pages.base_page import BasePage
+from pages.cart_page import CartPage
+from pages.inventory_page import InventoryPage
+from pages.login_page import LoginPage
+from utils.config_loader import set_overrides
+from utils.local_server import LocalSauceDemoServer
+from utils.webdriver_initializer import WebDriverInitializer
+
+BASELINE_FILE = "benchmarks/baseline.json"
+RESULTS_FILE = "reports/benchmarks/results.json"
+USERNAME_FIELD = (By.ID, "user-name")
+LOGIN_BUTTON = (By.ID, "login-button")
+LOGIN_LOGO = (By.CLASS_NAME, "login_logo")
+
+
+def measure(callable_, iterations, setup=None):
+    """Runs callable_ `iterations` times and returns its timing summary in milliseconds."""
+    samples = []
+    for _ in range(iterations):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        callable_()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        "median_ms": round(statistics.median(samples), 3),
+        "min_ms": round(min(samples), 3),
+        "max_ms": round(max(samples), 3),
+        "iterations": iterations,
+    }
+
+
+def start_driver(browser):
+    set_overrides({"browser": browser})
+    return WebDriverInitializer().initialize_webdriver()
+
+
+def bench_startup(browser, iterations):
+    drivers = []
+    result = measure(lambda: drivers.append(start_driver(browser)), iterations)
+    for web_driver in drivers:
+        web_driver.quit()
+    return result
+
+
+def reset_session(web_driver):
+    web_driver.get(variables.url_login_page)
+    web_driver.delete_all_cookies()
+    web_driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+    web_driver.get(variables.url_login_page)
+
+
+def bench_primitives(web_driver, iterations):
+    page = BasePage(web_driver)
+    reset_session(web_driver)
+    return {
+        "find_element": measure(lambda: page.find_element(USERNAME_FIELD), iterations),
+        "send_keys": measure(lambda: page.send_keys(USERNAME_FIELD, variables.valid_username), iterations),
+        "get_text": measure(lambda: page.get_text(LOGIN_LOGO), iterations),
+        "click": measure(lambda: page.click(LOGIN_LOGO), iterations),
+    }
+
+
+def bench_dropdown(web_driver, iterations):
+    reset_session(web_driver)
+    LoginPage(web_driver).login(variables.valid_username, variables.valid_password)
+    inventory_page = InventoryPage(web_driver)
+    sort_options = iter(["Name (Z to A)", "Name (A to Z)"] * iterations)
+    return measure(lambda: inventory_page.select_container(next(sort_options)), iterations)
+
+
+def run_checkout_flow(web_driver):
+    LoginPage(web_driver).login(variables.valid_username, variables.valid_password)
+    cart_page = CartPage(web_driver)
+    cart_page.add_item_to_cart()
+    InventoryPage(web_driver).click_cart_button()
+    cart_page.proceed_to_checkout()
+    cart_page.confirm_order_details("Bench", "Mark", "12345")
+    cart_page.proceed_to_finish()
+    cart_page.get_order_complete_message()
+
+
+def bench_checkout_flow(web_driver, iterations):
+    return measure(lambda: run_checkout_flow(web_driver), iterations, setup=lambda: reset_session(web_driver))
+
+
+def run_benchmarks(browsers, iterations, startup_iterations):
+    server = LocalSauceDemoServer(performance_glitch_delay_ms=0)
+    variables.set_base_url(server.start())
+    results = {}
+    try:
+        for browser in browsers:
+            browser_results = {"driver_startup": bench_startup(browser, startup_iterations)}
+            web_driver = start_driver(browser)
+            try:
+                browser_results.update(bench_primitives(web_driver, iterations))
+                browser_results["select_dropdown_by_visible_text"] = bench_dropdown(web_driver, iterations)
+                browser_results["checkout_flow"] = bench_checkout_flow(web_driver, max(1, iterations // 5))
+            finally:
+                web_driver.quit()
+            results[browser] = browser_results
+    finally:
+        server.stop()
+    return {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def compare_to_baseline(current, baseline, threshold):
+    """Returns one row per benchmark found in both runs, flagging medians slower than the baseline by > threshold."""
+    rows = []
+    for browser, benchmarks in current["results"].items():
+        for name, result in benchmarks.items():
+            baseline_result = baseline.get("results", {}).get(browser, {}).get(name)
+            if baseline_result is None:
+                continue
+            change = (result["median_ms"] - baseline_result["median_ms"]) / baseline_result["median_ms"]
+            rows.append(
+                {
+                    "browser": browser,
+                    "benchmark": name,
+                    "baseline_ms": baseline_result["median_ms"],
+                    "current_ms": result["median_ms"],
+                    "change": change,
+                    "regressed": change > threshold,
+                }
+            )
+    return rows
+
+
+def write_json(file_path, data):
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with open(file_path, "w") as json_file:
+        json.dump(data, json_file, indent=4)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--browser", nargs="+", default=["chrome"], help="Browsers to benchmark.")
+    parser.add_argument("--iterations", type=int, default=20, help="Iterations of every primitive benchmark.")
+    parser.add_argument("--startup-iterations", type=int, default=3, help="Driver launches per browser.")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="Baseline file to compare against.")
+    parser.add_argument("--output", default=RESULTS_FILE, help="Where to write the results of this run.")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown, 0.2 is 20%%.")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the new baseline.")
+    args = parser.parse_args()
+
+    current = run_benchmarks(args.browser, args.iterations, args.startup_iterations)
+    write_json(args.output, current)
+    print(f"Results written to {args.output}")
+    if args.save_baseline:
+        write_json(args.baseline, current)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}, run with --save-baseline to create one.")
+        return 0
+    with open(args.baseline) as baseline_file:
+        rows = compare_to_baseline(current, json.load(baseline_file), args.threshold)
+    for row in rows:
+        status = "REGRESSED" if row["regressed"] else "ok"
+        print(
+            f"  {row['browser']:<8} {row['benchmark']:<32} {row['baseline_ms']:9.2f} ms -> "
+            f"{row['current_ms']:9.2f} ms ({row['change']:+.1%}) {status}"
+        )
+    return 1 if any(row["regressed"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""Load-style scenario: many users checking out at the same time, all driven from one asyncio event loop.
+
+Every user gets its own browser session on a single shared driver server, and every WebDriver command goes
+through one pooled keep-alive HTTP client, so the whole run uses a handful of threads. Needs the "async"
+extra (aiohttp).
+
+Run from the project root with:  python -m benchmarks.load_checkout --users 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+
+import variables
+from pages.async_base_page import AsyncBasePage
+from pages.cart_page import CartPage
+from pages.inventory_page import InventoryPage
+from pages.login_page import LoginPage
+from utils.async_webdriver import AsyncCommandTransport
+from utils.local_server import LocalSauceDemoServer
+from utils.webdriver_initializer import WebDriverInitializer
+
+
+async def checkout(initializer, transport, server_url, user_number):
+    """Runs the login -> add to cart -> checkout flow in its own session and returns how long it took."""
+    page = AsyncBasePage(await initializer.initialize_async_webdriver(transport, server_url))
+    try:
+        start = time.perf_counter()
+        await page.navigate_to(variables.url_login_page)
+        await page.send_keys(LoginPage.USERNAME_FIELD, variables.valid_username)
+        await page.send_keys(LoginPage.PASSWORD_FIELD, variables.valid_password)
+        await page.click(LoginPage.LOGIN_BUTTON)
+        await page.wait_for_url_contains("inventory.html")
+        await page.click(CartPage.button_item_to_be_added_to_cart)
+        await page.click(InventoryPage.cart_icon)
+        await page.click(CartPage.checkout_button)
+        await page.send_keys(CartPage.checkout_fname, "Load")
+        await page.send_keys(CartPage.checkout_lname, f"User {user_number}")
+        await page.send_keys(CartPage.checkout_zip_code, "12345")
+        await page.click(CartPage.continue_button_one)
+        await page.click(CartPage.finish_button)
+        await page.get_text(CartPage.complete_display_message)
+        return time.perf_counter() - start
+    finally:
+        await page.quit()
+
+
+async def run(users, concurrency):
+    initializer = WebDriverInitializer()
+    service = initializer.start_driver_service()
+    limit = asyncio.Semaphore(concurrency)
+
+    async def limited_checkout(user_number):
+        async with limit:
+            return await checkout(initializer, transport, service.service_url, user_number)
+
+    try:
+        async with AsyncCommandTransport(pool_size=concurrency * 2) as transport:
+            start = time.perf_counter()
+            durations = await asyncio.gather(*(limited_checkout(number) for number in range(users)))
+            total = time.perf_counter() - start
+            commands = transport.commands_sent
+    finally:
+        service.stop()
+    return durations, total, commands
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=10, help="How many users check out.")
+    parser.add_argument("--concurrency", type=int, default=10, help="How many browser sessions run at once.")
+    args = parser.parse_args()
+
+    server = LocalSauceDemoServer(performance_glitch_delay_ms=0)
+    variables.set_base_url(server.start())
+    try:
+        durations, total, commands = asyncio.run(run(args.users, args.concurrency))
+    finally:
+        server.stop()
+    print(f"{args.users} checkouts, {args.concurrency} at a time, in {total:.2f}s")
+    print(f"  threads         : {threading.active_count()}")
+    print(f"  median checkout : {statistics.median(durations):.2f}s, slowest {max(durations):.2f}s")
+    print(f"  commands sent   : {commands} ({commands / total:.0f}/s)")
+
+
+if __name__ == "__main__":
+    main()
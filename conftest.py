@@ -1,21 +1,238 @@
+import os
 import pytest
 import allure
 from utils.config import Config
+from utils.auth_state import AuthStateCache
+from utils.browser_presets import BrowserPreset, preset_stats
+from utils.config_loader import ConfigLoader, parse_override_value, set_overrides
+from utils.driver_pool import DriverPool
+from utils.element_cache import element_cache_stats
+from utils.impact_analysis import get_changed_lines, impact_recorder, load_impact_map, select_tests
+from utils.local_server import LocalSauceDemoServer
+from utils.lean_mode import LeanMode
+from utils.network_capture import network_capture
+from utils.parallel import DurationStore, get_worker_dir, is_worker
 from utils.webdriver_initializer import WebDriverInitializer
 from selenium.common.exceptions import WebDriverException
 from utils.logger_instance import logger
+from utils.process_watchdog import process_watchdog
+from utils.profiler import profiler
+from utils.recovery_engine import recovery_engine
+from utils.screenshot_pipeline import ScreenshotPipeline
+from utils.utils import read_json
+from utils.wait_engine import wait_stats
+from utils.warm_profile import (
+    WarmProfileManager,
+    first_paint_stats,
+    release_all_profile_clones,
+    release_profile_clone,
+)
+from pages.base_page import BasePage
+from pages.inventory_page import InventoryPage
+from pages.login_page import LoginPage
+import variables
+
+
+driver_pool_key = pytest.StashKey[DriverPool]()
+parallel_settings_key = pytest.StashKey[dict]()
+duration_store_key = pytest.StashKey[DurationStore]()
+lean_mode_totals_key = pytest.StashKey[dict]()
+local_server_key = pytest.StashKey[LocalSauceDemoServer]()
+screenshot_pipeline_key = pytest.StashKey[ScreenshotPipeline]()
+
+
+def pytest_addoption(parser):
+    parser.addoption("--browser", action="store", default=None, help="Browser to run the tests on.")
+    parser.addoption(
+        "--config-override",
+        action="append",
+        default=[],
+        metavar="SECTION.KEY=VALUE",
+        help="Overrides a value of config/config.json, e.g. driver_pool.max_uses=5.",
+    )
+    parser.addoption(
+        "--impact-select",
+        action="store_true",
+        default=False,
+        help="Runs only the tests whose recorded page-object dependencies changed since --impact-base.",
+    )
+    parser.addoption("--impact-base", action="store", default="HEAD", help="Git revision to diff against.")
+
+
+def apply_config_overrides(config):
+    """Feeds the command-line overrides into the process-wide configuration view."""
+    overrides = {}
+    for override in config.getoption("config_override"):
+        path, _, value = override.partition("=")
+        overrides[path.strip()] = parse_override_value(value.strip())
+    if config.getoption("browser"):
+        overrides["browser"] = config.getoption("browser")
+    set_overrides(overrides)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    """Gives every xdist worker its own Allure results shard and prepares load-balanced scheduling."""
+    apply_config_overrides(config)
+    settings = ConfigLoader().get_parallel_settings()
+    config.stash[parallel_settings_key] = settings
+    config.stash[duration_store_key] = DurationStore(settings["durations_file"])
+    config.pluginmanager.register(config.stash[duration_store_key], "duration_store")
+    if is_worker(config) and config.option.allure_report_dir:
+        config.option.allure_report_dir = get_worker_dir(config.option.allure_report_dir)
+    if config.getoption("numprocesses", None) and config.getoption("maxschedchunk", None) is None:
+        config.option.maxschedchunk = 1
+    profiler.enabled = ConfigLoader().get_profiler_settings()["enabled"]
+    process_watchdog.configure(**ConfigLoader().get_watchdog_settings())
+    network_capture.configure(**ConfigLoader().get_network_capture_settings())
+    recovery_engine.configure(**ConfigLoader().get_recovery_settings())
+    impact_settings = ConfigLoader().get_impact_analysis_settings()
+    impact_recorder.enabled = impact_settings["record"]
+    impact_recorder.tracked_dirs = tuple(
+        os.path.join(config.rootpath, tracked_dir) + os.sep for tracked_dir in impact_settings["tracked_dirs"]
+    )
+    screenshot_settings = ConfigLoader().get_screenshot_settings()
+    config.stash[screenshot_pipeline_key] = ScreenshotPipeline(
+        get_worker_dir(settings["screenshots_dir"]),
+        image_format=screenshot_settings["format"],
+        quality=screenshot_settings["quality"],
+        max_workers=screenshot_settings["max_workers"],
+        budget_mb=screenshot_settings["budget_mb"],
+        deduplicate=screenshot_settings["deduplicate"],
+    )
+    local_server_settings = ConfigLoader().get_local_server_settings()
+    if local_server_settings["enabled"] and (is_worker(config) or not config.getoption("numprocesses", None)):
+        server = LocalSauceDemoServer(
+            performance_glitch_delay_ms=local_server_settings["performance_glitch_delay_ms"]
+        )
+        config.stash[local_server_key] = server
+        variables.set_base_url(server.start())
+
+
+def pytest_unconfigure(config):
+    server = config.stash.get(local_server_key, None)
+    if server is not None:
+        server.stop()
+
+
+def pytest_xdist_auto_num_workers(config):
+    """Uses the worker count from config.json when running with "-n auto"."""
+    apply_config_overrides(config)
+    return ConfigLoader().get_parallel_settings()["workers"]
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("impact_select"):
+        select_impacted_tests(config, items)
+    if is_worker(config):
+        config.stash[duration_store_key].sort_longest_first(items)
+
+
+def select_impacted_tests(config, items):
+    """Deselects the tests whose recorded page-object dependencies weren't touched by the current changes."""
+    settings = ConfigLoader().get_impact_analysis_settings()
+    impact_map = load_impact_map(settings["map_dir"])
+    if not impact_map:
+        logger.warning("No impact map was found in %s, so every test is selected.", settings["map_dir"])
+        return
+    selected = select_tests(
+        items, impact_map, get_changed_lines(config.getoption("impact_base")), settings["tracked_dirs"]
+    )
+    if selected is None:
+        return
+    deselected = [item for item in items if item not in selected]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item):
+    impact_recorder.current_test = item.nodeid
+    yield
+    impact_recorder.current_test = None
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    profiler.current_test = item.nodeid
+    outcome = yield
+    profiler.current_test = None
+    driver = item.funcargs.get("driver", None)
+    if network_capture.enabled and driver is not None and outcome.excinfo is None:
+        violations = network_capture.check_budgets(driver)
+        if violations:
+            network_capture.budget_failures.append((item.nodeid, violations))
+            outcome.force_exception(AssertionError("Performance budget exceeded: " + "; ".join(violations)))
+
+
+def pytest_sessionfinish(session):
+    if not is_worker(session.config):
+        session.config.stash[duration_store_key].save()
+    session.config.stash[screenshot_pipeline_key].shutdown()
+    process_watchdog.reap_all()
+    release_all_profile_clones()
+    wait_stats.save(os.path.join(get_worker_dir("reports/wait_stats"), "wait_stats.json"))
+    preset_stats.save(
+        os.path.join(get_worker_dir(ConfigLoader().get_browser_preset_settings()["stats_dir"]), "startup.json")
+    )
+    if impact_recorder.enabled:
+        impact_recorder.save(
+            os.path.join(get_worker_dir(ConfigLoader().get_impact_analysis_settings()["map_dir"]), "impact_map.json")
+        )
+    if profiler.enabled:
+        profiler.save(get_worker_dir(ConfigLoader().get_profiler_settings()["output_dir"]))
+    logger.flush()
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request):
+    """Session-wide pool of warm WebDriver sessions, or None when pooling is disabled."""
+    settings = ConfigLoader().get_driver_pool_settings()
+    if not settings["enabled"]:
+        yield None
+        return
+    config_loader = ConfigLoader()
+    preset = BrowserPreset(
+        config_loader.get_browser_preset_settings()["name"], config_loader.get_specified_browser().lower()
+    )
+    pool = DriverPool(max_uses=settings["max_uses"], window_size=preset.viewport)
+    request.config.stash[driver_pool_key] = pool
+    yield pool
+    pool.shutdown()
+
+
+@pytest.fixture(scope="session")
+def lean_mode(request):
+    """Session-wide lean mode reporter that tracks the requests and bytes avoided by resource blocking."""
+    config_loader = ConfigLoader()
+    lean_mode = LeanMode(config_loader.get_lean_mode_settings(), config_loader.get_specified_browser().lower())
+    request.config.stash[lean_mode_totals_key] = {"requests_avoided": 0, "bytes_avoided": 0}
+    yield lean_mode
+    lean_mode.save_catalog()
 
 
 @pytest.fixture(scope="function")
-def driver():
+def driver(request, driver_pool, lean_mode):
     """Fixture to initialize and yield a WebDriver instance."""
     logger.log_method_entry("The Driver Fixture")
     webdriver = None
+    transport_start = None
     try:
         logger.info("Initializing WebDriver...")
-        webdriver_initializer = WebDriverInitializer()
-        webdriver = webdriver_initializer.initialize_webdriver()
-        webdriver.maximize_window()
+        if driver_pool is not None:
+            webdriver = driver_pool.acquire()
+        else:
+            webdriver_initializer = WebDriverInitializer()
+            webdriver = webdriver_initializer.initialize_webdriver()
+        if profiler.enabled:
+            profiler.instrument_driver(webdriver)
+        process_watchdog.begin_test(webdriver)
+        network_capture.begin_test(webdriver)
+        if hasattr(webdriver.command_executor, "snapshot"):
+            transport_start = webdriver.command_executor.snapshot()
+        if hasattr(webdriver, "first_paint_ms"):
+            webdriver.first_paint_ms = None
         logger.info("WebDriver initialized successfully.")
         yield webdriver
     except WebDriverException as e:
@@ -23,24 +240,209 @@ def driver():
         raise WebDriverException(f"An error occurred while trying to initialize the webdriver. Error: {e}")
     finally:
         if webdriver is not None:
-            logger.info("Quitting WebDriver...")
-            webdriver.quit()
-            logger.info("WebDriver quit successfully.")
+            memory = process_watchdog.end_test(webdriver, request.node.nodeid)
+            if memory is not None:
+                request.node.user_properties.append(("memory", memory))
+            first_paint = getattr(webdriver, "first_paint_ms", None)
+            if first_paint is not None:
+                request.node.user_properties.append(("first_paint_ms", first_paint))
+                first_paint_stats.record(first_paint, warm=ConfigLoader().get_warm_profile_settings()["enabled"])
+            if transport_start is not None:
+                transport = webdriver.command_executor.summary(since=transport_start)
+                request.node.user_properties.append(("transport", transport))
+            network, performance_log = network_capture.end_test(webdriver, request.node.nodeid)
+            if network is not None:
+                request.node.user_properties.append(("network", network))
+            lean_mode_stats = lean_mode.collect(webdriver, performance_log)
+            if lean_mode_stats is not None:
+                request.node.user_properties.append(("lean_mode", lean_mode_stats))
+                totals = request.config.stash[lean_mode_totals_key]
+                for key, value in lean_mode_stats.items():
+                    totals[key] += value or 0
+            if driver_pool is not None:
+                logger.info("Returning WebDriver to the pool...")
+                report = getattr(request.node, "rep_call", None)
+                driver_pool.release(webdriver, healthy=report is None or not report.failed)
+            else:
+                logger.info("Quitting WebDriver...")
+                webdriver.quit()
+                process_watchdog.reap(webdriver)
+                release_profile_clone(webdriver)
+                logger.info("WebDriver quit successfully.")
+
+
+
+@pytest.fixture(scope="function")
+def user_login_page(driver):
+    """Fixture that yields a LoginPage opened on the SauceDemo login screen."""
+    login_page = LoginPage(driver)
+    login_page.navigate_to(variables.url_login_page)
+    return login_page
+
+
+@pytest.fixture(scope="session")
+def auth_state_cache():
+    """Session-wide cache of the authenticated cookies and storage of each user."""
+    settings = ConfigLoader().get_fast_auth_settings()
+    return AuthStateCache(variables.url_inventory_page, max_age=settings["max_age"])
+
+
+@pytest.fixture(scope="function")
+def login_as(driver, auth_state_cache):
+    """Fixture that returns a function logging the driver in as a user from login_data.json.
+
+    The first login of each user goes through the LoginPage UI; later ones replay the captured session.
+    """
+    test_data = read_json("login_data.json")
+    passwords = {user["username"]: user["password"] for key in test_data for user in test_data[key]}
 
+    def _login_as(username):
+        def ui_login(web_driver):
+            login_page = LoginPage(web_driver)
+            login_page.navigate_to(variables.url_login_page)
+            login_page.login(username, passwords[username])
 
+        auth_state_cache.login(driver, username, ui_login)
+        return InventoryPage(driver)
+
+    return _login_as
 
 
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     outcome = yield
     report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
 
     if report.when == "call" and report.failed:
         driver = item.funcargs.get("driver", None)
         if driver:
-            allure.attach(
-                driver.get_screenshot_as_png(), name="Failure Screenshot", attachment_type=allure.attachment_type.PNG
+            pipeline = item.config.stash[screenshot_pipeline_key]
+            item.screenshot_future = pipeline.capture(driver, item.name)
+            item.dom_snapshot_future = save_failure_dom_snapshot(driver, pipeline, item.name)
+    elif report.when == "teardown":
+        if getattr(item, "screenshot_future", None) is not None:
+            try:
+                screenshot = item.screenshot_future.result()
+            except Exception as e:
+                # Encoding and disk errors surface here; a lost screenshot mustn't break the test run.
+                logger.error("Couldn't save the failure screenshot of %s. Error: %s", item.nodeid, e)
+                screenshot = None
+            if screenshot is not None:
+                file_path, mime_type, extension = screenshot
+                allure.attach.file(file_path, name="Failure Screenshot", attachment_type=mime_type, extension=extension)
+        if getattr(item, "dom_snapshot_future", None) is not None:
+            try:
+                dom_snapshot_path = item.dom_snapshot_future.result()
+            except OSError as e:
+                logger.error("Couldn't save the failure DOM snapshot of %s. Error: %s", item.nodeid, e)
+                dom_snapshot_path = None
+            if dom_snapshot_path is not None:
+                allure.attach.file(
+                    dom_snapshot_path,
+                    name="Failure DOM Snapshot",
+                    attachment_type="application/gzip",
+                    extension="json.gz",
+                )
+
+
+def save_failure_dom_snapshot(driver, pipeline, name):
+    """Takes a DOM snapshot and saves it gzipped next to the failure screenshot, on the screenshot threads.
+
+    Returns a Future of the saved path, or None when no snapshot was taken.
+    """
+    settings = ConfigLoader().get_dom_snapshot_settings()
+    if not settings["on_failure"]:
+        return None
+    try:
+        snapshot = BasePage(driver).take_dom_snapshot()
+    except WebDriverException as e:
+        logger.error("Couldn't take a DOM snapshot for %s. Error: %s", name, e)
+        return None
+    path = os.path.join(pipeline.output_dir, f"{name}.dom.json.gz")
+    return pipeline.submit(snapshot.save, path, settings["compress_level"])
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    pool = config.stash.get(driver_pool_key, None)
+    if pool is not None:
+        stats = pool.summary()
+        terminalreporter.write_sep("-", "driver pool")
+        terminalreporter.write_line(
+            f"[{stats['worker']}] {stats['acquisitions']} sessions handed out, {stats['launches']} browser launches, "
+            f"{stats['launches_saved']} launches saved, {stats['recycled']} recycled, {stats['crashed']} crashed."
+        )
+    slowest_waits = wait_stats.slowest(limit=5)
+    if slowest_waits:
+        terminalreporter.write_sep("-", "slowest waits")
+        for wait in slowest_waits:
+            terminalreporter.write_line(
+                f"{wait['total']:8.2f}s total {wait['max']:6.2f}s max {wait['count']:5d}x {wait['polls']:6d} polls "
+                f"{wait['timeouts']:3d} timeouts  {wait['label']}"
+            )
+    lean_mode_totals = config.stash.get(lean_mode_totals_key, None)
+    if lean_mode_totals and lean_mode_totals["requests_avoided"]:
+        terminalreporter.write_sep("-", "lean mode")
+        terminalreporter.write_line(
+            f"{lean_mode_totals['requests_avoided']} requests and about "
+            f"{lean_mode_totals['bytes_avoided'] / 1024:.1f} KiB avoided by resource blocking."
+        )
+    startup_stats = preset_stats.summary()
+    if startup_stats:
+        terminalreporter.write_sep("-", "browser startup")
+        for stats in startup_stats:
+            fit = stats["browsers_that_fit"]
+            terminalreporter.write_line(
+                f"{stats['preset']}: {stats['launches']} launches, {stats['startup_mean']:.2f}s mean startup, "
+                f"{stats['rss_mean'] / (1024 * 1024):.0f} MiB mean / {stats['rss_max'] / (1024 * 1024):.0f} MiB max "
+                f"RSS" + (f", about {fit} more would fit in the available memory." if fit is not None else ".")
+            )
+    if process_watchdog.flagged_tests or process_watchdog.orphans_killed:
+        terminalreporter.write_sep("-", "process watchdog")
+        for test_name, memory in process_watchdog.flagged_tests:
+            terminalreporter.write_line(
+                f"{memory['rss_growth_mb']:+8.1f} MiB ({memory['rss_start_mb']:.0f} -> {memory['rss_end_mb']:.0f} MiB) "
+                f"{test_name}"
+            )
+        terminalreporter.write_line(f"{process_watchdog.orphans_killed} orphaned browser processes killed.")
+    first_paint = first_paint_stats.summary()
+    if first_paint:
+        terminalreporter.write_sep("-", "first paint")
+        for mode, stats in first_paint.items():
+            terminalreporter.write_line(f"{mode} profile: {stats['mean_ms']:.0f} ms mean over {stats['tests']} tests")
+        config_loader = ConfigLoader()
+        settings = config_loader.get_warm_profile_settings()
+        if settings["enabled"]:
+            browser = config_loader.get_specified_browser().lower()
+            cold = WarmProfileManager(settings, browser).template_cold_first_paint
+            if cold is not None and "warm" in first_paint:
+                terminalreporter.write_line(
+                    f"cold first paint when the template was built: {cold:.0f} ms, "
+                    f"{cold - first_paint['warm']['mean_ms']:.0f} ms saved per test on average"
+                )
+    network_pages = network_capture.summary()
+    if network_pages:
+        terminalreporter.write_sep("-", "page timings")
+        for page, stats in network_pages.items():
+            terminalreporter.write_line(
+                f"{stats['ttfb_ms']:8.0f} ms TTFB {stats['load_ms']:8.0f} ms load {stats['visits']:4d} visits  {page}"
+            )
+        for test_name, violations in network_capture.budget_failures:
+            terminalreporter.write_line(f"over budget: {test_name}: {'; '.join(violations)}")
+    if recovery_engine.stats:
+        terminalreporter.write_sep("-", "action recovery")
+        for name, stats in sorted(recovery_engine.stats.items()):
+            terminalreporter.write_line(
+                f"{name}: {stats['recovered']} recovered, {stats['failed']} failed, {stats['seconds']:.2f}s spent"
             )
+    cache_stats = element_cache_stats.summary()
+    if cache_stats["hits"] or cache_stats["misses"]:
+        terminalreporter.write_sep("-", "element cache")
+        terminalreporter.write_line(
+            f"{cache_stats['hits']} hits, {cache_stats['misses']} misses ({cache_stats['hit_rate']:.0%} hit rate), "
+            f"{cache_stats['stale']} stale, {cache_stats['invalidations']} invalidations, "
+            f"{cache_stats['round_trips_saved']} find_element round-trips saved."
+        )
 
 
 # @pytest.fixture(scope="session", autouse=True)
@@ -0,0 +1,228 @@
+// Behaviour of the bundled SauceDemo stand-in. Element ids and classes mirror www.saucedemo.com.
+(function () {
+    const PERFORMANCE_GLITCH_DELAY_MS = "{{PERFORMANCE_GLITCH_DELAY_MS}}";
+    const PASSWORD = "secret_sauce";
+    const USERS = ["standard_user", "locked_out_user", "problem_user", "performance_glitch_user", "error_user", "visual_user"];
+    const PRODUCTS = [
+        {id: 4, slug: "sauce-labs-backpack", name: "Sauce Labs Backpack", price: 29.99,
+            desc: "carry.allTheThings() with the sleek, streamlined Sly Pack."},
+        {id: 0, slug: "sauce-labs-bike-light", name: "Sauce Labs Bike Light", price: 9.99,
+            desc: "A red light isn't the desired state in testing but it sure helps when riding your bike at night."},
+        {id: 1, slug: "sauce-labs-bolt-t-shirt", name: "Sauce Labs Bolt T-Shirt", price: 15.99,
+            desc: "Get your testing superhero on with the Sauce Labs bolt T-shirt."},
+        {id: 5, slug: "sauce-labs-fleece-jacket", name: "Sauce Labs Fleece Jacket", price: 49.99,
+            desc: "It's not every day that you come across a midweight quarter-zip fleece jacket."},
+        {id: 2, slug: "sauce-labs-onesie", name: "Sauce Labs Onesie", price: 7.99,
+            desc: "Rib snap infant onesie for the junior automation engineer in development."},
+        {id: 3, slug: "test.allthethings()-t-shirt-(red)", name: "Test.allTheThings() T-Shirt (Red)", price: 15.99,
+            desc: "This classic Sauce Labs t-shirt is perfect to wear when cozying up to your keyboard to automate a few tests."},
+    ];
+
+    function currentUser() {
+        const match = document.cookie.match(/(?:^|; )session-username=([^;]*)/);
+        return match ? decodeURIComponent(match[1]) : null;
+    }
+
+    function cart() {
+        return JSON.parse(window.localStorage.getItem("cart-contents") || "[]");
+    }
+
+    function saveCart(items) {
+        if (items.length) {
+            window.localStorage.setItem("cart-contents", JSON.stringify(items));
+        } else {
+            window.localStorage.removeItem("cart-contents");
+        }
+        renderBadge();
+    }
+
+    function showError(container, message) {
+        container.classList.add("error");
+        container.innerHTML = '<h3 data-test="error"></h3>';
+        container.querySelector("h3").textContent = message;
+    }
+
+    function renderHeader() {
+        const header = document.querySelector(".primary_header");
+        header.innerHTML =
+            '<div id="menu_button_container"><div class="bm-burger-button">' +
+            '<button type="button" id="react-burger-menu-btn">Open Menu</button></div>' +
+            '<div class="bm-menu-wrap"><nav class="bm-item-list">' +
+            '<a id="inventory_sidebar_link" class="bm-item menu-item" href="/inventory.html">All Items</a>' +
+            '<a id="logout_sidebar_link" class="bm-item menu-item" href="#">Logout</a>' +
+            '<a id="reset_sidebar_link" class="bm-item menu-item" href="#">Reset App State</a>' +
+            "</nav></div></div>" +
+            '<div class="app_logo">Swag Labs</div>' +
+            '<div id="shopping_cart_container" class="shopping_cart_container">' +
+            '<a class="shopping_cart_link" data-test="shopping-cart-link" href="/cart.html">Cart</a></div>';
+        document.getElementById("react-burger-menu-btn").addEventListener("click", () => {
+            document.querySelector(".bm-menu-wrap").classList.toggle("open");
+        });
+        document.getElementById("logout_sidebar_link").addEventListener("click", (event) => {
+            event.preventDefault();
+            document.cookie = "session-username=; path=/; max-age=0";
+            window.localStorage.removeItem("cart-contents");
+            window.location.href = "/";
+        });
+        document.getElementById("reset_sidebar_link").addEventListener("click", (event) => {
+            event.preventDefault();
+            saveCart([]);
+        });
+        renderBadge();
+    }
+
+    function renderBadge() {
+        const link = document.querySelector(".shopping_cart_link");
+        if (!link) return;
+        const existing = link.querySelector(".shopping_cart_badge");
+        if (existing) existing.remove();
+        const count = cart().length;
+        if (count) {
+            link.insertAdjacentHTML("beforeend", `<span class="shopping_cart_badge" data-test="shopping-cart-badge">${count}</span>`);
+        }
+    }
+
+    function cartButton(product) {
+        const inCart = cart().includes(product.id);
+        const action = inCart ? "remove" : "add-to-cart";
+        const label = inCart ? "Remove" : "Add to cart";
+        const style = inCart ? "btn_secondary" : "btn_primary";
+        return `<button class="btn ${style} btn_small btn_inventory" data-test="${action}-${product.slug}" ` +
+            `id="${action}-${product.slug}" name="${action}-${product.slug}">${label}</button>`;
+    }
+
+    function toggleCart(product, user) {
+        const items = cart();
+        if (items.includes(product.id)) {
+            if (user === "problem_user" || user === "error_user") return;
+            saveCart(items.filter((id) => id !== product.id));
+        } else {
+            saveCart(items.concat([product.id]));
+        }
+    }
+
+    function renderInventory(user) {
+        const list = document.querySelector(".inventory_list");
+        const sort = document.querySelector(".product_sort_container");
+        const sorters = {
+            az: (a, b) => a.name.localeCompare(b.name),
+            za: (a, b) => b.name.localeCompare(a.name),
+            lohi: (a, b) => a.price - b.price,
+            hilo: (a, b) => b.price - a.price,
+        };
+        const products = PRODUCTS.slice().sort(sorters[sort.value]);
+        list.innerHTML = products.map((product) =>
+            '<div class="inventory_item" data-test="inventory-item">' +
+            `<div class="inventory_item_description"><div class="inventory_item_label">` +
+            `<a href="#" id="item_${product.id}_title_link"><div class="inventory_item_name" data-test="inventory-item-name">${product.name}</div></a>` +
+            `<div class="inventory_item_desc" data-test="inventory-item-desc">${product.desc}</div></div>` +
+            `<div class="pricebar"><div class="inventory_item_price" data-test="inventory-item-price">$${product.price}</div>` +
+            cartButton(product) + "</div></div></div>"
+        ).join("");
+        products.forEach((product) => {
+            list.querySelector(`[id$="-${CSS.escape(product.slug)}"]`).addEventListener("click", () => {
+                toggleCart(product, user);
+                renderInventory(user);
+            });
+        });
+    }
+
+    function renderCartItems(list) {
+        const items = PRODUCTS.filter((product) => cart().includes(product.id));
+        list.innerHTML = items.map((product) =>
+            '<div class="cart_item" data-test="inventory-item"><div class="cart_quantity">1</div>' +
+            `<div class="cart_item_label"><div class="inventory_item_name">${product.name}</div>` +
+            `<div class="inventory_item_price">$${product.price}</div></div></div>`
+        ).join("");
+        return items;
+    }
+
+    const pages = {
+        login() {
+            const form = document.getElementById("login_form");
+            const error = document.querySelector(".error-message-container");
+            const redirected = new URLSearchParams(window.location.search).get("denied");
+            if (redirected) {
+                showError(error, `Epic sadface: You can only access '${redirected}' when you are logged in.`);
+            }
+            form.addEventListener("submit", (event) => {
+                event.preventDefault();
+                const username = document.getElementById("user-name").value;
+                const password = document.getElementById("password").value;
+                if (!username) return showError(error, "Epic sadface: Username is required");
+                if (!password) return showError(error, "Epic sadface: Password is required");
+                if (!USERS.includes(username) || password !== PASSWORD) {
+                    return showError(error, "Epic sadface: Username and password do not match any user in this service");
+                }
+                if (username === "locked_out_user") {
+                    return showError(error, "Epic sadface: Sorry, this user has been locked out.");
+                }
+                const delay = username === "performance_glitch_user" ? Number(PERFORMANCE_GLITCH_DELAY_MS) : 0;
+                window.setTimeout(() => {
+                    document.cookie = `session-username=${encodeURIComponent(username)}; path=/; max-age=600`;
+                    window.location.href = "/inventory.html";
+                }, delay);
+            });
+        },
+        inventory(user) {
+            renderHeader();
+            document.querySelector(".product_sort_container").addEventListener("change", () => renderInventory(user));
+            renderInventory(user);
+        },
+        cart() {
+            renderHeader();
+            renderCartItems(document.querySelector(".cart_list"));
+            document.getElementById("continue-shopping").addEventListener("click", () => {
+                window.location.href = "/inventory.html";
+            });
+            document.getElementById("checkout").addEventListener("click", () => {
+                window.location.href = "/checkout-step-one.html";
+            });
+        },
+        "checkout-step-one"(user) {
+            renderHeader();
+            const error = document.querySelector(".error-message-container");
+            document.getElementById("cancel").addEventListener("click", () => {
+                window.location.href = "/cart.html";
+            });
+            document.getElementById("checkout_form").addEventListener("submit", (event) => {
+                event.preventDefault();
+                const lastName = user === "problem_user" ? "" : document.getElementById("last-name").value;
+                if (!document.getElementById("first-name").value) return showError(error, "Error: First Name is required");
+                if (!lastName) return showError(error, "Error: Last Name is required");
+                if (!document.getElementById("postal-code").value) return showError(error, "Error: Postal Code is required");
+                window.location.href = "/checkout-step-two.html";
+            });
+        },
+        "checkout-step-two"(user) {
+            renderHeader();
+            const items = renderCartItems(document.querySelector(".cart_list"));
+            const total = items.reduce((sum, product) => sum + product.price, 0) * 1.08;
+            document.querySelector(".summary_total_label").textContent = `Total: $${total.toFixed(2)}`;
+            document.getElementById("cancel").addEventListener("click", () => {
+                window.location.href = "/inventory.html";
+            });
+            document.getElementById("finish").addEventListener("click", () => {
+                if (user === "error_user") return;
+                saveCart([]);
+                window.location.href = "/checkout-complete.html";
+            });
+        },
+        "checkout-complete"() {
+            renderHeader();
+            document.getElementById("back-to-products").addEventListener("click", () => {
+                window.location.href = "/inventory.html";
+            });
+        },
+    };
+
+    document.addEventListener("DOMContentLoaded", () => {
+        const page = document.body.dataset.page;
+        const user = currentUser();
+        if (page !== "login" && !USERS.includes(user)) {
+            window.location.href = `/?denied=${encodeURIComponent(window.location.pathname)}`;
+            return;
+        }
+        pages[page](user);
+    });
+})();
@@ -0,0 +1,210 @@
+import asyncio
+import time
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+from utils.logger_instance import logger
+from utils.wait_engine import format_label, wait_stats
+
+
+class AsyncBasePage:
+    def __init__(self, driver, timeout=10, initial_poll=0.05, max_poll=0.5, backoff=1.5):
+        """Awaitable counterpart of BasePage, driving an AsyncWebDriver session from an asyncio event loop.
+
+        Waits poll with the same adaptive back-off as SmartWait but sleep with asyncio.sleep, so dozens
+        of sessions can wait at the same time on a single thread.
+        """
+        self.driver = driver
+        self.timeout = timeout
+        self.initial_poll = initial_poll
+        self.max_poll = max_poll
+        self.backoff = backoff
+        self.logger = logger
+
+    async def wait_until(self, condition, timeout=None, label=None, message=""):
+        """Awaits condition() until it returns a truthy value, which is returned."""
+        timeout = self.timeout if timeout is None else timeout
+        label = label or getattr(condition, "__name__", "async condition")
+        start = time.monotonic()
+        poll = self.initial_poll
+        polls = 0
+        while True:
+            polls += 1
+            try:
+                value = await condition()
+                if value:
+                    wait_stats.record(label, time.monotonic() - start, timeout, polls, False)
+                    return value
+            except (NoSuchElementException, StaleElementReferenceException):
+                pass
+            remaining = start + timeout - time.monotonic()
+            if remaining <= 0:
+                wait_stats.record(label, time.monotonic() - start, timeout, polls, True)
+                raise TimeoutException(
+                    message or f"The condition {format_label(label)} wasn't met within {timeout} seconds."
+                )
+            await asyncio.sleep(min(poll, remaining))
+            poll = min(poll * self.backoff, self.max_poll)
+
+    async def navigate_to(self, url):
+        """Navigates to the specified URL"""
+        self.logger.log_method_entry(self.navigate_to.__name__)
+        try:
+            self.logger.info("Navigating to this URL: %s", url)
+            await self.driver.get(url)
+            self.logger.info("Successfully navigated to this URL: %s", url)
+        except WebDriverException as e:
+            self.logger.error("An error occurred while trying to navigate to this URL: %s. Error: %s", url, e)
+            raise WebDriverException(f"Failed to navigate to this URL: {url}.")
+
+    async def find_element(self, locator, timeout=10):
+        self.logger.log_method_entry(self.find_element.__name__)
+
+        async def visible_element():
+            web_element = await self.driver.find_element(locator)
+            return web_element if await web_element.is_displayed() else None
+
+        try:
+            self.logger.info("Finding a WebElement that has this locator: %s", locator)
+            web_element = await self.wait_until(visible_element, timeout=timeout, label=("find_element", locator))
+            self.logger.info("Successfully found the WebElement that has this locator: %s", locator)
+            return web_element
+        except TimeoutException as e:
+            self.logger.error(
+                "Timeout occurred while trying to find the WebElement that has this locator: %s "
+                "within %s seconds. Error: %s",
+                locator, timeout, e
+            )
+            raise TimeoutException(
+                f"The WebElement that has this locator: {locator} wasn't found or wasn't visible "
+                f"within {timeout} seconds."
+            )
+        except WebDriverException as e:
+            self.logger.error(
+                "An error occurred while trying to find the WebElement that has this locator: %s. Error: %s",
+                locator, e
+            )
+            raise WebDriverException(f"Unable to find the WebElement that has this locator: {locator}.")
+
+    async def find_elements(self, locator, timeout=10):
+        self.logger.log_method_entry(self.find_elements.__name__)
+
+        async def visible_elements():
+            web_elements = await self.driver.find_elements(locator)
+            visibility = await asyncio.gather(*(web_element.is_displayed() for web_element in web_elements))
+            return web_elements if web_elements and all(visibility) else None
+
+        try:
+            self.logger.info("Finding WebElements that have this locator: %s", locator)
+            web_elements = await self.wait_until(visible_elements, timeout=timeout, label=("find_elements", locator))
+            self.logger.info("Successfully found the WebElements that have this locator: %s", locator)
+            return web_elements
+        except TimeoutException as e:
+            self.logger.error(
+                "Timeout occurred while trying to find WebElements that have this locator: %s "
+                "within %s seconds. Error: %s.",
+                locator, timeout, e
+            )
+            raise TimeoutException(
+                f"No WebElements that have this locator: {locator} were found or weren't visible "
+                f"within {timeout} seconds."
+            )
+
+    async def click(self, locator, timeout=10):
+        """Clicks on a WebElement once it is visible and enabled."""
+        self.logger.log_method_entry(self.click.__name__)
+
+        async def clickable_element():
+            web_element = await self.driver.find_element(locator)
+            return web_element if await web_element.is_displayed() and await web_element.is_enabled() else None
+
+        try:
+            self.logger.info("Clicking on a WebElement that has this locator: %s", locator)
+            web_element = await self.wait_until(clickable_element, timeout=timeout, label=("clickable", locator))
+            await web_element.click()
+            self.logger.info("Successfully clicked on a WebElement that has this locator: %s", locator)
+        except TimeoutException as e:
+            self.logger.error(
+                "Timeout occurred while trying to click on a WebElement that has this locator: %s "
+                "within %s seconds. Error: %s",
+                locator, timeout, e
+            )
+            raise TimeoutException(
+                f"No WebElement that has this locator: {locator} was found or wasn't clickable "
+                f"within {timeout} seconds."
+            )
+        except WebDriverException as e:
+            self.logger.error(
+                "An unexpected WebDriver error occurred while trying to click on locator: %s. Error: %s", locator, e
+            )
+            raise WebDriverException(f"Unable to click on the WebElement with locator: {locator}.")
+
+    async def send_keys(self, locator, text, timeout=10):
+        """Enters text into a WebElement. Raises TimeoutException if it doesn't become visible in time."""
+        self.logger.log_method_entry(self.send_keys.__name__)
+        try:
+            self.logger.info("Sending this text: %s into a WebElement that has this locator: %s", text, locator)
+            web_element = await self.find_element(locator, timeout)
+            await web_element.clear()
+            await web_element.send_keys(text)
+            self.logger.info(
+                "Successfully sent the text: %s into a WebElement that has this locator: %s.", text, locator
+            )
+        except TimeoutException:
+            raise
+        except WebDriverException as e:
+            self.logger.error(
+                "An error occurred while trying to send this text: %s into a WebElement that has "
+                "this locator: %s. Error: %s",
+                text, locator, e
+            )
+            raise WebDriverException(
+                f"Unable to send this text: {text} into a WebElement that has this locator: {locator}."
+            )
+
+    async def get_text(self, locator, timeout=10):
+        self.logger.log_method_entry(self.get_text.__name__)
+        web_element = await self.find_element(locator, timeout)
+        if (await web_element.tag_name()).lower() in ("input", "textarea"):
+            text = await web_element.get_property("value")
+        else:
+            text = (await web_element.text()).strip()
+        self.logger.info("Successfully got text: %s", text)
+        return text
+
+    async def wait_for_element_disappear(self, locator, timeout=10):
+        """Waits until the element specified by the locator is gone or invisible."""
+        self.logger.log_method_entry(self.wait_for_element_disappear.__name__)
+
+        async def invisible():
+            try:
+                return not await (await self.driver.find_element(locator)).is_displayed()
+            except (NoSuchElementException, StaleElementReferenceException):
+                return True
+
+        await self.wait_until(invisible, timeout=timeout, label=("disappear", locator))
+
+    async def wait_for_url_contains(self, fragment, timeout=None):
+        """Waits until the current URL contains the given fragment."""
+
+        async def url_contains():
+            return fragment in await self.driver.current_url()
+
+        await self.wait_until(url_contains, timeout=timeout, label=("url_contains", fragment))
+
+    async def get_current_url(self):
+        """Returns the current URL of the browser."""
+        return await self.driver.current_url()
+
+    async def get_title(self):
+        """Returns the title of the current page."""
+        return await self.driver.title()
+
+    async def quit(self):
+        """Ends the WebDriver session."""
+        self.logger.log_method_entry(self.quit.__name__)
+        await self.driver.quit()
@@ -1,4 +1,7 @@
-from selenium.webdriver.support.ui import WebDriverWait, Select
+import functools
+import time
+
+from selenium.webdriver.support.ui import Select
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
@@ -13,44 +16,99 @@ from selenium.common.exceptions import (
     NoSuchFrameException,
     NoSuchWindowException,
 )
+from utils.element_cache import ElementCache
+from utils.impact_analysis import impact_recorder, track_page_methods
+from utils.dom_scripts import (
+    BULK_READ_SCRIPT,
+    DOM_SNAPSHOT_SCRIPT,
+    SELECT_OPTIONS_SCRIPT,
+    VISIBLE_ELEMENT_CONDITION,
+    to_js_query,
+)
+from utils.dom_snapshot import DomSnapshot
 from utils.logger_instance import logger
+from utils.page_model import Locator, compile_page_model
+from utils.profiler import profiled
+from utils.recovery_engine import RECOVERABLE_EXCEPTIONS, recovery_engine
+from utils.wait_engine import SmartWait
 
 
 class BasePage:
-    IS_LOADING_OVERLAY = (By.ID, "loading")
-    DATE_PICKER = (By.ID, "ui-datepicker-div")
-    MONTH_SELECTOR = (By.XPATH, "//div[@id='ui-datepicker-div']//select[@class='ui-datepicker-month']")
-    YEAR_SELECTOR = (By.XPATH, "//div[@id='ui-datepicker-div']//select[@class='ui-datepicker-year']")
+    IS_LOADING_OVERLAY = Locator(By.ID, "loading")
+    DATE_PICKER = Locator(By.ID, "ui-datepicker-div")
+    MONTH_SELECTOR = Locator(By.XPATH, "//div[@id='ui-datepicker-div']//select[@class='ui-datepicker-month']")
+    YEAR_SELECTOR = Locator(By.XPATH, "//div[@id='ui-datepicker-div']//select[@class='ui-datepicker-year']")
+    cache_elements = False
+
+    def __init_subclass__(cls, **kwargs):
+        """Compiles the locators of every page class into a read-only table, validates its methods and makes
+        them record the tests that use them."""
+        super().__init_subclass__(**kwargs)
+        compile_page_model(cls)
+        track_page_methods(cls)
 
-    def __init__(self, driver, timeout=10):
+    def __init__(self, driver, timeout=10, cache_elements=None):
         self.driver = driver
         self.timeout = timeout
         self.logger = logger
-        self.wait = WebDriverWait(driver, timeout)
-        self.action = ActionChains(driver)
+        self.wait = SmartWait(driver, timeout)
+        if cache_elements is None:
+            cache_elements = self.cache_elements
+        self.element_cache = ElementCache(driver) if cache_elements else None
+        if impact_recorder.enabled:
+            impact_recorder.record(self)
+
+    @functools.cached_property
+    def action(self):
+        """ActionChains for this page, only built by the pages that use it."""
+        return ActionChains(self.driver)
+
+    def _cached_element(self, locator, clickable=False):
+        if self.element_cache is None:
+            return None
+        return self.element_cache.get(locator, clickable=clickable)
 
+    def _cache_element(self, locator, web_element):
+        if self.element_cache is not None:
+            self.element_cache.put(locator, web_element)
+        return web_element
+
+    def invalidate_element_cache(self, locator=None):
+        """Drops cached WebElements, for example after the page changed in a way BasePage can't see."""
+        if self.element_cache is not None:
+            self.element_cache.invalidate(locator)
+
+    @profiled
     def navigate_to(self, url):
         """Navigates to the specified URL"""
         self.logger.log_method_entry(self.navigate_to.__name__)
         try:
-            self.logger.info(f"Navigating to this URL: {url}")
+            self.logger.info("Navigating to this URL: %s", url)
             self.driver.get(url)
-            self.logger.info(f"Successfully navigated to this URL: {url}")
+            self.invalidate_element_cache()
+            self.logger.info("Successfully navigated to this URL: %s", url)
         except WebDriverException as e:
-            self.logger.error(f"An error occurred while trying to navigate to this URL: {url}. Error: {e}")
+            self.logger.error("An error occurred while trying to navigate to this URL: %s. Error: %s", url, e)
             raise WebDriverException(f"Failed to navigate to this URL: {url}.")
 
+    @profiled
     def find_element(self, locator, timeout=10):
         self.logger.log_method_entry(self.find_element.__name__)
         try:
-            self.logger.info(f"Finding a WebElement that has this locator: {locator}")
-            web_element = WebDriverWait(self.driver, timeout).until(EC.visibility_of_element_located(locator))
-            self.logger.info(f"Successfully found the WebElement that has this locator: {locator}")
+            self.logger.info("Finding a WebElement that has this locator: %s", locator)
+            web_element = self._cached_element(locator) or self._cache_element(
+                locator,
+                self.wait.until(
+                    EC.visibility_of_element_located(locator), timeout=timeout, label=("find_element", locator)
+                ),
+            )
+            self.logger.info("Successfully found the WebElement that has this locator: %s", locator)
             return web_element
         except TimeoutException as e:
             self.logger.error(
-                f"Timeout occurred while trying to find the WebElement that has this locator: {locator} "
-                f"within {timeout} seconds. Error: {e}"
+                "Timeout occurred while trying to find the WebElement that has this locator: %s "
+                "within %s seconds. Error: %s",
+                locator, timeout, e
             )
             raise TimeoutException(
                 f"The WebElement that has this locator: {locator} wasn't found or wasn't visible "
@@ -58,34 +116,40 @@ class BasePage:
             )
         except NoSuchElementException as e:
             self.logger.error(
-                f"The WebElement that has this locator: {locator} couldn't be found in the DOM. Error: {e}"
+                "The WebElement that has this locator: %s couldn't be found in the DOM. Error: %s", locator, e
             )
             raise NoSuchElementException(f"No such a WebElement that has this locator: {locator} in the DOM.")
         except ElementNotInteractableException as e:
             self.logger.error(
-                f"The WebElement that has this locator: {locator} was present in the DOM, but wasn't "
-                f"interactable. Error: {e}"
+                "The WebElement that has this locator: %s was present in the DOM, but wasn't "
+                "interactable. Error: %s",
+                locator, e
             )
             raise ElementNotInteractableException(
                 f"The WebElement that has this locator: {locator} wasn't interactable. Error: {e}"
             )
         except WebDriverException as e:
             self.logger.error(
-                f"An error occurred while trying to find the WebElement that has this locator: {locator}. Error: {e}"
+                "An error occurred while trying to find the WebElement that has this locator: %s. Error: %s",
+                locator, e
             )
             raise WebDriverException(f"Unable to find the WebElement that has this locator: {locator}.")
 
+    @profiled
     def find_elements(self, locator, timeout=10):
         self.logger.log_method_entry(self.find_elements.__name__)
         try:
-            self.logger.info(f"Finding WebElements that have this locator: {locator}")
-            web_elements = WebDriverWait(self.driver, timeout).until(EC.visibility_of_all_elements_located(locator))
-            self.logger.info(f"Successfully found the WebElements that have this locator: {locator}")
+            self.logger.info("Finding WebElements that have this locator: %s", locator)
+            web_elements = self.wait.until(
+                EC.visibility_of_all_elements_located(locator), timeout=timeout, label=("find_elements", locator)
+            )
+            self.logger.info("Successfully found the WebElements that have this locator: %s", locator)
             return web_elements
         except TimeoutException as e:
             self.logger.error(
-                f"Timeout occurred while trying to find WebElements that have this locator: {locator} "
-                f"within {timeout} seconds. Error: {e}."
+                "Timeout occurred while trying to find WebElements that have this locator: %s "
+                "within %s seconds. Error: %s.",
+                locator, timeout, e
             )
             raise TimeoutException(
                 f"No WebElements that have this locator: {locator} were found or weren't visible "
@@ -93,27 +157,118 @@ class BasePage:
             )
         except NoSuchElementException as e:
             self.logger.error(
-                f"The WebElements that have this locator: {locator} couldn't be found in the DOM. Error: {e}"
+                "The WebElements that have this locator: %s couldn't be found in the DOM. Error: %s", locator, e
             )
             raise NoSuchElementException(f"No such WebElements that have this locator: {locator} found in the DOM.")
         except ElementNotInteractableException as e:
             self.logger.error(
-                f"The WebElements that have this locator: {locator} were present in the DOM, but weren't"
-                f" interactable. Error: {e}"
+                "The WebElements that have this locator: %s were present in the DOM, but weren't"
+                " interactable. Error: %s",
+                locator, e
             )
             raise ElementNotInteractableException(
                 f"The WebElements that have this locator: {locator} weren't interactable."
             )
         except WebDriverException as e:
             self.logger.error(
-                f"An error occurred while trying to find the WebElements that have this locator: {locator}. Error: {e}"
+                "An error occurred while trying to find the WebElements that have this locator: %s. Error: %s",
+                locator, e
             )
             raise WebDriverException(f"Unable to find the WebElements that have this locator: {locator}.")
 
+    @profiled
+    def wait_for_element_in_page(self, locator, timeout=10):
+        """Waits inside the page for a visible WebElement, resolving on DOM mutations instead of polling."""
+        self.logger.log_method_entry(self.wait_for_element_in_page.__name__)
+        try:
+            self.logger.info("Waiting inside the page for a WebElement that has this locator: %s", locator)
+            web_element = self.wait.until_dom(
+                VISIBLE_ELEMENT_CONDITION, *to_js_query(locator), timeout=timeout, label=("in_page", locator)
+            )
+            self.logger.info("Successfully found the WebElement that has this locator: %s", locator)
+            return web_element
+        except TimeoutException as e:
+            self.logger.error(
+                "Timeout occurred while waiting inside the page for the WebElement that has this locator: %s "
+                "within %s seconds. Error: %s",
+                locator, timeout, e
+            )
+            raise TimeoutException(
+                f"The WebElement that has this locator: {locator} wasn't visible within {timeout} seconds."
+            )
+
+    @profiled
+    def get_elements_data(self, locator, attributes=(), fields=None, timeout=10, all_visible=False):
+        """Reads every WebElement that has this locator in a single JavaScript round-trip.
+
+        Returns a list of dictionaries with the "text", "visible", "rect" (x, y, width, height), the requested
+        "attributes" and the text of the child "fields" (a mapping of name to child locator, resolved from the
+        element) of each element. Waits until at least one element is present, or with all_visible until every
+        one of them is visible, like visibility_of_all_elements_located.
+        """
+        self.logger.log_method_entry(self.get_elements_data.__name__)
+        try:
+            self.logger.info("Reading all WebElements that have this locator in one round-trip: %s", locator)
+            kind, query = to_js_query(locator)
+            js_fields = {name: to_js_query(child, relative=True) for name, child in (fields or {}).items()}
+
+            def read_elements(driver):
+                elements = driver.execute_script(BULK_READ_SCRIPT, kind, query, list(attributes), js_fields)
+                if all_visible and not all(data["visible"] for data in elements):
+                    return None
+                return elements
+
+            elements_data = self.wait.until(
+                read_elements,
+                timeout=timeout,
+                label=("get_elements_data", locator),
+            )
+            self.logger.info("Successfully read %s WebElements that have this locator: %s", len(elements_data), locator)
+            return elements_data
+        except TimeoutException as e:
+            self.logger.error(
+                "Timeout occurred while trying to read WebElements that have this locator: %s "
+                "within %s seconds. Error: %s",
+                locator, timeout, e
+            )
+            raise TimeoutException(
+                f"No WebElements that have this locator: {locator} were found within {timeout} seconds."
+            )
+        except WebDriverException as e:
+            self.logger.error(
+                "An error occurred while trying to read the WebElements that have this locator: %s. Error: %s",
+                locator, e
+            )
+            raise WebDriverException(f"Unable to read the WebElements that have this locator: {locator}.")
+
+    @profiled
+    def get_all_texts(self, locator, visible_only=True, timeout=10):
+        """Returns the text of every WebElement that has this locator, read in a single round-trip."""
+        self.logger.log_method_entry(self.get_all_texts.__name__)
+        elements_data = self.get_elements_data(locator, timeout=timeout)
+        return [data["text"] for data in elements_data if data["visible"] or not visible_only]
+
+    @profiled
+    def take_dom_snapshot(self):
+        """Captures the DOM, the computed visibility and the form values of the page in a single round-trip.
+
+        The returned DomSnapshot answers several assertions locally instead of one wait and round-trip each.
+        """
+        self.logger.log_method_entry(self.take_dom_snapshot.__name__)
+        try:
+            self.logger.info("Taking a DOM snapshot of the current page")
+            snapshot = DomSnapshot(self.driver.execute_script(DOM_SNAPSHOT_SCRIPT))
+            self.logger.info("Successfully took a DOM snapshot of %s", snapshot.url)
+            return snapshot
+        except WebDriverException as e:
+            self.logger.error("An error occurred while trying to take a DOM snapshot of the current page. Error: %s", e)
+            raise WebDriverException("Unable to take a DOM snapshot of the current page.")
+
+    @profiled
     def get_text(self, locator, timeout=10):
         self.logger.log_method_entry(self.get_text.__name__)
         try:
-            self.logger.info(f"Getting text from element with locator: {locator}")
+            self.logger.info("Getting text from element with locator: %s", locator)
             element = self.find_element(locator, timeout)
 
             tag_name = element.tag_name.lower()
@@ -131,49 +286,56 @@ class BasePage:
                             )
 
             text = element.text.strip()
-            self.logger.info(f"Successfully got text: {text}")
+            self.logger.info("Successfully got text: %s", text)
             return text
         except (TimeoutException, NoSuchElementException, ElementNotInteractableException, WebDriverException) as e:
-            self.logger.error(f"An error occurred while getting text from element with locator: {locator}. Error: {e}")
+            self.logger.error(
+                "An error occurred while getting text from element with locator: %s. Error: %s", locator, e
+            )
             raise
 
+    @profiled
     def wait_for_element_disappear(self, locator, timeout=10):
         """Waits until the element specified by the locator disappears (becomes invisible)."""
         self.logger.log_method_entry(self.wait_for_element_disappear.__name__)
         try:
-            self.logger.info(f"Waiting for element to disappear: {locator}")
-            WebDriverWait(self.driver, timeout).until(EC.invisibility_of_element_located(locator))
-            self.logger.info(f"Element disappeared: {locator}")
+            self.logger.info("Waiting for element to disappear: %s", locator)
+            self.wait.until(
+                EC.invisibility_of_element_located(locator), timeout=timeout, label=("disappear", locator)
+            )
+            self.logger.info("Element disappeared: %s", locator)
         except TimeoutException as e:
             self.logger.error(
-                f"Timeout occurred while waiting for element to disappear: {locator} within {timeout} seconds. Error: {e}"
+                "Timeout occurred while waiting for element to disappear: %s within %s seconds. Error: %s",
+                locator, timeout, e
             )
             raise TimeoutException(f"Element with locator {locator} did not disappear within {timeout} seconds.")
         except WebDriverException as e:
-            self.logger.error(f"An error occurred while waiting for element to disappear: {locator}. Error: {e}")
+            self.logger.error("An error occurred while waiting for element to disappear: %s. Error: %s", locator, e)
             raise WebDriverException(f"Unable to wait for element to disappear: {locator}.")
 
+    @profiled
     def is_invisible(self, locator, timeout=10):
         """Returns True if the element is not visible (either not in DOM or not displayed)."""
         self.logger.log_method_entry(self.is_invisible.__name__)
         try:
-            self.logger.info(f"Checking if element is invisible: {locator}")
+            self.logger.info("Checking if element is invisible: %s", locator)
             element = self.find_element(locator, timeout)
             invisible = not element.is_displayed()
-            self.logger.info(f"Element visibility: {not invisible}")
+            self.logger.info("Element visibility: %s", not invisible)
             return invisible
         except (NoSuchElementException, TimeoutException):
-            self.logger.info(f"Element is not present or timed out: {locator}. Considering it invisible.")
+            self.logger.info("Element is not present or timed out: %s. Considering it invisible.", locator)
             return True
         except (ElementNotInteractableException, WebDriverException) as e:
-            self.logger.error(f"Unexpected error while checking visibility of element {locator}: {e}")
+            self.logger.error("Unexpected error while checking visibility of element %s: %s", locator, e)
             return False
 
     def select_date(self, locator, date):
         """Selects a date from a date picker widget."""
         self.logger.log_method_entry(self.select_date.__name__)
         try:
-            self.logger.info(f"Selecting date {date}")
+            self.logger.info("Selecting date %s", date)
             year, month, day = date.split("-")
 
             self.click(locator)
@@ -184,19 +346,20 @@ class BasePage:
             self.select_dropdown_by_visible_text(self.YEAR_SELECTOR, year)
             self.select_dropdown_by_visible_text(self.MONTH_SELECTOR, month)
             self.click((By.XPATH, f"(//div[@id='ui-datepicker-div']/table//td[@onclick]/a)[{day}]"))
-            self.logger.info(f"Successfully selected date {date}")
+            self.logger.info("Successfully selected date %s", date)
         except (
             TimeoutException,
             NoSuchElementException,
             ElementNotInteractableException,
             WebDriverException,
         ) as e:
-            self.logger.error(f"An error occurred while selecting date {date}. Error: {e}")
+            self.logger.error("An error occurred while selecting date %s. Error: %s", date, e)
             raise
         except Exception as e:
-            self.logger.error(f"Unexpected error while selecting date {date}: {e}")
+            self.logger.error("Unexpected error while selecting date %s: %s", date, e)
             raise
 
+    @profiled
     def wait_for_page_load(self):
         self.logger.log_method_entry(self.wait_for_page_load.__name__)
         try:
@@ -204,65 +367,70 @@ class BasePage:
             self.wait_for_element_disappear(self.IS_LOADING_OVERLAY)
             self.logger.info("Loading overlay disappeared.")
         except TimeoutException as e:
-            self.logger.warning(f"Loading overlay did not disappear within the expected time. Error: {e}")
+            self.logger.warning("Loading overlay did not disappear within the expected time. Error: %s", e)
         except WebDriverException as e:
-            self.logger.error(f"WebDriver error while waiting for loading overlay to disappear. Error: {e}")
+            self.logger.error("WebDriver error while waiting for loading overlay to disappear. Error: %s", e)
             raise
 
+    @profiled
     def wait_for_url_to_be(self, expected_url, timeout=None):
         """Waits until the current URL is equal to the expected URL."""
         timeout = timeout or self.timeout
         try:
-            self.logger.info(f"Waiting for the URL to be: {expected_url}")
-            WebDriverWait(self.driver, timeout).until(EC.url_to_be(expected_url))
-            self.logger.info(f"Successfully reached the expected URL: {expected_url}")
+            self.logger.info("Waiting for the URL to be: %s", expected_url)
+            self.wait.until(EC.url_to_be(expected_url), timeout=timeout, label=("url_to_be", expected_url))
+            self.logger.info("Successfully reached the expected URL: %s", expected_url)
         except TimeoutException:
-            self.logger.error(f"Timeout exceeded! Expected URL '{expected_url}' but got '{self.driver.current_url}'")
+            self.logger.error(
+                "Timeout exceeded! Expected URL '%s' but got '%s'", expected_url, self.driver.current_url
+            )
             raise AssertionError(
                 f"Expected URL to be '{expected_url}', but got '{self.driver.current_url}' after {timeout} seconds."
             )
         except Exception as e:
-            self.logger.error(f"An error occurred while waiting for the URL: {str(e)}")
+            self.logger.error("An error occurred while waiting for the URL: %s", str(e))
             raise
 
+    @profiled
     def get_message(self, locator):
         """Returns the text of the element if visible, False if not visible, and asserts if not present."""
         self.logger.log_method_entry(self.get_message.__name__)
         try:
-            self.logger.info(f"Getting message from element with locator: {locator}")
+            self.logger.info("Getting message from element with locator: %s", locator)
             element = self.find_element(locator)
             if element.is_displayed():
                 text = element.text.strip()
-                self.logger.info(f"Successfully got message: {text}")
+                self.logger.info("Successfully got message: %s", text)
                 return text
             else:
-                self.logger.warning(f"Element with locator {locator} is not visible.")
+                self.logger.warning("Element with locator %s is not visible.", locator)
                 return False
         except (TimeoutException, NoSuchElementException):
-            self.logger.error(f"Element with locator {locator} not found or not visible.")
+            self.logger.error("Element with locator %s not found or not visible.", locator)
             assert False, f"Element with locator {locator} is not displayed."
         except Exception as e:
-            self.logger.error(f"Error while getting message: {e}")
+            self.logger.error("Error while getting message: %s", e)
             raise
 
+    @profiled
     def get_validation_msg(self, locator):
         """Returns the validation message for a field if present, False if not present."""
         self.logger.log_method_entry(self.get_validation_msg.__name__)
         try:
-            self.logger.info(f"Getting validation message from element with locator: {locator}")
+            self.logger.info("Getting validation message from element with locator: %s", locator)
             element = self.find_element(locator)
             if element.is_displayed():
                 text = element.text.strip()
-                self.logger.info(f"Successfully got validation message: {text}")
+                self.logger.info("Successfully got validation message: %s", text)
                 return text
             else:
-                self.logger.warning(f"Element with locator {locator} is not visible.")
+                self.logger.warning("Element with locator %s is not visible.", locator)
                 return False
         except (TimeoutException, NoSuchElementException):
-            self.logger.error(f"Element with locator {locator} not found or not visible.")
+            self.logger.error("Element with locator %s not found or not visible.", locator)
             assert False, f"Element with locator {locator} is not displayed."
         except Exception as e:
-            self.logger.error(f"Error while getting validation message: {e}")
+            self.logger.error("Error while getting validation message: %s", e)
             raise
 
     def get_notification_error_msg(self):
@@ -279,10 +447,10 @@ class BasePage:
         try:
             self.logger.info("Getting the current URL")
             current_url = self.driver.current_url
-            self.logger.info(f"Successfully got the current URL: {current_url}")
+            self.logger.info("Successfully got the current URL: %s", current_url)
             return current_url
         except WebDriverException as e:
-            self.logger.error(f"An error occurred while trying to get the current URL. Error: {e}")
+            self.logger.error("An error occurred while trying to get the current URL. Error: %s", e)
             raise WebDriverException("Unable to get the current URL.")
 
     def go_back(self):
@@ -291,9 +459,10 @@ class BasePage:
         try:
             self.logger.info("Navigating back to the previous page")
             self.driver.back()
+            self.invalidate_element_cache()
             self.logger.info("Successfully navigated back to the previous page")
         except WebDriverException as e:
-            self.logger.error(f"An error occurred while trying to navigate to the previous page. Error: {e}")
+            self.logger.error("An error occurred while trying to navigate to the previous page. Error: %s", e)
             raise WebDriverException("Unable to navigate to the previous page.")
 
     def go_forward(self):
@@ -302,9 +471,10 @@ class BasePage:
         try:
             self.logger.info("Navigating forward to the next page")
             self.driver.forward()
+            self.invalidate_element_cache()
             self.logger.info("Successfully navigated forward to the next page")
         except WebDriverException as e:
-            self.logger.error(f"An error occurred while trying to navigate to the next page. Error: {e}")
+            self.logger.error("An error occurred while trying to navigate to the next page. Error: %s", e)
             raise WebDriverException("Unable to navigate to the next page")
 
     def refresh(self):
@@ -313,9 +483,10 @@ class BasePage:
         try:
             self.logger.info("Refreshing the current page")
             self.driver.refresh()
+            self.invalidate_element_cache()
             self.logger.info("Successfully refreshed the current page")
         except WebDriverException as e:
-            self.logger.error(f"An error occurred while trying to refresh the current page. Error: {e}")
+            self.logger.error("An error occurred while trying to refresh the current page. Error: %s", e)
             raise WebDriverException("Unable to refresh the current page.")
 
     def get_title(self):
@@ -324,48 +495,82 @@ class BasePage:
         try:
             self.logger.info("Getting the title of the current page")
             title = self.driver.title
-            self.logger.info(f"Successfully got the title of the current page. The title is: {title}")
+            self.logger.info("Successfully got the title of the current page. The title is: %s", title)
             return title
         except WebDriverException as e:
-            self.logger.error(f"An error occurred while trying to get the title of the current page. Error: {e}")
+            self.logger.error("An error occurred while trying to get the title of the current page. Error: %s", e)
             raise WebDriverException("Unable to get the title of the current page.")
 
+    @profiled
     def force_click(self, locator, timeout=10):
-        """Forcefully clicks on a WebElement using ActionChains, bypassing some standard interactability restrictions."""
+        """Forcefully clicks on a WebElement using ActionChains, bypassing some standard interactability restrictions.
+
+        If the ActionChains click fails too, the recovery engine gets the rest of the timeout to click it.
+        """
         self.logger.log_method_entry(self.force_click.__name__)
+        deadline = time.monotonic() + timeout
         try:
-            self.logger.info(f"Force-clicking using ActionChains on a WebElement with locator: {locator}")
-            element = self.wait.until(EC.presence_of_element_located(locator))
-
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-
-            self.action.move_to_element(element).click().perform()
+            self.logger.info("Force-clicking using ActionChains on a WebElement with locator: %s", locator)
+            element = self.wait.until(
+                EC.presence_of_element_located(locator), timeout=timeout, label=("presence", locator)
+            )
+            try:
+                self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+                self.action.move_to_element(element).click().perform()
+            except RECOVERABLE_EXCEPTIONS as e:
+                recovery_engine.recover(self, locator, "click", deadline, e)
 
-            self.logger.info(f"Successfully force-clicked using ActionChains on the WebElement with locator: {locator}")
+            self.logger.info(
+                "Successfully force-clicked using ActionChains on the WebElement with locator: %s", locator
+            )
+        except TimeoutException as e:
+            self.logger.error(
+                "The WebElement with locator: %s wasn't present within %s seconds. Error: %s", locator, timeout, e
+            )
+            raise TimeoutException(f"No WebElement with locator: {locator} was present within {timeout} seconds.")
         except NoSuchElementException as e:
-            self.logger.error(f"The WebElement with locator: {locator} couldn't be found in the DOM. Error: {e}")
+            self.logger.error("The WebElement with locator: %s couldn't be found in the DOM. Error: %s", locator, e)
             raise NoSuchElementException(f"No WebElement with locator: {locator} found in the DOM.")
         except ElementNotInteractableException as e:
-            self.logger.error(f"The WebElement with locator: {locator} was present but not interactable. Error: {e}")
+            self.logger.error(
+                "The WebElement with locator: %s was present but not interactable. Error: %s", locator, e
+            )
             raise ElementNotInteractableException(f"The WebElement with locator: {locator} wasn't interactable.")
         except WebDriverException as e:
             self.logger.error(
-                f"WebDriver error occurred during force-click using ActionChains for locator: {locator}. Error: {e}"
+                "WebDriver error occurred during force-click using ActionChains for locator: %s. Error: %s",
+                locator, e
             )
             raise WebDriverException(f"ActionChains force-click failed for locator: {locator}.")
 
+    @profiled
     def click(self, locator, timeout=10, retry_on_intercept=True):
-        """Clicks on a WebElement, retrying if intercepted by another element."""
+        """Clicks on a WebElement, recovering from interceptions within the same timeout.
+
+        The timeout is the budget of the whole action: when the click is intercepted or the element isn't
+        interactable, the recovery engine only gets the time that is left.
+        """
         self.logger.log_method_entry(self.click.__name__)
+        deadline = time.monotonic() + timeout
         try:
-            self.logger.info(f"Clicking on a WebElement that has this locator: {locator}")
-            web_element = WebDriverWait(self.driver, timeout).until(EC.element_to_be_clickable(locator))
-            web_element.click()
-            self.logger.info(f"Successfully clicked on a WebElement that has this locator: {locator}")
+            self.logger.info("Clicking on a WebElement that has this locator: %s", locator)
+            web_element = self._cached_element(locator, clickable=True) or self._cache_element(
+                locator,
+                self.wait.until(EC.element_to_be_clickable(locator), timeout=timeout, label=("clickable", locator)),
+            )
+            try:
+                web_element.click()
+            except RECOVERABLE_EXCEPTIONS as e:
+                if not retry_on_intercept:
+                    raise
+                self.invalidate_element_cache(locator)
+                recovery_engine.recover(self, locator, "click", deadline, e)
+            self.logger.info("Successfully clicked on a WebElement that has this locator: %s", locator)
         except TimeoutException as e:
             self.logger.error(
-                f"Timeout occurred while trying to click on a WebElement that has this locator: {locator} "
-                f"within {timeout} seconds. Error: {e}"
+                "Timeout occurred while trying to click on a WebElement that has this locator: %s "
+                "within %s seconds. Error: %s",
+                locator, timeout, e
             )
             raise TimeoutException(
                 f"No WebElement that has this locator: {locator} was found or wasn't clickable "
@@ -373,66 +578,65 @@ class BasePage:
             )
         except NoSuchElementException as e:
             self.logger.error(
-                f"The WebElement that has this locator: {locator} couldn't be found in the DOM. Error: {e}"
+                "The WebElement that has this locator: %s couldn't be found in the DOM. Error: %s", locator, e
             )
             raise NoSuchElementException(f"No such WebElement with this locator: {locator} found in the DOM.")
         except ElementNotInteractableException as e:
             self.logger.error(
-                f"The WebElement that has this locator: {locator} was present but wasn't interactable. Error: {e}"
+                "The WebElement that has this locator: %s was present but wasn't interactable. Error: %s", locator, e
             )
             raise ElementNotInteractableException(f"The WebElement with locator: {locator} wasn't interactable.")
         except ElementClickInterceptedException as e:
-            self.logger.warning(f"Click was intercepted for the WebElement with locator: {locator}. Error: {e}")
+            self.logger.error("Click was intercepted for the WebElement with locator: %s. Error: %s", locator, e)
             if retry_on_intercept:
-                try:
-                    self.logger.info("Retrying click after scrolling the element into view.")
-                    web_element = WebDriverWait(self.driver, timeout).until(EC.presence_of_element_located(locator))
-                    self.driver.execute_script("arguments[0].scrollIntoView(true);", web_element)
-                    WebDriverWait(self.driver, timeout).until(EC.element_to_be_clickable(locator)).click()
-                    self.logger.info("Click successful on retry after intercept.")
-                except Exception as retry_exception:
-                    self.logger.error(
-                        f"Retry failed for clicking WebElement with locator: {locator}. Error: {retry_exception}"
-                    )
-                    raise ElementClickInterceptedException(
-                        f"The WebElement with locator: {locator} couldn't be clicked even after retry."
-                    )
-            else:
                 raise ElementClickInterceptedException(
-                    f"The WebElement with locator: {locator} couldn't be clicked due to interception."
+                    f"The WebElement with locator: {locator} couldn't be clicked even after recovery."
                 )
+            raise ElementClickInterceptedException(
+                f"The WebElement with locator: {locator} couldn't be clicked due to interception."
+            )
         except WebDriverException as e:
             self.logger.error(
-                f"An unexpected WebDriver error occurred while trying to click on locator: {locator}. Error: {e}"
+                "An unexpected WebDriver error occurred while trying to click on locator: %s. Error: %s", locator, e
             )
             raise WebDriverException(f"Unable to click on the WebElement with locator: {locator}.")
 
-    def send_keys(self, locator, text):
-        """Enters text into a WebElement."""
+    @profiled
+    def send_keys(self, locator, text, timeout=10):
+        """Enters text into a WebElement, recovering from non-interactable fields within the same timeout."""
         self.logger.log_method_entry(self.send_keys.__name__)
+        deadline = time.monotonic() + timeout
         try:
-            self.logger.info(f"Sending this text: {text} into a WebElement that has this locator: {locator}")
-            web_element = self.find_element(locator)
-            web_element.clear()
-            web_element.send_keys(text)
-            self.logger.info(f"Successfully sent the text: {text} into a WebElement that has this locator: {locator}.")
+            self.logger.info("Sending this text: %s into a WebElement that has this locator: %s", text, locator)
+            web_element = self.find_element(locator, timeout)
+            try:
+                web_element.clear()
+                web_element.send_keys(text)
+            except RECOVERABLE_EXCEPTIONS as e:
+                self.invalidate_element_cache(locator)
+                recovery_engine.recover(self, locator, "send_keys", deadline, e, text=text)
+            self.logger.info(
+                "Successfully sent the text: %s into a WebElement that has this locator: %s.", text, locator
+            )
         except NoSuchElementException as e:
             self.logger.error(
-                f"The WebElement that has this locator: {locator} couldn't be found in the DOM. Error: {e}"
+                "The WebElement that has this locator: %s couldn't be found in the DOM. Error: %s", locator, e
             )
             raise NoSuchElementException(f"No such a WebElement that has this locator: {locator} found in the DOM.")
         except ElementNotInteractableException as e:
             self.logger.error(
-                f"The WebElement that has this locator: {locator} was present in the DOM but wasn't "
-                f"interactable. Error: {e}"
+                "The WebElement that has this locator: %s was present in the DOM but wasn't "
+                "interactable. Error: %s",
+                locator, e
             )
             raise ElementNotInteractableException(
                 f"The WebElement that has this locator: {locator} wasn't interactable."
             )
         except WebDriverException as e:
             self.logger.error(
-                f"An error occurred while trying to send this text: {text} into a WebElement that has "
-                f"this locator: {locator}. Error: {e}"
+                "An error occurred while trying to send this text: %s into a WebElement that has "
+                "this locator: %s. Error: %s",
+                text, locator, e
             )
             raise WebDriverException(
                 f"Unable to send this text: {text} into a WebElement that has this locator: {locator}."
@@ -448,7 +652,8 @@ class BasePage:
         except WebDriverException as e:
             self.logger.error(
                 "An error occurred while trying to close all browser windows and ending the WebDriver "
-                f"session. Error: {e}"
+                "session. Error: %s",
+                e
             )
             raise WebDriverException("Unable to close all browser windows and ending the WebDriver session.")
 
@@ -460,7 +665,7 @@ class BasePage:
             self.driver.close()
             self.logger.info("Successfully closed the current browser window.")
         except WebDriverException as e:
-            self.logger.error(f"An error occurred while trying to close the current window. Error: {e}")
+            self.logger.error("An error occurred while trying to close the current window. Error: %s", e)
             raise WebDriverException("Unable to close the current window.")
 
     def is_dropdown_multiple_selections(self, locator):
@@ -476,62 +681,67 @@ class BasePage:
                 self.logger.info("The dropdown doesn't support multiple selections.")
             return dropdown.is_multiple
         except UnexpectedTagNameException as e:
-            self.logger.error(f"The Select class didn't get an expected WebElement. Error: {e}")
+            self.logger.error("The Select class didn't get an expected WebElement. Error: %s", e)
             raise UnexpectedTagNameException(
                 f"The Select class received an unexpected WebElement that has this locator: {locator}."
             )
         except WebDriverException as e:
             self.logger.error(
                 "An error occurred while trying to check if the dropdown supports multiple selections "
-                f"or not. Error: {e}"
+                "or not. Error: %s",
+                e
             )
             raise WebDriverException("Unable to check if the dropdown supports multiple selections or not.")
 
+    @profiled
     def select_dropdown_by_visible_text(self, locator, text):
         """Selects a dropdown option by a visible text."""
         self.logger.log_method_entry(self.select_dropdown_by_visible_text.__name__)
         try:
-            self.logger.info(f"Selecting a dropdown option by this visible text: {text}.")
+            self.logger.info("Selecting a dropdown option by this visible text: %s.", text)
             web_element = self.find_element(locator)
             drop_down = Select(web_element)
             drop_down.select_by_visible_text(text)
-            self.logger.info(f"Successfully selected a dropdown option by this visible text: {text}.")
+            self.logger.info("Successfully selected a dropdown option by this visible text: %s.", text)
         except UnexpectedTagNameException as e:
-            self.logger.error(f"The Select class didn't get an expected WebElement. Error: {e}")
+            self.logger.error("The Select class didn't get an expected WebElement. Error: %s", e)
             raise UnexpectedTagNameException(
                 f"The Select class received an unexpected WebElement that has this locator: {locator}."
             )
         except WebDriverException as e:
             self.logger.error(
-                f"An error occurred while trying to select a dropdown option by this visible text: {text}. Error: {e} "
+                "An error occurred while trying to select a dropdown option by this visible text: %s. Error: %s ",
+                text, e
             )
             raise WebDriverException(f"Unable to select a dropdown option by this visible text: {text}.")
 
+    @profiled
     def select_dropdown_by_value(self, locator, value):
         """Selects a dropdown option by its value attribute."""
         self.logger.log_method_entry(self.select_dropdown_by_value.__name__)
         try:
-            self.logger.info(f"Selecting a dropdown option by this value: {value}.")
+            self.logger.info("Selecting a dropdown option by this value: %s.", value)
             web_element = self.find_element(locator)
             drop_down = Select(web_element)
             drop_down.select_by_value(value)
-            self.logger.info(f"Successfully selected a dropdown option by this value: {value}.")
+            self.logger.info("Successfully selected a dropdown option by this value: %s.", value)
         except UnexpectedTagNameException as e:
-            self.logger.error(f"The Select class didn't get an expected WebElement. Error: {e}")
+            self.logger.error("The Select class didn't get an expected WebElement. Error: %s", e)
             raise UnexpectedTagNameException(
                 f"The Select class received an unexpected WebElement that has this locator: {locator}."
             )
         except WebDriverException as e:
             self.logger.error(
-                f"An error occurred while trying to select a dropdown option by this value: {value}. Error: {e}"
+                "An error occurred while trying to select a dropdown option by this value: %s. Error: %s", value, e
             )
             raise WebDriverException(f"Unable to select a dropdown option by this value: {value}.")
 
+    @profiled
     def select_dropdown_by_index(self, locator, index):
         """Selects a dropdown option by its index."""
         self.logger.log_method_entry(self.select_dropdown_by_index.__name__)
         try:
-            self.logger.info(f"Selecting a dropdown option by this index: {index}.")
+            self.logger.info("Selecting a dropdown option by this index: %s.", index)
             self.logger.info("Checking if the index is negative or not.")
             if index < 0:
                 self.logger.error("Index cannot be negative.")
@@ -539,37 +749,40 @@ class BasePage:
             web_element = self.find_element(locator)
             drop_down = Select(web_element)
             drop_down.select_by_index(index)
-            self.logger.info(f"Successfully selected a dropdown option by this index: {index}.")
+            self.logger.info("Successfully selected a dropdown option by this index: %s.", index)
         except UnexpectedTagNameException as e:
-            self.logger.error(f"The Select class didn't get an expected WebElement. Error: {e}")
+            self.logger.error("The Select class didn't get an expected WebElement. Error: %s", e)
             raise UnexpectedTagNameException(
                 f"The Select class received an unexpected WebElement that has this locator: {locator}."
             )
         except WebDriverException as e:
             self.logger.error(
-                f"An error occurred while trying to select a dropdown option by this index: {index}. Error: {e}"
+                "An error occurred while trying to select a dropdown option by this index: %s. Error: %s", index, e
             )
             raise WebDriverException(f"Unable to select a dropdown option by this index{index}.")
 
+    @profiled
     def get_all_dropdown_options(self, locator):
         """Returns all options in a dropdown as a list of strings."""
         self.logger.log_method_entry(self.get_all_dropdown_options.__name__)
         try:
             self.logger.info("Getting all dropdown options.")
             web_element = self.find_element(locator)
-            drop_down = Select(web_element)
-            options = [option.text for option in drop_down.options]
-            self.logger.info(f"Successfully got all dropdown options. Options are: {options}")
+            options = self.driver.execute_script(SELECT_OPTIONS_SCRIPT, web_element)
+            if options is None:
+                raise UnexpectedTagNameException(f"Select only works on <select> elements, not on {locator}")
+            self.logger.info("Successfully got all dropdown options. Options are: %s", options)
             return options
         except UnexpectedTagNameException as e:
-            self.logger.error(f"The Select class didn't get an expected WebElement. Error: {e}")
+            self.logger.error("The Select class didn't get an expected WebElement. Error: %s", e)
             raise UnexpectedTagNameException(
                 f"The Select class received an unexpected WebElement that has this locator: {locator}."
             )
         except WebDriverException as e:
-            self.logger.error(f"An error occurred while trying to get all dropdown options. Error: {e}")
+            self.logger.error("An error occurred while trying to get all dropdown options. Error: %s", e)
             raise WebDriverException("Unable to get all dropdown options.")
 
+    @profiled
     def get_selected_dropdown_option(self, locator):
         """Returns the currently selected option in a dropdown."""
         self.logger.log_method_entry(self.get_selected_dropdown_option.__name__)
@@ -579,17 +792,18 @@ class BasePage:
             drop_down = Select(web_element)
             self.logger.info(
                 "Successfully got the currently selected dropdown option. The currently selected option "
-                f"is: {drop_down.first_selected_option.text}"
+                "is: %s",
+                drop_down.first_selected_option.text
             )
             return drop_down.first_selected_option.text
         except UnexpectedTagNameException as e:
-            self.logger.error(f"The Select class didn't get an expected WebElement. Error: {e}")
+            self.logger.error("The Select class didn't get an expected WebElement. Error: %s", e)
             raise UnexpectedTagNameException(
                 f"The Select class received an unexpected WebElement that has this locator: {locator}."
             )
         except WebDriverException as e:
             self.logger.error(
-                f"An error occurred while trying to get the currently selected dropdown option. Error: {e}"
+                "An error occurred while trying to get the currently selected dropdown option. Error: %s", e
             )
             raise WebDriverException("Unable to get the currently selected dropdown option.")
 
@@ -607,14 +821,15 @@ class BasePage:
             drop_down.deselect_all()
             self.logger.info("Successfully deselected all selected options in the multi-select dropdown.")
         except UnexpectedTagNameException as e:
-            self.logger.error(f"The Select class didn't get an expected WebElement. Error: {e}")
+            self.logger.error("The Select class didn't get an expected WebElement. Error: %s", e)
             raise UnexpectedTagNameException(
                 f"The Select class received an unexpected WebElement that has this locator: {locator}."
             )
         except WebDriverException as e:
             self.logger.error(
-                f"An error occurred while trying to deselect all selected options in the multi-select "
-                f"dropdown. Error: {e}"
+                "An error occurred while trying to deselect all selected options in the multi-select "
+                "dropdown. Error: %s",
+                e
             )
             raise WebDriverException("Unable to deselect all selected options in the multi-select dropdown.")
 
@@ -622,7 +837,7 @@ class BasePage:
         """Deselects a dropdown option by its index in a multi-select dropdown."""
         self.logger.log_method_entry(self.deselect_dropdown_by_index.__name__)
         try:
-            self.logger.info(f"Deselecting an option in the multi-select dropdown by this index: {index}.")
+            self.logger.info("Deselecting an option in the multi-select dropdown by this index: %s.", index)
             self.logger.info("Checking if the dropdown supports multiple selections or not.")
             if not self.is_dropdown_multiple_selections(locator):
                 self.logger.error("The dropdown doesn't support the multi-select option.")
@@ -630,15 +845,15 @@ class BasePage:
             web_element = self.find_element(locator)
             drop_down = Select(web_element)
             drop_down.deselect_by_index(index)
-            self.logger.info(f"Successfully deselected a dropdown option by the index: {index}.")
+            self.logger.info("Successfully deselected a dropdown option by the index: %s.", index)
         except UnexpectedTagNameException as e:
-            self.logger.error(f"The Select class didn't get an expected WebElement. Error: {e}")
+            self.logger.error("The Select class didn't get an expected WebElement. Error: %s", e)
             raise UnexpectedTagNameException(
                 f"The Select class received an unexpected WebElement that has this locator: {locator}."
             )
         except WebDriverException as e:
             self.logger.error(
-                f"An error occurred while trying to deselect a dropdown option by this index: {index}. Error: {e}."
+                "An error occurred while trying to deselect a dropdown option by this index: %s. Error: %s.", index, e
             )
             raise WebDriverException(f"Unable to deselect a dropdown option by this index: {index}.")
 
@@ -646,7 +861,7 @@ class BasePage:
         """Deselects a dropdown option by its value attribute in a multi-select dropdown."""
         self.logger.log_method_entry(self.deselect_dropdown_by_value.__name__)
         try:
-            self.logger.info(f"Deselecting an option in the multi-select dropdown by this value: {value}.")
+            self.logger.info("Deselecting an option in the multi-select dropdown by this value: %s.", value)
             self.logger.info("Checking if the dropdown supports multiple selections or not.")
             if not self.is_dropdown_multiple_selections(locator):
                 self.logger.error("The dropdown doesn't support the multi-select option.")
@@ -654,15 +869,15 @@ class BasePage:
             web_element = self.find_element(locator)
             drop_down = Select(web_element)
             drop_down.deselect_by_value(value)
-            self.logger.info(f"Successfully deselected an option by the value: {value}.")
+            self.logger.info("Successfully deselected an option by the value: %s.", value)
         except UnexpectedTagNameException as e:
-            self.logger.error(f"The Select class didn't get an expected WebElement. Error: {e}")
+            self.logger.error("The Select class didn't get an expected WebElement. Error: %s", e)
             raise UnexpectedTagNameException(
                 f"The Select class received an unexpected WebElement that has this locator: {locator}."
             )
         except WebDriverException as e:
             self.logger.error(
-                f"An error occurred while trying to deselect an option by this value: {value}. Error: {e}"
+                "An error occurred while trying to deselect an option by this value: %s. Error: %s", value, e
             )
             raise WebDriverException(f"Unable to deselect a dropdown option by this value: {value}.")
 
@@ -670,7 +885,7 @@ class BasePage:
         """Deselects a dropdown option by its visible text in a multi-select dropdown."""
         self.logger.log_method_entry(self.deselect_dropdown_by_visible_text.__name__)
         try:
-            self.logger.info(f"Deselecting an option in the multi-select dropdown by this visible text: {text}.")
+            self.logger.info("Deselecting an option in the multi-select dropdown by this visible text: %s.", text)
             self.logger.info("Checking if the dropdown supports multiple selections or not.")
             if not self.is_dropdown_multiple_selections(locator):
                 self.logger.error("The dropdown doesn't support the multi-select option.")
@@ -678,36 +893,44 @@ class BasePage:
             web_element = self.find_element(locator)
             drop_down = Select(web_element)
             drop_down.deselect_by_visible_text(text)
-            self.logger.info(f"Successfully deselected an option by the visible text: {text}.")
+            self.logger.info("Successfully deselected an option by the visible text: %s.", text)
         except UnexpectedTagNameException as e:
-            self.logger.error(f"The Select class didn't get an expected WebElement. Error: {e}")
+            self.logger.error("The Select class didn't get an expected WebElement. Error: %s", e)
             raise UnexpectedTagNameException(
                 f"The Select class received an unexpected WebElement that has this locator: {locator}."
             )
         except WebDriverException as e:
             self.logger.error(
-                f"An error occurred while trying to deselect an option by this visible text: {text}. Error: {e}"
+                "An error occurred while trying to deselect an option by this visible text: %s. Error: %s", text, e
             )
             raise WebDriverException(f"Unable to select a dropdown option by this visible text: {text}.")
 
+    @profiled
     def switch_to_iframe(self, locator, timeout=10):
         """Switches the WebDriver's context to the specified IFrame."""
         self.logger.log_method_entry(self.switch_to_iframe.__name__)
         try:
-            self.logger.info(f"Switching to a IFrame that has this locator: {locator}.")
-            WebDriverWait(self.driver, timeout).until(EC.frame_to_be_available_and_switch_to_it(locator))
-            self.logger.info(f"Successfully switched to the IFrame that has this locator: {locator}.")
+            self.logger.info("Switching to a IFrame that has this locator: %s.", locator)
+            self.wait.until(
+                EC.frame_to_be_available_and_switch_to_it(locator), timeout=timeout, label=("frame", locator)
+            )
+            self.invalidate_element_cache()
+            self.logger.info("Successfully switched to the IFrame that has this locator: %s.", locator)
         except TimeoutException as e:
             self.logger.error(
-                f"Timeout occurred while trying to switch to a IFrame that has this locator: {locator}. Error: {e}."
+                "Timeout occurred while trying to switch to a IFrame that has this locator: %s. Error: %s.",
+                locator, e
             )
             raise TimeoutException(f"The IFrame wasn't available within {timeout} seconds.")
         except NoSuchFrameException as e:
-            self.logger.error(f"The IFrame that has this locator: {locator} couldn't be found in the DOM. Error: {e}.")
+            self.logger.error(
+                "The IFrame that has this locator: %s couldn't be found in the DOM. Error: %s.", locator, e
+            )
             raise NoSuchFrameException(f"No such an IFrame that has this locator: {locator} in the DOM.")
         except WebDriverException as e:
             self.logger.error(
-                f"An error occurred while trying to switch to a IFrame that has this locator: {locator}. Error: {e}."
+                "An error occurred while trying to switch to a IFrame that has this locator: %s. Error: %s.",
+                locator, e
             )
             raise WebDriverException(f"Unable to switch to IFrame that has this locator: {locator}.")
 
@@ -717,9 +940,10 @@ class BasePage:
         try:
             self.logger.info("Switching back to the default content.")
             self.driver.switch_to.default_content()
+            self.invalidate_element_cache()
             self.logger.info("Successfully switched back to the default content.")
         except WebDriverException as e:
-            self.logger.error(f"An error occurred while trying to switch back to the default content. Error: {e}.")
+            self.logger.error("An error occurred while trying to switch back to the default content. Error: %s.", e)
             raise WebDriverException("Unable to switch back to the default content.")
 
     def get_current_window_handle(self):
@@ -730,14 +954,15 @@ class BasePage:
             current_window_handle = self.driver.current_window_handle
             self.logger.info(
                 "Successfully retrieved the current window handle. The current window handle is: "
-                f"{current_window_handle}."
+                "%s.",
+                current_window_handle
             )
             return current_window_handle
         except NoSuchWindowException as e:
-            self.logger.error(f"The current window handle does not exist or is closed. Error: {e}.")
+            self.logger.error("The current window handle does not exist or is closed. Error: %s.", e)
             raise NoSuchWindowException("No such opened window to get its handle.")
         except WebDriverException as e:
-            self.logger.error(f"An error occurred while trying to retrieve the current window handle. Error: {e}.")
+            self.logger.error("An error occurred while trying to retrieve the current window handle. Error: %s.", e)
             raise WebDriverException("Unable to get the current window handle.")
 
     def get_all_window_handles(self):
@@ -747,28 +972,29 @@ class BasePage:
             self.logger.info("Getting the all window handles.")
             all_window_handles = self.driver.window_handles
             self.logger.info(
-                f"Successfully retrieved the all window handles. The all window handles are: {all_window_handles}."
+                "Successfully retrieved the all window handles. The all window handles are: %s.", all_window_handles
             )
             return all_window_handles
         except NoSuchWindowException as e:
-            self.logger.error(f"No opened windows to retrieve their handles. Error: {e}.")
+            self.logger.error("No opened windows to retrieve their handles. Error: %s.", e)
             raise NoSuchWindowException("No windows were opened.")
         except WebDriverException as e:
-            self.logger.error(f"An error occurred while trying to retrieve all window handles. Error: {e}.")
+            self.logger.error("An error occurred while trying to retrieve all window handles. Error: %s.", e)
             raise WebDriverException("Unable to get all window handles.")
 
     def switch_to_window(self, handle):
         """Switches the WebDriver's context to the specified window."""
         self.logger.log_method_entry(self.switch_to_window.__name__)
         try:
-            self.logger.info(f"Switching to the {handle} window.")
+            self.logger.info("Switching to the %s window.", handle)
             self.driver.switch_to.window(handle)
-            self.logger.info(f"Successfully switched to this {handle} window.")
+            self.invalidate_element_cache()
+            self.logger.info("Successfully switched to this %s window.", handle)
         except NoSuchWindowException as e:
-            self.logger.error(f"The {handle} window does not exist or is closed. Error: {e}.")
+            self.logger.error("The %s window does not exist or is closed. Error: %s.", handle, e)
             raise NoSuchWindowException("The specified window didn't exist or was closed.")
         except WebDriverException as e:
-            self.logger.error(f"An error occurred while trying to switch {handle} window. Error: {e}.")
+            self.logger.error("An error occurred while trying to switch %s window. Error: %s.", handle, e)
             raise WebDriverException(f"Unable to switch to this {handle} window.")
 
     def switch_to_next_tab(self):
@@ -785,25 +1011,30 @@ class BasePage:
                 raise NoSuchWindowException("No new tab was found to switch to.")
 
             self.driver.switch_to.window(new_handles[0])
-            self.logger.info(f"Switched to next tab with handle: {new_handles[0]}")
+            self.invalidate_element_cache()
+            self.logger.info("Switched to next tab with handle: %s", new_handles[0])
         except WebDriverException as e:
-            self.logger.error(f"Failed to switch to next tab. Error: {e}")
+            self.logger.error("Failed to switch to next tab. Error: %s", e)
             raise WebDriverException(f"Failed to switch to next tab. Error: {e}")
 
+    @profiled
     def get_table_row_values(self, locater):
-        """Returns a list of values from each row in a table."""
+        """Returns a list of values from each row in a table, once every row is visible."""
         self.logger.log_method_entry(self.get_table_row_values.__name__)
         try:
-            self.logger.info(f"Getting the values from each row in the table that has this locator: {locater}.")
-            table = self.find_elements(locater)
-            val = [el.text for el in table]
-            self.logger.info(f"Successfully retrieved the values from each row in the table. The values are: {val}.")
+            self.logger.info("Getting the values from each row in the table that has this locator: %s.", locater)
+            val = [data["text"] for data in self.get_elements_data(locater, all_visible=True)]
+            self.logger.info("Successfully retrieved the values from each row in the table. The values are: %s.", val)
             return val
         except NoSuchElementException as e:
-            self.logger.error(f"The table with this locator: {locater} was not found. Error: {e}.")
+            self.logger.error("The table with this locator: %s was not found. Error: %s.", locater, e)
             raise NoSuchElementException(f"The table with this locator: {locater} was not found.")
         except WebDriverException as e:
             self.logger.error(
-                f"An error occurred while trying to get the values from each row in the table. Error: {e}."
+                "An error occurred while trying to get the values from each row in the table. Error: %s.", e
             )
             raise WebDriverException("Unable to get the values from each row in the table.")
+
+
+compile_page_model(BasePage)
+track_page_methods(BasePage)
@@ -2,43 +2,71 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from pages.base_page import BasePage
+from utils.page_model import Locator
 
 
 class InventoryPage(BasePage):
 
-    cart_icon = (By.ID,'shopping_cart_container')
-    cart_badge = (By.CLASS_NAME, "shopping_cart_badge")
-    continue_shopping = (By.ID,'continue-shopping')
-    inventory_items = (By.CLASS_NAME, 'inventory_item')
-    item_name =(By.CLASS_NAME, "inventory_item_name")
+    cart_icon = Locator(By.ID,'shopping_cart_container')
+    cart_badge = Locator(By.CLASS_NAME, "shopping_cart_badge")
+    continue_shopping = Locator(By.ID,'continue-shopping')
+    inventory_items = Locator(By.CLASS_NAME, 'inventory_item')
+    item_name = Locator(By.CLASS_NAME, "inventory_item_name")
 
-    add_to_cart_buttons =(By.XPATH,"//button[contains(text(),'Add to cart')]")
-    remove_from_cart_buttons = (By.XPATH, "//button[contains(text(),'Remove')]")
+    add_to_cart_buttons = Locator(By.XPATH,"//button[contains(text(),'Add to cart')]")
+    remove_from_cart_buttons = Locator(By.XPATH, "//button[contains(text(),'Remove')]")
 
-    hamburger_menu = (By.ID, 'react-burger-menu-btn')
-    logout_button = (By.ID, 'logout_sidebar_link')
+    hamburger_menu = Locator(By.ID, 'react-burger-menu-btn')
+    logout_button = Locator(By.ID, 'logout_sidebar_link')
 
-    select_container_locator = (By.CLASS_NAME, 'select_container')
-    product_sort_container = (By.CLASS_NAME, 'product_sort_container')
-    item_price = (By.CLASS_NAME, 'inventory_item_price')
+    select_container_locator = Locator(By.CLASS_NAME, 'select_container')
+    product_sort_container = Locator(By.CLASS_NAME, 'product_sort_container')
+    item_price = Locator(By.CLASS_NAME, 'inventory_item_price')
 
 
 
 
     def logout_function(self):
-        self.wait.until(EC.visibility_of_element_located(self.hamburger_menu)).click()
-        self.wait.until(EC.visibility_of_element_located(self.logout_button))
+        self.wait.until(
+            EC.visibility_of_element_located(self.hamburger_menu), label=("visible", self.hamburger_menu)
+        ).click()
+        self.wait.until(EC.visibility_of_element_located(self.logout_button), label=("visible", self.logout_button))
 
     def click_cart_button(self):
-        self.wait.until(EC.visibility_of_element_located(self.cart_icon)).click()
+        self.wait.until(EC.visibility_of_element_located(self.cart_icon), label=("visible", self.cart_icon)).click()
 
     def click_continue_shopping(self):
-        self.wait.until(EC.visibility_of_element_located(self.continue_shopping)).click()
+        self.wait.until(
+            EC.visibility_of_element_located(self.continue_shopping), label=("visible", self.continue_shopping)
+        ).click()
 
 
     def select_container(self,visible_text):
-        self.wait.until(EC.visibility_of_element_located(self.select_container_locator))
-        self.select_dd(self.product_sort_container,visible_text)
+        self.wait.until(
+            EC.visibility_of_element_located(self.select_container_locator),
+            label=("visible", self.select_container_locator),
+        )
+        self.select_dropdown_by_visible_text(self.product_sort_container,visible_text)
+
+    def get_inventory_items(self):
+        """Returns the name and price of every inventory item, read in a single round-trip.
+
+        The price is None for an item that doesn't show one.
+        """
+        items = self.get_elements_data(self.inventory_items, fields={"name": self.item_name, "price": self.item_price})
+        return [
+            {
+                "name": item["fields"]["name"],
+                "price": float(item["fields"]["price"].lstrip("$")) if item["fields"]["price"] else None,
+            }
+            for item in items
+        ]
+
+    def get_item_names(self):
+        return [item["name"] for item in self.get_inventory_items()]
+
+    def get_item_prices(self):
+        return [item["price"] for item in self.get_inventory_items()]
 
 
 
@@ -6,32 +6,39 @@ from selenium.webdriver.support.expected_conditions import alert_is_present
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from pages.base_page import BasePage
+from utils.page_model import Locator
 import allure
 
 
 class LoginPage(BasePage):
+    USERNAME_FIELD = Locator(By.ID, "user-name")
+    PASSWORD_FIELD = Locator(By.ID, "password")
+    LOGIN_BUTTON = Locator(By.ID, "login-button")
+    ERROR_MESSAGE = Locator(By.XPATH, '//*[@id="login_button_container"]/div/form/div[3]/h3')
 
-    def __init__(self, driver):
-        super().__init__(driver)
-        self.USERNAME_FIELD = (By.ID, "user-name")
-        self.PASSWORD_FIELD = (By.ID, "password")
-        self.LOGIN_BUTTON = (By.ID, "login-button")
-        self.ERROR_MESSAGE = (By.XPATH, '//*[@id="login_button_container"]/div/form/div[3]/h3')
 
+    def enter_username(self, username):
+        self.send_keys(self.USERNAME_FIELD, username)
+
+    def enter_password(self, password):
+        self.send_keys(self.PASSWORD_FIELD, password)
+
+    def click_login_btn(self):
+        self.click(self.LOGIN_BUTTON)
 
     @allure.step("Login process is executed")
     def login(self, username, password):
         self.logger.log_action("Login process executed")
-        self.enter_text(self.username_input, username)
-        self.enter_text(self.password_input, password)
-        self.click(self.login_button)
+        self.enter_username(username)
+        self.enter_password(password)
+        self.click_login_btn()
         self.logger.info("Login process completed.")
-        self.wait.until(EC.url_contains('inventory.html'))
+        self.wait.until(EC.url_contains('inventory.html'), label=("url_contains", 'inventory.html'))
 
     @allure.step("Get error validation message")
     def get_error_message(self):
-        self.wait.until(EC.visibility_of_element_located(self.error_message))
-        return self.get_text(self.error_message)
+        self.wait.until(EC.visibility_of_element_located(self.ERROR_MESSAGE), label=("visible", self.ERROR_MESSAGE))
+        return self.get_text(self.ERROR_MESSAGE)
 
 
 
@@ -0,0 +1,141 @@
+import time
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+
+class FakeSwitchTo:
+    def __init__(self):
+        self.windows = []
+
+    def window(self, handle):
+        self.windows.append(handle)
+
+
+class FakeDriver:
+    def __init__(
+        self,
+        session_id="fake-session",
+        current_url="about:blank",
+        frames=(),
+        script_results=(),
+        async_results=(),
+        cookies=(),
+        on_get=None,
+        on_script=None,
+        command_seconds=0.0,
+    ):
+        """Stands in for a WebDriver session in unit tests and records what was done to it.
+
+        frames are the PNG screenshots to hand out, in order. execute_script returns the script_results in
+        order and then keeps returning the last one, unless on_script(script, *args) is given, whose result
+        is returned instead; execute_async_script returns (or raises) the async_results in order. on_get(url)
+        is called after every navigation and every execute() takes command_seconds. A crashed driver fails
+        like a session lost to a page crash.
+        """
+        self.session_id = session_id
+        self.current_url = current_url
+        self.frames = list(frames)
+        self.script_results = list(script_results)
+        self.async_results = list(async_results)
+        self.cookies = list(cookies)
+        self.on_get = on_get
+        self.on_script = on_script
+        self.command_seconds = command_seconds
+        self.crashed = False
+        self.quit_called = False
+        self.cookies_deleted = False
+        self.window = None
+        self.script_timeout = None
+        self.visited = []
+        self.scripts = []
+        self.script_args = []
+        self.commands = []
+        self.switch_to = FakeSwitchTo()
+
+    @property
+    def window_handles(self):
+        if self.crashed:
+            raise WebDriverException("session deleted because of page crash")
+        return ["main"]
+
+    def get(self, url):
+        self.visited.append(url)
+        self.current_url = url
+        if self.on_get is not None:
+            self.on_get(url)
+
+    def execute(self, driver_command, params=None):
+        self.commands.append(driver_command)
+        time.sleep(self.command_seconds)
+        return {"value": None}
+
+    def execute_script(self, script, *args):
+        self.scripts.append(script)
+        self.script_args.append(args)
+        if self.on_script is not None:
+            return self.on_script(script, *args)
+        if len(self.script_results) > 1:
+            return self.script_results.pop(0)
+        return self.script_results[0] if self.script_results else None
+
+    def set_script_timeout(self, timeout):
+        self.script_timeout = timeout
+
+    def execute_async_script(self, script, *args):
+        result = self.async_results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def find_element(self, by, value):
+        return (by, value)
+
+    def get_cookies(self):
+        return list(self.cookies)
+
+    def add_cookie(self, cookie):
+        self.cookies.append(cookie)
+
+    def delete_all_cookies(self):
+        self.cookies = []
+        self.cookies_deleted = True
+
+    def get_screenshot_as_png(self):
+        return self.frames.pop(0)
+
+    def maximize_window(self):
+        self.window = "maximized"
+
+    def set_window_size(self, width, height):
+        self.window = (width, height)
+
+    def quit(self):
+        self.quit_called = True
+
+
+class FakeChromeDriver(FakeDriver):
+    def __init__(self, performance_log=(), **kwargs):
+        """A FakeDriver with DevTools: CDP commands are recorded and get_log returns the performance_log."""
+        super().__init__(**kwargs)
+        self.performance_log = list(performance_log)
+        self.cdp_commands = []
+
+    def execute_cdp_cmd(self, command, params):
+        self.cdp_commands.append((command, params))
+        return {"identifier": str(len(self.cdp_commands))}
+
+    def get_log(self, log_type):
+        return self.performance_log
+
+
+@pytest.fixture
+def fake_driver():
+    """Returns the FakeDriver class, so a test can build as many fake sessions as it needs."""
+    return FakeDriver
+
+
+@pytest.fixture
+def fake_chrome_driver():
+    """Returns the FakeChromeDriver class, for code that only talks DevTools to Chromium sessions."""
+    return FakeChromeDriver
@@ -0,0 +1,52 @@
+import asyncio
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.common.by import By
+from pages.async_base_page import AsyncBasePage
+from utils.async_webdriver import to_w3c_locator
+
+
+class FakeAsyncElement:
+    def __init__(self):
+        self.clicked = False
+
+    async def is_displayed(self):
+        return True
+
+    async def is_enabled(self):
+        return True
+
+    async def click(self):
+        self.clicked = True
+
+
+class FakeAsyncDriver:
+    def __init__(self, missing_lookups):
+        self.missing_lookups = missing_lookups
+        self.element = FakeAsyncElement()
+
+    async def find_element(self, locator):
+        if self.missing_lookups:
+            self.missing_lookups -= 1
+            raise NoSuchElementException(f"no such element: {locator}")
+        return self.element
+
+
+def test_click_waits_for_the_element_without_blocking_the_loop():
+    driver = FakeAsyncDriver(missing_lookups=2)
+    page = AsyncBasePage(driver, initial_poll=0.001)
+    asyncio.run(page.click((By.ID, "checkout")))
+    assert driver.element.clicked
+
+
+def test_send_keys_raises_the_timeout_unchanged():
+    page = AsyncBasePage(FakeAsyncDriver(missing_lookups=1000), initial_poll=0.001)
+    with pytest.raises(TimeoutException):
+        asyncio.run(page.send_keys((By.ID, "first-name"), "Ada", timeout=0.01))
+
+
+def test_selenium_locators_are_converted_to_w3c_strategies():
+    assert to_w3c_locator((By.ID, "checkout")) == ("css selector", '[id="checkout"]')
+    assert to_w3c_locator((By.CLASS_NAME, "cart_item")) == ("css selector", ".cart_item")
+    assert to_w3c_locator((By.XPATH, "//h2")) == ("xpath", "//h2")
@@ -0,0 +1,78 @@
+import time
+
+from utils.auth_state import AuthStateCache
+
+
+LANDING_URL = "https://www.saucedemo.com/inventory.html"
+COOKIE = {"name": "session-username", "value": "standard_user", "domain": "www.saucedemo.com", "path": "/"}
+
+
+STORAGE = {"local": {"cart-contents": "[4]"}, "session": {}}
+
+
+def logged_in_driver(fake_driver):
+    """Returns a fake session that went through the UI login, holding the session cookie and storage."""
+    return fake_driver(cookies=[COOKIE], script_results=[STORAGE])
+
+
+def rejecting_driver(fake_driver):
+    """Returns a fake session that the site sends back to the login page from the landing page."""
+    driver = fake_driver(script_results=[STORAGE])
+
+    def bounce(url):
+        if url == LANDING_URL:
+            driver.current_url = "https://www.saucedemo.com/"
+
+    driver.on_get = bounce
+    return driver
+
+
+def ui_login(driver):
+    driver.get(LANDING_URL)
+
+
+def test_the_first_login_goes_through_the_ui_and_is_captured(fake_driver):
+    cache = AuthStateCache(LANDING_URL)
+    cache.login(logged_in_driver(fake_driver), "standard_user", ui_login)
+    state = cache._states["standard_user"]
+    assert state["cookies"] == [COOKIE]
+    assert state["local_storage"] == {"cart-contents": "[4]"}
+    assert (cache.ui_logins, cache.injected_logins) == (1, 0)
+
+
+def test_without_devtools_the_state_is_replayed_on_the_favicon_of_the_origin(fake_driver):
+    cache = AuthStateCache(LANDING_URL)
+    cache.login(logged_in_driver(fake_driver), "standard_user", ui_login)
+    driver = fake_driver()
+    cache.login(driver, "standard_user", ui_login)
+    assert driver.visited == ["https://www.saucedemo.com/favicon.ico", LANDING_URL]
+    assert driver.cookies == [COOKIE]
+    assert driver.scripts[0] == AuthStateCache.WRITE_STORAGE_SCRIPT
+    assert driver.script_args[0] == ({"cart-contents": "[4]"}, {})
+    assert (cache.ui_logins, cache.injected_logins) == (1, 1)
+
+
+def test_with_devtools_the_state_is_seeded_before_the_first_navigation(fake_driver, fake_chrome_driver):
+    cache = AuthStateCache(LANDING_URL)
+    cache.login(logged_in_driver(fake_driver), "standard_user", ui_login)
+    driver = fake_chrome_driver()
+    cache.login(driver, "standard_user", ui_login)
+    assert driver.visited == [LANDING_URL]
+    commands = [command for command, _ in driver.cdp_commands]
+    assert commands == [
+        "Network.setCookie", "Page.addScriptToEvaluateOnNewDocument", "Page.removeScriptToEvaluateOnNewDocument"
+    ]
+    assert driver.cdp_commands[0][1]["name"] == "session-username"
+    assert '{"cart-contents": "[4]"}' in driver.cdp_commands[1][1]["source"]
+    assert cache.injected_logins == 1
+
+
+def test_stale_or_rejected_states_fall_back_to_the_ui(fake_driver):
+    cache = AuthStateCache(LANDING_URL, max_age=60)
+    cache.login(logged_in_driver(fake_driver), "standard_user", ui_login)
+    cache._states["standard_user"]["captured_at"] = time.time() - 120
+    cache.login(logged_in_driver(fake_driver), "standard_user", ui_login)
+    assert cache.ui_logins == 2
+    rejecting = rejecting_driver(fake_driver)
+    cache.login(rejecting, "standard_user", lambda driver: None)
+    assert (cache.ui_logins, cache.injected_logins) == (3, 0)
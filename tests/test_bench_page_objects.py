@@ -0,0 +1,14 @@
+from benchmarks.bench_page_objects import compare_to_baseline
+
+
+def result(median_ms):
+    return {"median_ms": median_ms, "min_ms": median_ms, "max_ms": median_ms, "iterations": 1}
+
+
+def test_only_slowdowns_beyond_the_threshold_are_regressions():
+    baseline = {"results": {"chrome": {"click": result(10.0), "get_text": result(10.0)}}}
+    current = {"results": {"chrome": {"click": result(11.0), "get_text": result(13.0), "send_keys": result(5.0)}}}
+    rows = {row["benchmark"]: row for row in compare_to_baseline(current, baseline, threshold=0.2)}
+    assert set(rows) == {"click", "get_text"}
+    assert not rows["click"]["regressed"]
+    assert rows["get_text"]["regressed"]
@@ -0,0 +1,53 @@
+import os
+
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from utils import process_utils
+from utils.browser_presets import BrowserPreset, PresetStats
+
+
+def test_ci_fast_preset_runs_chrome_headless_with_a_fixed_viewport(fake_driver):
+    options = ChromeOptions()
+    preset = BrowserPreset("ci-fast", "chrome")
+    preset.apply_to_options(options)
+    driver = fake_driver()
+    preset.apply_window(driver)
+    assert "--headless=new" in options.arguments
+    assert "--disable-gpu" in options.arguments
+    assert driver.window == (1366, 768)
+
+
+def test_low_memory_preset_limits_firefox_content_processes():
+    options = FirefoxOptions()
+    BrowserPreset("low-memory", "firefox").apply_to_options(options)
+    assert "-headless" in options.arguments
+    assert options.preferences["dom.ipc.processCount"] == 1
+
+
+def test_no_preset_keeps_the_maximized_headed_browser(fake_driver):
+    options = ChromeOptions()
+    preset = BrowserPreset("", "chrome")
+    preset.apply_to_options(options)
+    driver = fake_driver()
+    preset.apply_window(driver)
+    assert options.arguments == []
+    assert driver.window == "maximized"
+
+
+def test_startup_memory_mean_only_counts_launches_with_a_memory_sample():
+    stats = PresetStats()
+    stats.record("ci-fast", "chrome", 1.0, 200 * 1024 * 1024)
+    stats.record("ci-fast", "chrome", 3.0, 0)
+    summary = stats.summary()[0]
+    assert summary["startup_mean"] == 2.0
+    assert summary["rss_mean"] == 200 * 1024 * 1024
+
+
+def test_process_trees_are_empty_without_psutil_or_proc(monkeypatch):
+    def no_proc(path):
+        raise FileNotFoundError(path)
+
+    monkeypatch.setattr(process_utils, "psutil", None)
+    monkeypatch.setattr(process_utils.os, "listdir", no_proc)
+    assert process_utils.get_process_tree(os.getpid()) == []
+    assert process_utils.get_tree_rss_bytes(os.getpid()) == 0
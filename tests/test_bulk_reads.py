@@ -0,0 +1,43 @@
+from selenium.webdriver.common.by import By
+
+from pages.base_page import BasePage
+from pages.inventory_page import InventoryPage
+from utils.dom_scripts import to_js_query
+
+
+def element(text, visible=True, **fields):
+    return {"text": text, "visible": visible, "rect": {}, "attributes": {}, "fields": fields}
+
+
+def test_locator_values_are_quoted_for_the_page():
+    assert to_js_query((By.ID, 'say "hi"')) == ("css", '[id="say \\"hi\\""]')
+    assert to_js_query((By.LINK_TEXT, "Sauce's \"Labs\"")) == (
+        "xpath", "//a[normalize-space(.)=concat(\"Sauce's \", '\"', \"Labs\", '\"', \"\")]"
+    )
+    assert to_js_query((By.PARTIAL_LINK_TEXT, 'say "hi"')) == ("xpath", "//a[contains(., 'say \"hi\"')]")
+
+
+def test_field_xpaths_are_resolved_from_the_element():
+    assert to_js_query((By.XPATH, "(//div)[1] | //span[@id='a|/b']"), relative=True) == (
+        "xpath", "(.//div)[1] | .//span[@id='a|/b']"
+    )
+    assert to_js_query((By.XPATH, "./span"), relative=True) == ("xpath", "./span")
+    assert to_js_query((By.XPATH, "//div"), relative=False) == ("xpath", "//div")
+
+
+def test_table_rows_are_read_once_every_row_is_visible(fake_driver):
+    driver = fake_driver(script_results=[
+        [element("Row 1"), element("Row 2", visible=False)], [element("Row 1"), element("Row 2")]
+    ])
+    assert BasePage(driver).get_table_row_values((By.CSS_SELECTOR, "tr")) == ["Row 1", "Row 2"]
+    assert len(driver.scripts) == 2
+
+
+def test_inventory_items_without_a_price_read_as_none(fake_driver):
+    driver = fake_driver(script_results=[
+        [element("", name="Backpack", price="$29.99"), element("", name="Gift card", price=None)]
+    ])
+    assert InventoryPage(driver).get_inventory_items() == [
+        {"name": "Backpack", "price": 29.99},
+        {"name": "Gift card", "price": None},
+    ]
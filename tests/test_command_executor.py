@@ -0,0 +1,54 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+from selenium.webdriver.remote.command import Command
+from utils.command_executor import batch_execute, create_pooled_connection
+
+
+class FakeDriverServer(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = json.dumps({"value": self.path}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def executor():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeDriverServer)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield create_pooled_connection("chrome", f"http://127.0.0.1:{server.server_address[1]}")
+    server.shutdown()
+
+
+def session(executor):
+    return SimpleNamespace(execute=lambda command, params: executor.execute(command, dict(params, sessionId="s1")))
+
+
+def test_pooled_connection_counts_commands_bytes_and_round_trips(executor):
+    titles = batch_execute(session(executor), [(Command.GET_TITLE, {}), (Command.GET_CURRENT_URL, {})])
+    summary = executor.summary()
+    assert titles == ["/session/s1/title", "/session/s1/url"]
+    assert summary["commands"] == 2
+    assert summary["bytes_received"] > 0
+    assert summary["mean_round_trip_ms"] > 0
+
+
+def test_concurrent_commands_are_all_counted_and_summaries_can_start_from_a_snapshot(executor):
+    batch_execute(session(executor), [(Command.GET_TITLE, {})] * 5)
+    start = executor.snapshot()
+    commands = [(Command.GET_TITLE, {}), (Command.GET_CURRENT_URL, {})] * 100
+    batch_execute(session(executor), commands, max_workers=8)
+    assert executor.summary()["commands"] == 205
+    assert executor.summary(since=start)["commands"] == len(commands)
@@ -0,0 +1,34 @@
+import json
+
+import pytest
+
+from utils import config_loader
+from utils.config_loader import ConfigLoader
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({"browser": "chrome", "driver_pool": {"enabled": True, "max_uses": 5}}))
+    yield str(path)
+    config_loader.set_overrides({})
+
+
+def test_callers_get_copies_of_the_shared_configuration(config_path):
+    loader = ConfigLoader(config_path)
+    loader.config["driver_pool"]["max_uses"] = 1
+    loader.get("driver_pool")["enabled"] = False
+    loader.get_driver_pool_settings()["max_uses"] = 2
+    assert ConfigLoader(config_path).get_driver_pool_settings() == {"enabled": True, "max_uses": 5}
+
+
+def test_overrides_are_coerced_to_the_type_of_their_defaults(config_path, monkeypatch):
+    monkeypatch.setenv("SAUCEDEMO_CONFIG_DRIVER_POOL__ENABLED", "no")
+    config_loader.set_overrides({"driver_pool.max_uses": "12"})
+    assert ConfigLoader(config_path).get_driver_pool_settings() == {"enabled": False, "max_uses": 12}
+
+
+def test_a_malformed_override_falls_back_to_the_default(config_path):
+    config_loader.set_overrides({"driver_pool.max_uses": "many"})
+    assert ConfigLoader(config_path).get_driver_pool_settings()["max_uses"] == 20
+    assert ConfigLoader(config_path).get_int("driver_pool.max_uses", 3) == 3
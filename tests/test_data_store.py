@@ -0,0 +1,41 @@
+import json
+
+from utils.data_store import DataStore
+
+
+def test_data_store_parses_json_once(tmp_path, monkeypatch):
+    (tmp_path / "users.json").write_text(json.dumps({"valid": [{"username": "standard_user", "password": "s"}]}))
+    store = DataStore(str(tmp_path))
+    parse_calls = []
+    original_loads = json.load
+    monkeypatch.setattr(json, "load", lambda file: parse_calls.append(file) or original_loads(file))
+
+    assert store.get_tuples("users.json", "valid", ["username", "password"]) == [("standard_user", "s")]
+    assert store.get_tuples("users.json", "valid", ["username"]) == [("standard_user",)]
+    assert store.get_records("users.json", "missing") is None
+    assert len(parse_calls) == 1
+
+
+def test_data_store_hands_out_copies_of_the_cached_document(tmp_path):
+    (tmp_path / "users.json").write_text(json.dumps({"valid": [{"username": "standard_user", "password": "s"}]}))
+    store = DataStore(str(tmp_path))
+
+    store.load("users.json")["valid"].clear()
+    store.get_records("users.json", "valid")[0]["username"] = "changed"
+    store.get_tuples("users.json", "valid", ["username"]).clear()
+    assert store.get_records("users.json", "valid") == [{"username": "standard_user", "password": "s"}]
+    assert store.get_tuples("users.json", "valid", ["username"]) == [("standard_user",)]
+
+
+def test_data_store_streams_jsonl_and_csv_rows_by_key(tmp_path):
+    rows = [
+        {"key": "valid", "username": "standard_user"},
+        {"key": "locked", "username": "locked_out_user"},
+        {"key": "valid", "username": "visual_user"},
+    ]
+    (tmp_path / "users.jsonl").write_text("\n".join(json.dumps(row) for row in rows))
+    (tmp_path / "users.csv").write_text("key,username\n" + "\n".join(f"{r['key']},{r['username']}" for r in rows))
+    store = DataStore(str(tmp_path))
+
+    for file_name in ("users.jsonl", "users.csv"):
+        assert list(store.iter_tuples(file_name, "valid", ["username"])) == [("standard_user",), ("visual_user",)]
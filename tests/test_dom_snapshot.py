@@ -0,0 +1,42 @@
+from selenium.webdriver.common.by import By
+from utils.dom_snapshot import DomSnapshot
+
+
+PAYLOAD = {
+    "url": "http://localhost/cart.html",
+    "title": "Swag Labs",
+    "root": ["html", {}, 2, [
+        ["body", {}, 2, [
+            ["div", {"id": "cart_contents_container", "class": "cart_list"}, 2, [
+                ["div", {"class": "cart_item"}, 2, [
+                    ["div", {"class": "inventory_item_name"}, 2, ["Sauce Labs Backpack"]],
+                    ["div", {"class": "inventory_item_price"}, 2, ["$", ["span", {}, 1, ["29"]], ".99"]],
+                ]],
+                ["div", {"class": "cart_item"}, 2, [["div", {"class": "inventory_item_name"}, 2, ["Bike Light"]]]],
+                ["div", {"class": "cart_item removed"}, 0, [["div", {"class": "inventory_item_name"}, 0, ["Onesie"]]]],
+            ]],
+            ["input", {"id": "first-name", "name": "firstName", "value": "Jane"}, 1, []],
+            ["a", {"href": "/checkout"}, 1, ["Check", ["b", {}, 1, ["out"]], " now"]],
+        ]],
+    ]],
+}
+
+
+def test_css_xpath_and_locator_queries_run_against_the_snapshot():
+    snapshot = DomSnapshot(PAYLOAD)
+    assert snapshot.texts((By.CSS_SELECTOR, "#cart_contents_container > .cart_item .inventory_item_name")) == [
+        "Sauce Labs Backpack", "Bike Light"
+    ]
+    assert snapshot.count((By.XPATH, "//div[@id='cart_contents_container']/div")) == 3
+    assert not snapshot.is_visible((By.CSS_SELECTOR, "div.cart_item.removed"))
+    assert snapshot.value((By.NAME, "firstName")) == "Jane"
+    assert snapshot.text((By.TAG_NAME, "a")) == "Checkout now"
+    assert snapshot.text((By.CLASS_NAME, "inventory_item_price")) == "$29.99"
+    assert snapshot.exists((By.PARTIAL_LINK_TEXT, "out"))
+
+
+def test_snapshots_round_trip_through_gzipped_files(tmp_path):
+    path = DomSnapshot(PAYLOAD).save(str(tmp_path / "failure.dom.json.gz"))
+    loaded = DomSnapshot.load(path)
+    assert loaded.url == PAYLOAD["url"]
+    assert loaded.text((By.ID, "cart_contents_container")) == "Sauce Labs Backpack $29.99 Bike Light"
@@ -0,0 +1,43 @@
+from utils.driver_pool import DriverPool
+
+
+def make_pool(fake_driver, max_uses=20):
+    pool = DriverPool(max_uses=max_uses)
+    launched = iter(range(100))
+
+    def fake_launch():
+        pool.launches += 1
+        return fake_driver(session_id=next(launched))
+
+    pool._launch = fake_launch
+    return pool
+
+
+def test_driver_pool_reuses_warm_session(fake_driver):
+    pool = make_pool(fake_driver)
+    first = pool.acquire()
+    pool.release(first)
+    second = pool.acquire()
+    assert second is first
+    assert pool.launches == 1
+    assert pool.launches_saved == 1
+
+
+def test_driver_pool_recycles_after_max_uses(fake_driver):
+    pool = make_pool(fake_driver, max_uses=2)
+    web_driver = pool.acquire()
+    pool.release(web_driver)
+    pool.release(pool.acquire())
+    assert web_driver.quit_called
+    assert pool.acquire() is not web_driver
+    assert pool.recycled == 1
+
+
+def test_driver_pool_discards_crashed_session(fake_driver):
+    pool = make_pool(fake_driver)
+    web_driver = pool.acquire()
+    web_driver.crashed = True
+    pool.release(web_driver, healthy=False)
+    assert web_driver.quit_called
+    assert pool.crashed == 1
+    assert pool.acquire() is not web_driver
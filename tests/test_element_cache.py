@@ -0,0 +1,37 @@
+from selenium.common.exceptions import StaleElementReferenceException
+from utils.element_cache import ElementCache
+
+
+class FakeElement:
+    def __init__(self):
+        self.stale = False
+
+    def is_displayed(self):
+        if self.stale:
+            raise StaleElementReferenceException("stale element reference")
+        return True
+
+    def is_enabled(self):
+        return True
+
+
+def test_attached_elements_are_served_from_the_cache(fake_driver):
+    cache = ElementCache(fake_driver(current_url="http://localhost/inventory.html"))
+    element = FakeElement()
+    assert cache.get(("id", "checkout")) is None
+    cache.put(("id", "checkout"), element)
+    assert cache.get(("id", "checkout"), clickable=True) is element
+
+
+def test_stale_elements_and_url_changes_invalidate_the_cache(fake_driver):
+    driver = fake_driver(current_url="http://localhost/inventory.html")
+    cache = ElementCache(driver, track_url=True)
+    element = FakeElement()
+    cache.put(("id", "checkout"), element)
+    element.stale = True
+    assert cache.get(("id", "checkout")) is None
+    assert len(cache) == 0
+    cache.put(("id", "finish"), FakeElement())
+    driver.current_url = "http://localhost/checkout-complete.html"
+    assert cache.get(("id", "finish")) is None
+    assert len(cache) == 0
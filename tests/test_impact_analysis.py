@@ -0,0 +1,45 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+from pages.login_page import LoginPage
+from utils.impact_analysis import get_changed_symbols, impact_recorder, select_tests
+
+
+CART_PAGE = Path(__file__).resolve().parent.parent / "pages" / "cart_page.py"
+
+
+def finish_button_line():
+    with open(CART_PAGE) as cart_page:
+        return next(number for number, line in enumerate(cart_page, start=1) if "finish_button =" in line)
+
+
+def test_a_changed_locator_also_marks_the_methods_using_it():
+    symbols = get_changed_symbols("pages/cart_page.py", {finish_button_line()})
+    assert "pages/cart_page.py::CartPage.finish_button" in symbols
+    assert "pages/cart_page.py::CartPage.proceed_to_finish" in symbols
+    assert "pages/cart_page.py::CartPage.proceed_to_checkout" not in symbols
+
+
+def test_only_tests_depending_on_changed_symbols_are_selected():
+    def dependencies(*symbols):
+        return {"files": ["pages/cart_page.py"], "classes": ["pages/cart_page.py::CartPage"], "symbols": list(symbols)}
+
+    items = [SimpleNamespace(nodeid=f"tests/test_cart.py::test_{name}") for name in ("finish", "checkout", "new")]
+    impact_map = {
+        "tests/test_cart.py::test_finish": dependencies("pages/cart_page.py::CartPage.proceed_to_finish"),
+        "tests/test_cart.py::test_checkout": dependencies("pages/cart_page.py::CartPage.proceed_to_checkout"),
+    }
+    selected = select_tests(items, impact_map, {"pages/cart_page.py": {finish_button_line()}})
+    assert [item.nodeid for item in selected] == ["tests/test_cart.py::test_finish", "tests/test_cart.py::test_new"]
+    assert select_tests(items, impact_map, {"utils/wait_engine.py": {1}}) is None
+
+
+def test_undecorated_page_methods_are_recorded(monkeypatch):
+    monkeypatch.setattr(impact_recorder, "enabled", True)
+    monkeypatch.setattr(impact_recorder, "current_test", "tests/test_login.py::test_url")
+    monkeypatch.setattr(impact_recorder, "tests", {})
+    page = LoginPage(SimpleNamespace(current_url="https://example.com/"))
+    assert page.get_current_url() == "https://example.com/"
+    dependencies = impact_recorder.tests["tests/test_login.py::test_url"]
+    assert "pages/base_page.py::BasePage.get_current_url" in dependencies["symbols"]
+    assert "pages/login_page.py::LoginPage" in dependencies["classes"]
@@ -0,0 +1,41 @@
+import json
+
+from utils.lean_mode import LeanMode
+
+
+def make_lean_mode(tmp_path, enabled, learn_catalog=False):
+    settings = {
+        "enabled": enabled,
+        "blocked_resource_types": ["image"],
+        "blocked_url_patterns": ["*doubleclick.net*"],
+        "learn_catalog": learn_catalog,
+        "catalog_file": str(tmp_path / "catalog.json"),
+    }
+    return LeanMode(settings, "chrome")
+
+
+def devtools_event(method, **params):
+    return {"message": json.dumps({"message": {"method": method, "params": params}})}
+
+
+def test_a_disabled_lean_mode_makes_no_round_trip_unless_learning(tmp_path, fake_chrome_driver):
+    driver = fake_chrome_driver(script_results=[[["https://example.com/logo.png", 2048]]])
+    assert make_lean_mode(tmp_path, enabled=False).collect(driver) is None
+    assert driver.scripts == []
+    learning = make_lean_mode(tmp_path, enabled=False, learn_catalog=True)
+    assert learning.collect(driver) is None
+    learning.save_catalog()
+    with open(tmp_path / "catalog.json") as catalog_file:
+        assert json.load(catalog_file) == {"https://example.com/logo.png": 2048}
+
+
+def test_blocked_requests_are_counted_with_their_learned_sizes(tmp_path, fake_chrome_driver):
+    (tmp_path / "catalog.json").write_text(json.dumps({"https://example.com/logo.png": 2048}))
+    driver = fake_chrome_driver(performance_log=[
+        devtools_event("Network.requestWillBeSent", requestId="1", request={"url": "https://example.com/logo.png"}),
+        devtools_event("Network.loadingFailed", requestId="1", blockedReason="inspector"),
+        devtools_event("Network.requestWillBeSent", requestId="2", request={"url": "https://example.com/app.js"}),
+    ])
+    stats = make_lean_mode(tmp_path, enabled=True).collect(driver)
+    assert stats == {"requests_avoided": 1, "bytes_avoided": 2048}
+    assert driver.scripts == []
@@ -0,0 +1,41 @@
+import urllib.error
+import urllib.request
+
+import pytest
+
+from utils.local_server import LocalSauceDemoServer
+
+
+@pytest.fixture
+def server():
+    server = LocalSauceDemoServer(performance_glitch_delay_ms=1234)
+    server.start()
+    yield server
+    server.stop()
+
+
+def fetch(url):
+    opener = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+    with opener.open(url, timeout=5) as response:
+        return response.status, response.headers["Content-Type"], response.read().decode("utf-8")
+
+
+def test_pages_and_the_templated_script_are_served(server):
+    status, _, page = fetch(f"{server.base_url}/inventory.html")
+    assert status == 200
+    assert "<html" in page.lower()
+    status, content_type, script = fetch(f"{server.base_url}/static/app.js?v=1")
+    assert status == 200
+    assert content_type.startswith("application/javascript")
+    assert 'PERFORMANCE_GLITCH_DELAY_MS = "1234"' in script
+    assert "{{" not in script
+
+
+def test_missing_files_are_404_and_stop_frees_the_port(server):
+    with pytest.raises(urllib.error.HTTPError) as error:
+        fetch(f"{server.base_url}/missing.html")
+    assert error.value.code == 404
+    base_url = server.base_url
+    server.stop()
+    with pytest.raises(urllib.error.URLError):
+        fetch(f"{base_url}/index.html")
@@ -0,0 +1,60 @@
+import logging
+import queue
+import threading
+
+from utils.logger import BoundedQueueHandler, Logger
+
+
+def make_record(message):
+    return logging.LogRecord("test", logging.INFO, __file__, 0, message, None, None)
+
+
+def read_log(log_dir):
+    [log_file] = log_dir.iterdir()
+    return log_file.read_text().splitlines()
+
+
+def test_the_drop_policy_discards_and_counts_records_once_the_queue_is_full():
+    handler = BoundedQueueHandler(queue.Queue(maxsize=2), overflow_policy="drop")
+    for number in range(5):
+        handler.emit(make_record(f"record {number}"))
+    assert handler.queue.qsize() == 2
+    assert handler.dropped == 3
+
+
+def test_the_block_policy_applies_back_pressure_until_the_queue_drains():
+    handler = BoundedQueueHandler(queue.Queue(maxsize=1), overflow_policy="block")
+    handler.emit(make_record("first"))
+    producer = threading.Thread(target=handler.emit, args=(make_record("second"),))
+    producer.start()
+    producer.join(timeout=0.1)
+    assert producer.is_alive()
+    assert handler.queue.get().msg == "first"
+    producer.join(timeout=1)
+    assert not producer.is_alive()
+    assert handler.queue.get().msg == "second"
+    assert handler.dropped == 0
+
+
+def test_flush_writes_out_every_queued_record(tmp_path):
+    logger = Logger("test_logger_flush", log_file_path=str(tmp_path), async_mode=True, batch_size=7)
+    try:
+        for number in range(250):
+            logger.info("record %s", number)
+        logger.flush()
+        lines = read_log(tmp_path)
+        assert len(lines) == 250
+        assert lines[-1].endswith("record 249")
+    finally:
+        logger.stop()
+
+
+def test_stop_writes_out_every_queued_record_and_reports_dropped_ones(tmp_path):
+    logger = Logger("test_logger_stop", log_file_path=str(tmp_path), async_mode=True, overflow_policy="drop")
+    for number in range(100):
+        logger.info("record %s", number)
+    logger.queue_handler.dropped += 2
+    logger.stop()
+    lines = read_log(tmp_path)
+    assert sum("INFO - record" in line for line in lines) == 100
+    assert lines[-1].endswith("2 log records were dropped because the log queue was full.")
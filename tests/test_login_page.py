@@ -1,6 +1,5 @@
 import allure
 import pytest
-from conftest import user_login_page
 from pages.login_page import LoginPage
 from utils.utils import get_test_data
 
@@ -0,0 +1,84 @@
+import json
+
+import variables
+from utils.network_capture import NetworkCapture, build_har_entries, load_timeseries, page_for_url
+
+
+def devtools_event(method, **params):
+    return {"message": json.dumps({"message": {"method": method, "params": params}})}
+
+
+def timed_driver(fake_driver, load_ms, current_url=variables.url_inventory_page + "?sort=az"):
+    """Returns a fake session whose documents all report the same navigation timings."""
+    driver = fake_driver(session_id="session-1", current_url=current_url)
+    driver.on_script = lambda script: navigation_sample(driver.current_url, load_ms)
+    return driver
+
+
+def navigation_sample(url, load_ms):
+    return {
+        "url": url,
+        "time_origin": 1700000000000.0,
+        "dns_ms": 0,
+        "connect_ms": 0,
+        "ttfb_ms": 120.0,
+        "dom_content_loaded_ms": 300.0,
+        "load_ms": load_ms,
+        "long_tasks": None,
+        "long_task_ms": None,
+        "transfer_bytes": 2048,
+        "status": 200,
+        "resources": [[variables.base_url + "/static/app.js", "script", 50.0, 40.0, 1024]],
+    }
+
+
+def test_urls_are_grouped_by_the_pages_of_variables():
+    assert page_for_url(variables.url_cart_page + "#top") == "url_cart_page"
+    assert page_for_url("https://example.com/unknown.html") == "/unknown.html"
+
+
+def test_devtools_network_events_become_har_entries():
+    entries = build_har_entries([
+        devtools_event(
+            "Network.requestWillBeSent", requestId="1", timestamp=10.0, wallTime=1700000000.0, type="Document",
+            request={"url": variables.url_login_page, "method": "GET", "headers": {"Accept": "text/html"}},
+        ),
+        devtools_event("Network.responseReceived", requestId="1", response={"status": 200, "mimeType": "text/html"}),
+        devtools_event("Network.loadingFinished", requestId="1", timestamp=10.25, encodedDataLength=512),
+    ])
+    assert entries[0]["time"] == 250.0
+    assert entries[0]["response"]["status"] == 200
+    assert entries[0]["response"]["bodySize"] == 512
+    assert entries[0]["_resourceType"] == "document"
+
+
+def test_budgets_fail_slow_pages_and_samples_are_stored_per_page(tmp_path, fake_driver):
+    capture = NetworkCapture(
+        enabled=True,
+        output_dir=str(tmp_path),
+        timeseries_file=str(tmp_path / "timeseries.jsonl"),
+        budgets={"*": {"ttfb_ms": 1000}, "url_inventory_page": {"load_ms": 1000}},
+    )
+    driver = timed_driver(fake_driver, load_ms=1500.0)
+    capture.activate(driver)
+    driver.get(variables.url_inventory_page)
+    assert capture.check_budgets(driver) == ["url_inventory_page load_ms was 1500 ms, over its 1000 ms budget"]
+    summary, performance_log = capture.end_test(driver, "tests/test_inventory.py::test_sort")
+    assert summary["requests"] == 2
+    assert performance_log == []
+    rows = load_timeseries(str(tmp_path / "timeseries.jsonl"))
+    assert [(row["page"], row["load_ms"], row["requests"]) for row in rows] == [("url_inventory_page", 1500.0, 2)]
+    assert (tmp_path / "tests_test_inventory.py_test_sort.har").exists()
+
+
+def test_client_side_route_changes_keep_the_page_the_document_was_loaded_for(tmp_path, fake_driver):
+    capture = NetworkCapture(enabled=True, output_dir=str(tmp_path), timeseries_file=str(tmp_path / "series.jsonl"))
+    driver = timed_driver(fake_driver, load_ms=800.0, current_url=variables.url_login_page)
+    capture.activate(driver)
+    driver.get(variables.url_login_page)
+    driver.current_url = variables.url_inventory_page
+    summary, _ = capture.end_test(driver, "test_login")
+    assert [(page["page"], page["route_changes"]) for page in summary["pages"]] == [
+        ("url_login_page", ["url_inventory_page"])
+    ]
+    assert [row["page"] for row in load_timeseries(str(tmp_path / "series.jsonl"))] == ["url_login_page"]
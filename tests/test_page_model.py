@@ -0,0 +1,29 @@
+import pytest
+from selenium.webdriver.common.by import By
+from pages.base_page import BasePage
+from pages.login_page import LoginPage
+from utils.page_model import Locator
+
+
+def test_page_locators_are_compiled_into_read_only_tables():
+    assert LoginPage.locators.USERNAME_FIELD == (By.ID, "user-name")
+    assert LoginPage.locators.IS_LOADING_OVERLAY is BasePage.IS_LOADING_OVERLAY
+    with pytest.raises(AttributeError):
+        LoginPage.locators.USERNAME_FIELD = (By.ID, "email")
+    assert not hasattr(LoginPage.locators, "__dict__")
+
+
+def test_misspelled_locators_fail_when_the_page_is_defined():
+    with pytest.raises(AttributeError, match=r"self.USERNAME_FEILD.*Did you mean self.USERNAME_FIELD\?"):
+        class TypoPage(BasePage):
+            USERNAME_FIELD = Locator(By.ID, "user-name")
+
+            def enter_username(self, username):
+                self.send_keys(self.USERNAME_FEILD, username)
+
+
+def test_invalid_locators_are_rejected():
+    with pytest.raises(ValueError):
+        Locator("identifier", "user-name")
+    with pytest.raises(ValueError):
+        Locator(By.ID, "")
@@ -0,0 +1,28 @@
+from types import SimpleNamespace
+
+from utils.parallel import DurationStore
+
+
+def test_durations_are_merged_into_the_file_and_loaded_back(tmp_path):
+    file_path = str(tmp_path / "durations" / "test_durations.json")
+    store = DurationStore(file_path)
+    store.record("tests/test_a.py::test_one", 1.5)
+    store.record("tests/test_a.py::test_one", 0.25)
+    store.pytest_runtest_logreport(SimpleNamespace(nodeid="tests/test_a.py::test_two", duration=3.0, skipped=False))
+    store.pytest_runtest_logreport(SimpleNamespace(nodeid="tests/test_a.py::test_skip", duration=9.0, skipped=True))
+    store.save()
+    assert DurationStore(file_path).durations == {"tests/test_a.py::test_one": 1.75, "tests/test_a.py::test_two": 3.0}
+
+
+def test_a_corrupted_file_is_ignored(tmp_path):
+    file_path = tmp_path / "test_durations.json"
+    file_path.write_text("{not json")
+    assert DurationStore(str(file_path)).durations == {}
+
+
+def test_tests_are_sorted_longest_first_with_unknown_ones_at_the_average(tmp_path):
+    store = DurationStore(str(tmp_path / "test_durations.json"))
+    store.durations = {"slow": 9.0, "fast": 1.0, "medium": 4.0}
+    items = [SimpleNamespace(nodeid=nodeid) for nodeid in ("fast", "new", "slow", "medium", "newer")]
+    store.sort_longest_first(items)
+    assert [item.nodeid for item in items] == ["slow", "new", "newer", "medium", "fast"]
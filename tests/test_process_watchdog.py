@@ -0,0 +1,42 @@
+import subprocess
+from types import SimpleNamespace
+from utils import process_watchdog as process_watchdog_module
+from utils.process_watchdog import ProcessWatchdog
+
+
+def make_driver(process):
+    return SimpleNamespace(session_id="session-1", service=SimpleNamespace(process=process))
+
+
+def test_processes_left_after_quit_are_killed():
+    process = subprocess.Popen(["sleep", "60"])
+    watchdog = ProcessWatchdog()
+    driver = make_driver(process)
+    watchdog.track(driver)
+    watchdog.reap(driver)
+    assert process.wait(timeout=5) != 0
+    assert watchdog.orphans_killed == 1
+
+
+def test_memory_growth_beyond_the_threshold_flags_the_test():
+    process = subprocess.Popen(["sleep", "60"])
+    watchdog = ProcessWatchdog(memory_growth_threshold_mb=-1)
+    driver = make_driver(process)
+    watchdog.track(driver)
+    watchdog.begin_test(driver)
+    memory = watchdog.end_test(driver, "test_checkout")
+    watchdog.reap(driver)
+    process.wait(timeout=5)
+    assert memory["rss_end_mb"] > 0
+    assert memory["flagged"]
+    assert watchdog.flagged_tests == [("test_checkout", memory)]
+
+
+def test_the_watchdog_turns_itself_off_without_process_information(monkeypatch):
+    monkeypatch.setattr(process_watchdog_module, "process_info_available", lambda: False)
+    watchdog = ProcessWatchdog(enabled=True)
+    driver = make_driver(SimpleNamespace(pid=1))
+    watchdog.track(driver)
+    watchdog.begin_test(driver)
+    assert not watchdog.enabled
+    assert watchdog.end_test(driver, "test_checkout") is None
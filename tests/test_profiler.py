@@ -0,0 +1,72 @@
+import json
+import time
+
+import pytest
+
+from utils import profiler as profiler_module
+from utils.profiler import ActionProfiler, profiled
+
+
+class CheckoutPage:
+    def __init__(self, driver, profiler):
+        self.driver = driver
+        self.profiler = profiler
+
+    @profiled
+    def find_element(self, locator):
+        with self.profiler.waiting():
+            time.sleep(0.02)
+        self.driver.execute("findElement", {"value": locator[1]})
+
+    @profiled
+    def finish(self):
+        self.find_element(("id", "finish"))
+
+
+@pytest.fixture
+def profiler(monkeypatch):
+    profiler = ActionProfiler()
+    profiler.enabled = True
+    profiler.current_test = "tests/test_cart.py::test_finish"
+    monkeypatch.setattr(profiler_module, "profiler", profiler)
+    return profiler
+
+
+def test_nested_actions_split_their_time_between_waits_round_trips_and_children(profiler, fake_driver):
+    driver = fake_driver(command_seconds=0.01)
+    profiler.instrument_driver(driver)
+    CheckoutPage(driver, profiler).finish()
+    inner = profiler.actions["CheckoutPage.find_element"]
+    outer = profiler.actions["CheckoutPage.finish"]
+    assert inner["wait"] >= 0.02
+    assert inner["round_trip"] >= 0.01
+    assert outer["wait"] == 0.0 and outer["round_trip"] == 0.0
+    assert outer["self"] < outer["total"] - 0.03
+    assert profiler.locators["id=finish"]["count"] == 1
+    assert profiler.tests["tests/test_cart.py::test_finish"]["count"] == 1
+
+
+def test_the_profile_is_saved_as_json_and_folded_stacks(profiler, tmp_path, fake_driver):
+    CheckoutPage(fake_driver(), profiler).finish()
+    profiler.save(str(tmp_path))
+    with open(tmp_path / "profile.json") as profile_file:
+        profile = json.load(profile_file)
+    assert [action["name"] for action in profile["slowest_actions"]] == [
+        "CheckoutPage.finish", "CheckoutPage.find_element"
+    ]
+    assert profile["pages"][0]["name"] == "CheckoutPage"
+    folded = (tmp_path / "profile.folded").read_text().splitlines()
+    stacks = dict(line.rsplit(" ", 1) for line in folded)
+    assert set(stacks) == {
+        "tests/test_cart.py::test_finish;CheckoutPage.finish",
+        "tests/test_cart.py::test_finish;CheckoutPage.finish;CheckoutPage.find_element(id=finish)",
+    }
+    assert all(int(microseconds) >= 1 for microseconds in stacks.values())
+
+
+def test_a_disabled_profiler_records_nothing(profiler, tmp_path, fake_driver):
+    profiler.enabled = False
+    CheckoutPage(fake_driver(), profiler).finish()
+    profiler.save(str(tmp_path))
+    assert profiler.actions == {}
+    assert list(tmp_path.iterdir()) == []
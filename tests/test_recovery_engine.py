@@ -0,0 +1,61 @@
+import time
+
+import pytest
+from selenium.common.exceptions import ElementClickInterceptedException
+from utils.recovery_engine import RecoveryEngine
+
+
+class StubStrategy:
+    actions = ("click",)
+
+    def __init__(self, name, works, delay=0.0, last_resort=False):
+        self.name = name
+        self.works = works
+        self.delay = delay
+        self.last_resort = last_resort
+        self.calls = 0
+
+    def apply(self, page, locator, action, text, timeout):
+        self.calls += 1
+        time.sleep(min(self.delay, timeout))
+        if not self.works:
+            raise ElementClickInterceptedException(f"{self.name} was intercepted")
+
+
+def make_engine(*strategies):
+    engine = RecoveryEngine()
+    for strategy in strategies:
+        engine.register(strategy)
+    engine.configure([strategy.name for strategy in strategies])
+    return engine
+
+
+def test_the_strategy_that_recovered_a_locator_is_tried_first_next_time():
+    failing, working = StubStrategy("failing", works=False), StubStrategy("working", works=True)
+    engine = make_engine(failing, working)
+    locator = ("id", "checkout")
+    error = ElementClickInterceptedException("intercepted")
+    assert engine.recover(None, locator, "click", time.monotonic() + 5, error) == "working"
+    assert engine.recover(None, locator, "click", time.monotonic() + 5, error) == "working"
+    assert failing.calls == 1
+    assert engine.stats["working"]["recovered"] == 2
+
+
+def test_recovery_stops_at_the_action_deadline():
+    slow, never_tried = StubStrategy("slow", works=False, delay=0.2), StubStrategy("never_tried", works=True)
+    engine = make_engine(slow, never_tried)
+    start = time.monotonic()
+    with pytest.raises(ElementClickInterceptedException, match="slow was intercepted"):
+        engine.recover(None, ("id", "finish"), "click", start + 0.1, ElementClickInterceptedException())
+    assert time.monotonic() - start < 0.15
+    assert never_tried.calls == 0
+
+
+def test_a_last_resort_strategy_stays_last_after_recovering():
+    last_resort = StubStrategy("last_resort", works=True, last_resort=True)
+    failing = StubStrategy("failing", works=False)
+    engine = make_engine(last_resort, failing)
+    locator = ("id", "menu")
+    error = ElementClickInterceptedException("intercepted")
+    assert engine.recover(None, locator, "click", time.monotonic() + 5, error) == "last_resort"
+    assert [strategy.name for strategy in engine.ordered_strategies("click", locator)] == ["failing", "last_resort"]
@@ -0,0 +1,31 @@
+import os
+
+import pytest
+from utils.screenshot_pipeline import ScreenshotPipeline
+
+
+def test_identical_screenshots_are_written_once(tmp_path, fake_driver):
+    pipeline = ScreenshotPipeline(str(tmp_path), image_format="png")
+    driver = fake_driver(frames=[b"frame", b"frame"])
+    first = pipeline.capture(driver, "test_one")
+    second = pipeline.capture(driver, "test_two")
+    pipeline.shutdown()
+    assert first is second
+    assert os.listdir(tmp_path) == ["test_one.png"]
+    assert pipeline.deduplicated == 1
+
+
+def test_screenshots_over_budget_are_dropped(tmp_path, fake_driver):
+    pipeline = ScreenshotPipeline(str(tmp_path), image_format="png", budget_mb=8 / (1024 * 1024))
+    driver = fake_driver(frames=[b"12345678", b"abcdefgh"])
+    first = pipeline.capture(driver, "test_one")
+    second = pipeline.capture(driver, "test_two")
+    pipeline.shutdown()
+    assert first.result()[0].endswith("test_one.png")
+    assert second.result() is None
+    assert pipeline.over_budget == 1
+
+
+def test_unknown_formats_are_rejected_when_the_pipeline_is_built(tmp_path):
+    with pytest.raises(ValueError, match="tiff"):
+        ScreenshotPipeline(str(tmp_path), image_format="tiff")
@@ -0,0 +1,82 @@
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
+from utils import wait_engine
+from utils.wait_engine import SmartWait, WaitStats, format_label
+
+
+@pytest.fixture
+def stats(monkeypatch):
+    stats = WaitStats()
+    monkeypatch.setattr(wait_engine, "wait_stats", stats)
+    return stats
+
+
+def condition_met_on_poll(poll, value="ready"):
+    calls = []
+
+    def condition(driver):
+        calls.append(driver)
+        if len(calls) < poll:
+            raise NoSuchElementException("not yet")
+        return value
+
+    condition.calls = calls
+    return condition
+
+
+def test_until_polls_until_the_condition_holds_and_records_the_wait(stats, fake_driver):
+    condition = condition_met_on_poll(3)
+    wait = SmartWait(fake_driver(), initial_poll=0.001, max_poll=0.002)
+    assert wait.until(condition, label=("find_element", (By.ID, "checkout"))) == "ready"
+    assert len(condition.calls) == 3
+    [recorded] = stats.slowest()
+    assert recorded["label"] == "find_element ('id', 'checkout')"
+    assert (recorded["count"], recorded["polls"], recorded["timeouts"]) == (1, 3, 0)
+
+
+def test_until_raises_timeout_with_the_message_and_records_it(stats, fake_driver):
+    wait = SmartWait(fake_driver(), initial_poll=0.001, max_poll=0.002)
+    with pytest.raises(TimeoutException, match="never ready"):
+        wait.until(lambda driver: False, "never ready", timeout=0.02, label="never")
+    assert stats.waits["never"]["timeouts"] == 1
+    assert stats.waits["never"]["polls"] > 1
+
+
+def test_until_not_returns_once_the_element_is_gone(stats, fake_driver):
+    wait = SmartWait(fake_driver(), initial_poll=0.001)
+    assert wait.until_not(condition_met_on_poll(99), label="gone") is True
+    assert stats.waits["gone"]["polls"] == 1
+
+
+def test_until_dom_resolves_in_one_round_trip(stats, fake_driver):
+    driver = fake_driver(async_results=[{"satisfied": True, "value": 4}])
+    assert SmartWait(driver).until_dom("return args[0] * 2;", 2, timeout=3, label=("in_page", "cart")) == 4
+    assert driver.script_timeout == 4
+    assert stats.waits[("in_page", "cart")]["polls"] == 1
+
+
+def test_until_dom_times_out_and_falls_back_to_polling(stats, fake_driver):
+    wait = SmartWait(fake_driver(async_results=[{"satisfied": False, "value": None}]))
+    with pytest.raises(TimeoutException, match="in_page cart"):
+        wait.until_dom("return false;", label=("in_page", "cart"))
+    driver = fake_driver(async_results=[WebDriverException("navigated away")], script_results=["polled"])
+    assert SmartWait(driver).until_dom("return true;", timeout=1, label="interrupted") == "polled"
+    assert driver.scripts == ["return (function (args) { return true; })(arguments);"]
+
+
+def test_labels_are_formatted_from_their_parts():
+    assert format_label(("clickable", (By.ID, "finish"))) == "clickable ('id', 'finish')"
+    assert format_label("custom") == "custom"
+
+
+def test_unlabeled_expected_conditions_are_recorded_under_their_locator(stats, fake_driver):
+    wait = SmartWait(fake_driver())
+    wait.until(EC.presence_of_element_located((By.ID, "checkout")))
+    wait.until(EC.presence_of_element_located((By.ID, "finish")))
+    labels = {recorded["label"] for recorded in stats.slowest()}
+    assert labels == {
+        "presence_of_element_located ('id', 'checkout')", "presence_of_element_located ('id', 'finish')"
+    }
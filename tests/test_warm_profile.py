@@ -0,0 +1,93 @@
+import os
+import shutil
+
+from utils import warm_profile
+from utils.warm_profile import WarmProfileManager, register_profile_clone, release_profile_clone
+
+
+def warm_launcher(fake_driver, cache_files=("f_000001", "index", "SingletonLock")):
+    """Returns a launch(profile_dir) that starts fake sessions writing cache_files into the profile's cache."""
+
+    def launch(profile_dir):
+        def write_cache(url):
+            for name in cache_files:
+                path = os.path.join(profile_dir, "Default", "Cache", name)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, "w") as cache_file:
+                    cache_file.write(url)
+
+        launch.drivers.append(fake_driver(session_id="warm-session", script_results=[250.0], on_get=write_cache))
+        return launch.drivers[-1]
+
+    launch.drivers = []
+    return launch
+
+
+def make_manager(tmp_path, clone_method):
+    settings = {
+        "enabled": True,
+        "template_dir": str(tmp_path / "template"),
+        "clone_dir": str(tmp_path),
+        "clone_method": clone_method,
+        "login": False,
+        "warm_urls": [],
+        "max_age_hours": 24,
+        "measure_first_paint": True,
+    }
+    return WarmProfileManager(settings, "chrome")
+
+
+def test_template_is_built_once_and_records_the_cold_first_paint(tmp_path, fake_driver):
+    manager = make_manager(tmp_path, "copy")
+    launch = warm_launcher(fake_driver)
+    manager.ensure_template(launch)
+    manager.ensure_template(launch)
+    assert len(launch.drivers) == 1
+    assert launch.drivers[0].quit_called
+    assert manager.template_cold_first_paint == 250.0
+    assert not os.path.exists(os.path.join(manager.template_dir, "Default", "Cache", "SingletonLock"))
+
+
+def test_clones_share_only_write_once_cache_blobs_and_are_deleted_on_release(tmp_path, fake_driver):
+    manager = make_manager(tmp_path, "hardlink")
+    manager.ensure_template(warm_launcher(fake_driver))
+    profile_dir = manager.clone()
+    template_cache = os.path.join(manager.template_dir, "Default", "Cache")
+    clone_cache = os.path.join(profile_dir, "Default", "Cache")
+    assert os.path.samefile(os.path.join(template_cache, "f_000001"), os.path.join(clone_cache, "f_000001"))
+    assert not os.path.samefile(os.path.join(template_cache, "index"), os.path.join(clone_cache, "index"))
+    driver = fake_driver()
+    register_profile_clone(driver, profile_dir)
+    release_profile_clone(driver)
+    assert not os.path.exists(profile_dir)
+
+
+def test_template_builds_without_fcntl_or_cp(tmp_path, monkeypatch, fake_driver):
+    monkeypatch.setattr(warm_profile, "fcntl", None)
+    monkeypatch.setattr(shutil, "which", lambda name: None)
+    manager = make_manager(tmp_path, "auto")
+    manager.ensure_template(warm_launcher(fake_driver))
+    profile_dir = manager.clone()
+    assert os.path.isfile(os.path.join(profile_dir, "Default", "Cache", "f_000001"))
+    assert not os.path.exists(f"{manager.template_dir}.lockdir")
+
+
+def test_simple_cache_entries_are_copied(tmp_path, fake_driver):
+    manager = make_manager(tmp_path, "hardlink")
+    manager.ensure_template(warm_launcher(fake_driver, ("Cache_Data/4f2a9c1e0b7d3a58_0", "index")))
+    assert manager._clone_tree(manager.template_dir, str(tmp_path / "clone")) == "copy"
+    entry = os.path.join("Default", "Cache", "Cache_Data", "4f2a9c1e0b7d3a58_0")
+    assert not os.path.samefile(os.path.join(manager.template_dir, entry), str(tmp_path / "clone" / entry))
+
+
+def test_login_session_is_not_saved_into_the_template(tmp_path, monkeypatch, fake_driver):
+    from pages import login_page
+
+    monkeypatch.setattr(login_page.LoginPage, "__init__", lambda self, driver: None)
+    monkeypatch.setattr(login_page.LoginPage, "login", lambda self, username, password: None)
+    manager = make_manager(tmp_path, "copy")
+    manager.login = True
+    launch = warm_launcher(fake_driver)
+    manager.ensure_template(launch)
+    assert launch.drivers[0].cookies_deleted
+    assert "window.localStorage.clear(); window.sessionStorage.clear();" in launch.drivers[0].scripts
@@ -0,0 +1,174 @@
+import json
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.errorhandler import ErrorHandler
+
+from utils.logger_instance import logger
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+
+def to_w3c_locator(locator):
+    """Converts a Selenium locator to a W3C location strategy, the same way Selenium's WebDriver does."""
+    by, value = locator
+    if by == By.ID:
+        return "css selector", f'[id="{value}"]'
+    if by == By.CLASS_NAME:
+        return "css selector", f".{value}"
+    if by == By.NAME:
+        return "css selector", f'[name="{value}"]'
+    return by, value
+
+
+class AsyncCommandTransport:
+    def __init__(self, pool_size=100, keepalive_timeout=30, timeout=120):
+        """Pooled keep-alive HTTP client shared by every AsyncWebDriver session of an event loop.
+
+        aiohttp is an optional dependency: install the "async" extra to use the async page-object API.
+        """
+        if aiohttp is None:
+            raise ImportError('The async page-object API needs aiohttp. Install it with: pip install ".[async]"')
+        self.logger = logger
+        self.pool_size = pool_size
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self._session = None
+        self._error_handler = ErrorHandler()
+        self.commands_sent = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    @property
+    def session(self):
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=self.pool_size, keepalive_timeout=self.keepalive_timeout)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={"Accept": "application/json", "Content-Type": "application/json;charset=UTF-8"},
+            )
+        return self._session
+
+    async def request(self, method, url, payload=None):
+        """Sends one WebDriver command and returns its "value", raising the matching Selenium exception."""
+        self.commands_sent += 1
+        body = json.dumps(payload) if payload is not None else None
+        try:
+            async with self.session.request(method, url, data=body) as response:
+                data = await response.text()
+                status = response.status
+        except aiohttp.ClientError as e:
+            raise WebDriverException(f"The WebDriver command {method} {url} couldn't be sent. Error: {e}")
+        if status >= 400:
+            self._error_handler.check_response({"status": status, "value": data.strip()})
+        return json.loads(data).get("value") if data else None
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class AsyncWebElement:
+    def __init__(self, driver, element_id):
+        """Awaitable counterpart of WebElement, addressing the element by its W3C reference."""
+        self.driver = driver
+        self.id = element_id
+
+    async def _command(self, method, command, payload=None):
+        return await self.driver.execute(method, f"/element/{self.id}/{command}", payload)
+
+    async def click(self):
+        await self._command("POST", "click", {})
+
+    async def clear(self):
+        await self._command("POST", "clear", {})
+
+    async def send_keys(self, text):
+        await self._command("POST", "value", {"text": str(text)})
+
+    async def text(self):
+        return await self._command("GET", "text")
+
+    async def tag_name(self):
+        return await self._command("GET", "name")
+
+    async def get_property(self, name):
+        return await self._command("GET", f"property/{name}")
+
+    async def is_displayed(self):
+        return await self._command("GET", "displayed")
+
+    async def is_enabled(self):
+        return await self._command("GET", "enabled")
+
+
+class AsyncWebDriver:
+    def __init__(self, transport, server_url, session_id, service=None):
+        """One WebDriver session driven over the shared async transport."""
+        self.transport = transport
+        self.server_url = server_url.rstrip("/")
+        self.session_id = session_id
+        self.service = service
+
+    @classmethod
+    async def create(cls, transport, server_url, capabilities, service=None):
+        """Opens a new WebDriver session on a running driver server, such as chromedriver or a Selenium Grid."""
+        value = await transport.request(
+            "POST", f"{server_url.rstrip('/')}/session", {"capabilities": {"alwaysMatch": capabilities}}
+        )
+        return cls(transport, server_url, value["sessionId"], service)
+
+    async def execute(self, method, command, payload=None):
+        return await self.transport.request(method, f"{self.server_url}/session/{self.session_id}{command}", payload)
+
+    async def get(self, url):
+        await self.execute("POST", "/url", {"url": url})
+
+    async def current_url(self):
+        return await self.execute("GET", "/url")
+
+    async def title(self):
+        return await self.execute("GET", "/title")
+
+    async def find_element(self, locator):
+        using, value = to_w3c_locator(locator)
+        element = await self.execute("POST", "/element", {"using": using, "value": value})
+        return AsyncWebElement(self, element[ELEMENT_KEY])
+
+    async def find_elements(self, locator):
+        using, value = to_w3c_locator(locator)
+        elements = await self.execute("POST", "/elements", {"using": using, "value": value})
+        return [AsyncWebElement(self, element[ELEMENT_KEY]) for element in elements]
+
+    async def execute_script(self, script, *args):
+        arguments = [{ELEMENT_KEY: arg.id} if isinstance(arg, AsyncWebElement) else arg for arg in args]
+        return await self.execute("POST", "/execute/sync", {"script": script, "args": arguments})
+
+    async def back(self):
+        await self.execute("POST", "/back", {})
+
+    async def refresh(self):
+        await self.execute("POST", "/refresh", {})
+
+    async def set_window_size(self, width, height):
+        await self.execute("POST", "/window/rect", {"width": width, "height": height})
+
+    async def quit(self):
+        """Deletes the session and stops the driver service it was started with, if any."""
+        try:
+            await self.transport.request("DELETE", f"{self.server_url}/session/{self.session_id}")
+        finally:
+            if self.service is not None:
+                self.service.stop()
@@ -0,0 +1,124 @@
+import json
+import time
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.logger_instance import logger
+
+
+class AuthStateCache:
+    READ_STORAGE_SCRIPT = (
+        "return {local: Object.assign({}, window.localStorage), session: Object.assign({}, window.sessionStorage)};"
+    )
+    WRITE_STORAGE_SCRIPT = (
+        "const [local, session] = arguments;"
+        "for (const [key, value] of Object.entries(local)) window.localStorage.setItem(key, value);"
+        "for (const [key, value] of Object.entries(session)) window.sessionStorage.setItem(key, value);"
+    )
+    SEED_STORAGE_SOURCE = "(function () {" + WRITE_STORAGE_SCRIPT.replace("arguments", "[%s, %s]") + "})();"
+
+    def __init__(self, landing_url, max_age=300):
+        """Captures the authenticated cookies and web storage of each user once and replays them in later tests.
+
+        landing_url is the page an authenticated user lands on (inventory.html). Captured states older than
+        max_age seconds, with expired cookies, or that get bounced back to the login page are refreshed.
+        """
+        self.logger = logger
+        self.landing_url = landing_url
+        self.max_age = max_age
+        self._states = {}
+        self.ui_logins = 0
+        self.injected_logins = 0
+
+    def login(self, driver, username, ui_login):
+        """Logs the user in, replaying a captured state when possible and falling back to ui_login(driver)."""
+        self.logger.log_method_entry(self.login.__name__)
+        state = self._states.get(username)
+        if state is not None and self._is_fresh(state):
+            self.logger.info("Injecting the captured session of %s", username)
+            self._inject(driver, state)
+            if self._is_authenticated(driver):
+                self.injected_logins += 1
+                return
+            self.logger.warning("The captured session of %s is stale. Logging in through the UI again.", username)
+        self._states.pop(username, None)
+        ui_login(driver)
+        self.ui_logins += 1
+        self._states[username] = self._capture(driver)
+
+    def invalidate(self, username=None):
+        """Forgets the captured state of one user, or of every user."""
+        if username is None:
+            self._states.clear()
+        else:
+            self._states.pop(username, None)
+
+    def _capture(self, driver):
+        """Captures the cookies and web storage of the current, authenticated page."""
+        storage = driver.execute_script(self.READ_STORAGE_SCRIPT)
+        return {
+            "cookies": driver.get_cookies(),
+            "local_storage": storage["local"],
+            "session_storage": storage["session"],
+            "captured_at": time.time(),
+        }
+
+    def _is_fresh(self, state):
+        """Returns False if the state is too old or one of its cookies has already expired."""
+        now = time.time()
+        if now - state["captured_at"] > self.max_age:
+            return False
+        return all(cookie.get("expiry", now + 1) > now for cookie in state["cookies"])
+
+    def _is_authenticated(self, driver):
+        """Returns True if the browser stayed on the landing page instead of being sent back to log in."""
+        return driver.current_url.split("?")[0] == self.landing_url
+
+    def _inject(self, driver, state):
+        """Seeds cookies and web storage, then loads the landing page."""
+        if hasattr(driver, "execute_cdp_cmd"):
+            self._inject_before_navigation(driver, state)
+        else:
+            self._inject_on_origin(driver, state)
+
+    def _inject_before_navigation(self, driver, state):
+        """Uses DevTools to seed the state before the first navigation, so only the landing page is loaded."""
+        for cookie in state["cookies"]:
+            cdp_cookie = {
+                "name": cookie["name"],
+                "value": cookie["value"],
+                "domain": cookie.get("domain"),
+                "path": cookie.get("path", "/"),
+                "secure": cookie.get("secure", False),
+                "httpOnly": cookie.get("httpOnly", False),
+            }
+            if "expiry" in cookie:
+                cdp_cookie["expires"] = cookie["expiry"]
+            if "sameSite" in cookie:
+                cdp_cookie["sameSite"] = cookie["sameSite"]
+            driver.execute_cdp_cmd("Network.setCookie", cdp_cookie)
+        script = driver.execute_cdp_cmd(
+            "Page.addScriptToEvaluateOnNewDocument",
+            {
+                "source": self.SEED_STORAGE_SOURCE
+                % (json.dumps(state["local_storage"]), json.dumps(state["session_storage"]))
+            },
+        )
+        try:
+            driver.get(self.landing_url)
+        finally:
+            driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": script["identifier"]})
+
+    def _inject_on_origin(self, driver, state):
+        """Loads a cheap resource on the same origin so the cookies and storage can be set there."""
+        parts = urlsplit(self.landing_url)
+        driver.get(f"{parts.scheme}://{parts.netloc}/favicon.ico")
+        for cookie in state["cookies"]:
+            try:
+                driver.add_cookie(cookie)
+            except WebDriverException as e:
+                self.logger.warning("Couldn't inject the cookie %s. Error: %s", cookie["name"], e)
+        driver.execute_script(self.WRITE_STORAGE_SCRIPT, state["local_storage"], state["session_storage"])
+        driver.get(self.landing_url)
+
@@ -0,0 +1,176 @@
+import json
+import os
+
+from utils.logger_instance import logger
+from utils.process_utils import get_available_memory_bytes
+
+
+CHROMIUM_BROWSERS = ("chrome", "chromium", "brave", "edge")
+
+CHROMIUM_LEAN_ARGUMENTS = [
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-dev-shm-usage",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--mute-audio",
+]
+
+FIREFOX_LEAN_PREFS = {
+    "layers.acceleration.disabled": True,
+    "gfx.webrender.software": True,
+    "extensions.update.enabled": False,
+    "app.update.auto": False,
+    "browser.shell.checkDefaultBrowser": False,
+    "browser.startup.homepage_override.mstone": "ignore",
+    "datareporting.policy.dataSubmissionEnabled": False,
+    "dom.timeout.enable_budget_timer_throttling": False,
+    "media.autoplay.default": 5,
+}
+
+BROWSER_PRESETS = {
+    "ci-fast": {
+        "headless": True,
+        "viewport": [1366, 768],
+        "no_sandbox": True,
+        "chromium_arguments": CHROMIUM_LEAN_ARGUMENTS,
+        "firefox_prefs": FIREFOX_LEAN_PREFS,
+    },
+    "low-memory": {
+        "headless": True,
+        "viewport": [1024, 768],
+        "no_sandbox": True,
+        "chromium_arguments": CHROMIUM_LEAN_ARGUMENTS + [
+            "--renderer-process-limit=1",
+            "--disable-site-isolation-trials",
+            "--disk-cache-size=1",
+            "--media-cache-size=1",
+            "--js-flags=--max-old-space-size=256",
+        ],
+        "firefox_prefs": dict(
+            FIREFOX_LEAN_PREFS,
+            **{
+                "dom.ipc.processCount": 1,
+                "fission.autostart": False,
+                "browser.cache.disk.enable": False,
+                "browser.cache.memory.capacity": 16384,
+                "browser.sessionhistory.max_total_viewers": 0,
+            },
+        ),
+    },
+    "debug": {
+        "headless": False,
+        "viewport": [1366, 768],
+        "no_sandbox": False,
+        "chromium_arguments": ["--auto-open-devtools-for-tabs", "--no-first-run", "--no-default-browser-check"],
+        "firefox_arguments": ["-devtools"],
+        "firefox_prefs": {"devtools.toolbox.host": "bottom"},
+    },
+}
+
+
+def sandbox_is_unavailable():
+    """Chromium's sandbox can't start as root or inside most containers, so it is only disabled there."""
+    return (hasattr(os, "geteuid") and os.geteuid() == 0) or os.path.exists("/.dockerenv")
+
+
+class BrowserPreset:
+    def __init__(self, name, browser):
+        """Named bundle of headless flags, browser settings and a fixed viewport for one browser.
+
+        An empty name keeps the default behaviour: a headed browser with a maximized window.
+        """
+        if name and name not in BROWSER_PRESETS:
+            raise KeyError(f"Unknown browser preset: {name}. Available presets: {', '.join(BROWSER_PRESETS)}.")
+        self.logger = logger
+        self.name = name or None
+        self.browser = browser
+        self.settings = BROWSER_PRESETS.get(name, {})
+
+    @property
+    def viewport(self):
+        return self.settings.get("viewport")
+
+    def apply_to_options(self, options):
+        """Adds the preset's headless flag, arguments and prefs to the browser options."""
+        if self.name is None:
+            return
+        width, height = self.viewport
+        if self.browser in CHROMIUM_BROWSERS:
+            if self.settings["headless"]:
+                options.add_argument("--headless=new")
+            options.add_argument(f"--window-size={width},{height}")
+            if self.settings["no_sandbox"] and sandbox_is_unavailable():
+                options.add_argument("--no-sandbox")
+            for argument in self.settings["chromium_arguments"]:
+                options.add_argument(argument)
+        elif self.browser == "firefox":
+            if self.settings["headless"]:
+                options.add_argument("-headless")
+            options.add_argument(f"--width={width}")
+            options.add_argument(f"--height={height}")
+            for argument in self.settings.get("firefox_arguments", []):
+                options.add_argument(argument)
+            for name, value in self.settings["firefox_prefs"].items():
+                options.set_preference(name, value)
+
+    def apply_window(self, web_driver):
+        """Sizes the window to the preset viewport, or maximizes it when no preset is selected."""
+        if self.viewport is None:
+            web_driver.maximize_window()
+        else:
+            web_driver.set_window_size(*self.viewport)
+
+
+class PresetStats:
+    def __init__(self):
+        """Records the startup time and resident memory of every browser launched with a preset."""
+        self.launches = {}
+
+    def record(self, preset, browser, startup_seconds, rss_bytes):
+        key = f"{preset or 'default'}/{browser}"
+        stats = self.launches.setdefault(
+            key, {"count": 0, "startup_total": 0.0, "rss_max": 0, "rss_total": 0, "rss_samples": 0}
+        )
+        stats["count"] += 1
+        stats["startup_total"] += startup_seconds
+        if rss_bytes:
+            stats["rss_total"] += rss_bytes
+            stats["rss_samples"] += 1
+            stats["rss_max"] = max(stats["rss_max"], rss_bytes)
+
+    def summary(self):
+        """Returns the mean startup time and memory per preset and browser, with how many such browsers fit."""
+        available_memory = get_available_memory_bytes()
+        summary = []
+        for key, stats in self.launches.items():
+            rss_mean = stats["rss_total"] / stats["rss_samples"] if stats["rss_samples"] else 0
+            summary.append(
+                {
+                    "preset": key,
+                    "launches": stats["count"],
+                    "startup_mean": stats["startup_total"] / stats["count"],
+                    "rss_mean": rss_mean,
+                    "rss_max": stats["rss_max"],
+                    "browsers_that_fit": int(available_memory // stats["rss_max"])
+                    if available_memory and stats["rss_max"]
+                    else None,
+                }
+            )
+        return summary
+
+    def save(self, file_path):
+        if not self.launches:
+            return
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+        with open(file_path, "w") as stats_file:
+            json.dump(self.summary(), stats_file, indent=4)
+
+
+preset_stats = PresetStats()
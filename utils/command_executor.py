@@ -0,0 +1,116 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from selenium.webdriver.firefox.remote_connection import FirefoxRemoteConnection
+from selenium.webdriver.remote.client_config import ClientConfig
+
+from utils.logger_instance import logger
+
+
+class PooledCommandMixin:
+    """Counts the traffic of a Selenium remote connection and keeps a tuned pool of keep-alive connections."""
+
+    def _init_stats(self):
+        self.stats = {"commands": 0, "bytes_sent": 0, "bytes_received": 0, "round_trip_total": 0.0}
+        self._stats_lock = threading.Lock()
+        request = self._conn.request
+
+        def counting_request(method, url, body=None, **kwargs):
+            response = request(method, url, body=body, **kwargs)
+            with self._stats_lock:
+                self.stats["bytes_received"] += len(response.data or b"")
+            return response
+
+        self._conn.request = counting_request
+
+    def _request(self, method, url, body=None):
+        start = time.perf_counter()
+        try:
+            return super()._request(method, url, body=body)
+        finally:
+            with self._stats_lock:
+                self.stats["commands"] += 1
+                self.stats["bytes_sent"] += len(body.encode() if isinstance(body, str) else body or b"")
+                self.stats["round_trip_total"] += time.perf_counter() - start
+
+    def snapshot(self):
+        """Returns a copy of the counters, to be passed to summary() later."""
+        with self._stats_lock:
+            return dict(self.stats)
+
+    def summary(self, since=None):
+        """Returns the command count, bytes sent and received, and the mean round-trip time in milliseconds.
+
+        With since, a snapshot() taken earlier, only the traffic after the snapshot is counted.
+        """
+        stats = self.snapshot()
+        if since is not None:
+            stats = {key: value - since[key] for key, value in stats.items()}
+        commands = stats["commands"]
+        return {
+            "commands": commands,
+            "bytes_sent": stats["bytes_sent"],
+            "bytes_received": stats["bytes_received"],
+            "mean_round_trip_ms": round(stats["round_trip_total"] / commands * 1000, 3) if commands else 0.0,
+        }
+
+
+class PooledChromiumConnection(PooledCommandMixin, ChromiumRemoteConnection):
+    def __init__(self, remote_server_addr, vendor_prefix, browser_name, pool_size=4, timeout=120):
+        client_config = _client_config(remote_server_addr, pool_size, timeout)
+        super().__init__(remote_server_addr, vendor_prefix, browser_name, client_config=client_config)
+        self._init_stats()
+
+
+class PooledFirefoxConnection(PooledCommandMixin, FirefoxRemoteConnection):
+    def __init__(self, remote_server_addr, pool_size=4, timeout=120):
+        client_config = _client_config(remote_server_addr, pool_size, timeout)
+        super().__init__(remote_server_addr, client_config=client_config)
+        self._init_stats()
+
+
+def _client_config(remote_server_addr, pool_size, timeout):
+    return ClientConfig(
+        remote_server_addr,
+        keep_alive=True,
+        timeout=timeout,
+        init_args_for_pool_manager={"init_args_for_pool_manager": {"maxsize": pool_size, "block": True}},
+    )
+
+
+def create_pooled_connection(browser, remote_server_addr, pool_size=4, timeout=120):
+    """Returns a keep-alive command executor for the browser, or None if the browser has no tuned executor."""
+    if browser == "chrome":
+        return PooledChromiumConnection(remote_server_addr, "goog", "chrome", pool_size, timeout)
+    if browser == "edge":
+        return PooledChromiumConnection(remote_server_addr, "ms", "MicrosoftEdge", pool_size, timeout)
+    if browser == "firefox":
+        return PooledFirefoxConnection(remote_server_addr, pool_size, timeout)
+    return None
+
+
+def use_pooled_connection(web_driver, browser, pool_size=4, timeout=120):
+    """Moves a running WebDriver session onto a pooled keep-alive executor pointing at the same driver server."""
+    old_executor = web_driver.command_executor
+    executor = create_pooled_connection(browser, old_executor._client_config.remote_server_addr, pool_size, timeout)
+    if executor is None:
+        return web_driver
+    web_driver.command_executor = executor
+    old_executor.close()
+    logger.debug("The %s session uses a pooled executor with %s keep-alive connections.", browser, pool_size)
+    return web_driver
+
+
+def batch_execute(web_driver, commands, max_workers=4):
+    """Sends independent WebDriver commands concurrently and returns their results in order.
+
+    commands is a list of (command, params) tuples, for example (Command.GET_TITLE, {}). Every command goes
+    out on its own pooled keep-alive connection rather than being pipelined, which WebDriver servers don't
+    support. Only batch commands that don't depend on each other; most drivers still run the commands of
+    one session one after another, so the gain is the overlapped network latency, mostly against a grid.
+    """
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(commands)) or 1) as executor:
+        futures = [executor.submit(web_driver.execute, command, dict(params)) for command, params in commands]
+        return [future.result()["value"] for future in futures]
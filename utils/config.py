@@ -1,28 +1,50 @@
 import os
 from urllib.parse import urljoin
-from dotenv import load_dotenv
 
-load_dotenv()
+from utils.config_loader import load_environment
+
+
+class _EnvValue:
+    """Class attribute read from the environment (and the .env file) on first access instead of at import."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        load_environment()
+        return os.getenv(self.name)
+
+
+class _JoinedUrl:
+    """Class attribute joining a path onto a base URL attribute, or None while the base URL isn't set."""
+
+    def __init__(self, base_attribute, path):
+        self.base_attribute = base_attribute
+        self.path = path
+
+    def __get__(self, instance, owner):
+        base_url = getattr(owner, self.base_attribute)
+        return urljoin(base_url + "/", self.path) if base_url else None
 
 
 class Config:
     # Base URLs
-    CENTRAL_BASE_URL = os.getenv("BASE_URL")
-    
+    CENTRAL_BASE_URL = _EnvValue("BASE_URL")
+    INSTITUTION_BASE_URL = _EnvValue("INSTITUTION_BASE_URL")
 
     # Credentials
-    CENTRAL_USERNAME = os.getenv("CENTRAL_USERNAME")
-    CENTRAL_PASSWORD = os.getenv("CENTRAL_PASSWORD")
-    INSTITUTION_USERNAME = os.getenv("INSTITUTION_USERNAME")
-    INSTITUTION_PASSWORD = os.getenv("INSTITUTION_PASSWORD")
+    CENTRAL_USERNAME = _EnvValue("CENTRAL_USERNAME")
+    CENTRAL_PASSWORD = _EnvValue("CENTRAL_PASSWORD")
+    INSTITUTION_USERNAME = _EnvValue("INSTITUTION_USERNAME")
+    INSTITUTION_PASSWORD = _EnvValue("INSTITUTION_PASSWORD")
 
     # Central URLs
-    CENTRAL_LOGIN_PAGE_URL = CENTRAL_BASE_URL
-    ADD_INSTITUTION_USER_URL = urljoin(CENTRAL_BASE_URL + "/", "users_institution/add")
-    ADD_BOD_URL = urljoin(CENTRAL_BASE_URL + "/", "bod/add")
-    BOD_MANAGEMENT_PAGE = urljoin(CENTRAL_BASE_URL + "/", "bod")
+    CENTRAL_LOGIN_PAGE_URL = _EnvValue("BASE_URL")
+    ADD_INSTITUTION_USER_URL = _JoinedUrl("CENTRAL_BASE_URL", "users_institution/add")
+    ADD_BOD_URL = _JoinedUrl("CENTRAL_BASE_URL", "bod/add")
+    BOD_MANAGEMENT_PAGE = _JoinedUrl("CENTRAL_BASE_URL", "bod")
 
     # Institution URLs
-    INSTITUTION_LOGIN_PAGE_URL = INSTITUTION_BASE_URL
-    INSTITUTION_DASHBOARD_URL = urljoin(INSTITUTION_BASE_URL + "/", "analytical_dashboard")
-    INSTITUTION_USER_MANAGEMENT_URL = urljoin(INSTITUTION_BASE_URL + "/", "users_institution")
+    INSTITUTION_LOGIN_PAGE_URL = _EnvValue("INSTITUTION_BASE_URL")
+    INSTITUTION_DASHBOARD_URL = _JoinedUrl("INSTITUTION_BASE_URL", "analytical_dashboard")
+    INSTITUTION_USER_MANAGEMENT_URL = _JoinedUrl("INSTITUTION_BASE_URL", "users_institution")
@@ -1,38 +1,177 @@
+import copy
 import json
+import os
+import threading
+
+from dotenv import load_dotenv
 
 from utils.logger_instance import logger
 
 
+ENV_OVERRIDE_PREFIX = "SAUCEDEMO_CONFIG_"
+
+_dotenv_loaded = False
+_cache = {}
+_cache_lock = threading.Lock()
+_overrides = {}
+
+
+def load_environment():
+    """Loads the .env file into the process environment, once per process."""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        load_dotenv()
+        _dotenv_loaded = True
+
+
+def set_overrides(overrides):
+    """Sets process-wide overrides, such as the ones given on the command line, as {"section.key": value}."""
+    _overrides.clear()
+    _overrides.update(overrides)
+    invalidate()
+
+
+def invalidate():
+    """Drops every cached configuration view so the next access re-reads the file."""
+    with _cache_lock:
+        _cache.clear()
+
+
+def parse_override_value(value):
+    """Parses an override given as text: JSON values (numbers, booleans, lists) or plain strings."""
+    try:
+        return json.loads(value)
+    except json.JSONDecodeError:
+        return value
+
+
+def _env_overrides():
+    """Collects overrides from SAUCEDEMO_CONFIG_<SECTION>__<KEY> environment variables."""
+    load_environment()
+    overrides = {}
+    for name, value in os.environ.items():
+        if name.startswith(ENV_OVERRIDE_PREFIX):
+            path = name[len(ENV_OVERRIDE_PREFIX):].lower().replace("__", ".")
+            overrides[path] = parse_override_value(value)
+    return overrides
+
+
+def _apply_override(config, path, value):
+    keys = path.split(".")
+    section = config
+    for key in keys[:-1]:
+        section = section.setdefault(key, {})
+    section[keys[-1]] = value
+
+
+def _coerce(value, default):
+    """Converts an override to the type of its default value where that is unambiguous."""
+    if default is None or isinstance(value, type(default)):
+        return value
+    if isinstance(default, bool):
+        return str(value).lower() in ("1", "true", "yes", "on")
+    if isinstance(default, (int, float)):
+        try:
+            return type(default)(value)
+        except (TypeError, ValueError):
+            logger.warning(
+                "The configuration value %r isn't a valid %s, the default %r is used instead.",
+                value, type(default).__name__, default,
+            )
+            return default
+    if isinstance(default, list) and isinstance(value, str):
+        return [item.strip() for item in value.split(",") if item.strip()]
+    return value
+
+
 class ConfigLoader:
-    def __init__(self, config_path="config/config.json"):
-        """Initializes the ConfigLoader with the path to the configuration file."""
+    def __init__(self, config_path="config/config.json", watch=False):
+        """Initializes the ConfigLoader with the path to the configuration file.
+
+        The file is parsed once per process and shared by every ConfigLoader; environment and command-line
+        overrides are applied on top. With watch=True the file's mtime is checked on every access and the
+        cached view is rebuilt when it changes, for long-running watch modes.
+        """
         self.config_path = config_path
+        self.watch = watch
         self.logger = logger
-        self.config = self._load_config_file()
+
+    @property
+    def config(self):
+        """A copy of the cached, merged configuration as a dictionary; changing it doesn't affect other loaders."""
+        return copy.deepcopy(self._cached_config())
+
+    def _cached_config(self):
+        """Returns the cached, merged configuration shared by every ConfigLoader. Callers must not modify it."""
+        entry = _cache.get(self.config_path)
+        if entry is not None and (not self.watch or entry["mtime"] == self._mtime()):
+            return entry["config"]
+        with _cache_lock:
+            entry = _cache.get(self.config_path)
+            if entry is None or (self.watch and entry["mtime"] != self._mtime()):
+                entry = {"mtime": self._mtime(), "config": self._load_config_file()}
+                _cache[self.config_path] = entry
+            return entry["config"]
+
+    def _mtime(self):
+        try:
+            return os.stat(self.config_path).st_mtime_ns
+        except FileNotFoundError:
+            return None
 
     def _load_config_file(self):
-        """Loads the configuration file and returns its content as a dictionary."""
+        """Loads the configuration file and returns its content, with overrides applied, as a dictionary."""
         self.logger.log_method_entry(self._load_config_file.__name__)
         try:
-            self.logger.info(f"Loading configuration file from {self.config_path}")
+            self.logger.info("Loading configuration file from %s", self.config_path)
             with open(self.config_path) as config_file:
                 config_data = json.load(config_file)
-                self.logger.info(f"The configuration file has been loaded from {self.config_path} successfully.")
-                return config_data
+            for path, value in {**_env_overrides(), **_overrides}.items():
+                self.logger.info("Overriding the configuration value %s with %r", path, value)
+                _apply_override(config_data, path, value)
+            self.logger.info("The configuration file has been loaded from %s successfully.", self.config_path)
+            return config_data
         except FileNotFoundError as e:
             self.logger.error("The configuration file wasn't found.")
             raise FileNotFoundError(f"The configuration file {self.config_path} was not found. Error: {e}")
 
+    def get(self, path, default=None):
+        """Returns (a copy of) the value at a dotted path such as "driver_pool.max_uses", or the default."""
+        value = self._cached_config()
+        for key in path.split("."):
+            if not isinstance(value, dict) or key not in value:
+                return default
+            value = value[key]
+        return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+
+    def get_str(self, path, default=""):
+        return str(self.get(path, default))
+
+    def get_int(self, path, default=0):
+        return _coerce(self.get(path, default), int(default))
+
+    def get_float(self, path, default=0.0):
+        return _coerce(self.get(path, default), float(default))
+
+    def get_bool(self, path, default=False):
+        return _coerce(self.get(path, default), bool(default))
+
+    def get_list(self, path, default=None):
+        return _coerce(self.get(path, default or []), [])
+
+    def _get_section(self, name, defaults):
+        """Returns a section merged over its defaults, with every value coerced to its default's type."""
+        section = copy.deepcopy(defaults)
+        for key, value in copy.deepcopy(self._cached_config().get(name, {})).items():
+            section[key] = _coerce(value, defaults.get(key))
+        self.logger.debug("The %s settings are : %s", name, section)
+        return section
+
     def get_specified_browser(self):
         """Retrieves the specified browser from the configuration file."""
-        self.logger.log_method_entry(self.get_specified_browser.__name__)
         try:
-            self.logger.info("Retrieving the specified browser from the configuration file")
-            specified_browser = self.config["browser"]
-            self.logger.info(
-                f"The specified browser which is : {specified_browser} has been retrieved from "
-                f"{self.config_path} successfully."
-            )
+            specified_browser = self._cached_config()["browser"]
+            self.logger.debug("The specified browser is : %s", specified_browser)
             return specified_browser
         except KeyError as e:
             self.logger.error('No "browser" key in the configuration file.')
@@ -40,15 +179,117 @@ class ConfigLoader:
 
     def get_browser_options(self):
         """Retrieves the browser options from the configuration file."""
-        self.logger.log_method_entry(self.get_browser_options.__name__)
         try:
-            self.logger.info("Retrieving the browser options from the configuration file")
-            browser_options = self.config["browser_options"]
-            self.logger.info(
-                "Successfully retrieved the browser options from the configuration file. "
-                f"The browser options are : {browser_options}"
-            )
+            browser_options = copy.deepcopy(self._cached_config()["browser_options"])
+            self.logger.debug("The browser options are : %s", browser_options)
             return browser_options
         except KeyError as e:
             self.logger.error('No "browser_options" key in the configuration file.')
             raise KeyError(f'The "browser_options" key is missing in the configuration file. Error: {e}')
+
+    def get_browser_preset_settings(self):
+        """Retrieves the browser performance preset settings from the configuration file."""
+        return self._get_section("browser_preset", {"name": "", "stats_dir": "reports/browser_presets"})
+
+    def get_command_executor_settings(self):
+        """Retrieves the WebDriver command transport settings from the configuration file."""
+        return self._get_section("command_executor", {"pooled": False, "pool_size": 4, "timeout": 120})
+
+    def get_warm_profile_settings(self):
+        """Retrieves the warm browser profile settings from the configuration file."""
+        return self._get_section(
+            "warm_profile",
+            {
+                "enabled": False,
+                "template_dir": ".cache/warm_profile",
+                "clone_dir": "",
+                "clone_method": "auto",
+                "login": True,
+                "warm_urls": [],
+                "max_age_hours": 24,
+                "measure_first_paint": True,
+            },
+        )
+
+    def get_driver_pool_settings(self):
+        """Retrieves the driver pool settings from the configuration file."""
+        return self._get_section("driver_pool", {"enabled": True, "max_uses": 20})
+
+    def get_parallel_settings(self):
+        """Retrieves the parallel execution settings from the configuration file."""
+        return self._get_section(
+            "parallel",
+            {
+                "workers": 4,
+                "durations_file": "reports/test_durations.json",
+                "screenshots_dir": "reports/screenshots",
+            },
+        )
+
+    def get_fast_auth_settings(self):
+        """Retrieves the fast authentication settings from the configuration file."""
+        return self._get_section("fast_auth", {"max_age": 300})
+
+    def get_lean_mode_settings(self):
+        """Retrieves the lean mode (resource blocking) settings from the configuration file."""
+        return self._get_section(
+            "lean_mode",
+            {
+                "enabled": False,
+                "blocked_resource_types": [],
+                "blocked_url_patterns": [],
+                "learn_catalog": False,
+                "catalog_file": "reports/lean_mode_catalog.json",
+            },
+        )
+
+    def get_profiler_settings(self):
+        """Retrieves the page action profiler settings from the configuration file."""
+        return self._get_section("profiler", {"enabled": False, "output_dir": "reports/profile"})
+
+    def get_local_server_settings(self):
+        """Retrieves the settings of the bundled local SauceDemo server from the configuration file."""
+        return self._get_section("local_server", {"enabled": False, "performance_glitch_delay_ms": 2500})
+
+    def get_watchdog_settings(self):
+        """Retrieves the browser process watchdog settings from the configuration file."""
+        return self._get_section(
+            "watchdog", {"enabled": True, "memory_growth_threshold_mb": 150, "kill_orphans": True}
+        )
+
+    def get_impact_analysis_settings(self):
+        """Retrieves the test impact analysis settings from the configuration file."""
+        return self._get_section(
+            "impact_analysis", {"record": False, "map_dir": "reports/impact_map", "tracked_dirs": ["pages"]}
+        )
+
+    def get_network_capture_settings(self):
+        """Retrieves the per-test HAR and navigation timing capture settings from the configuration file."""
+        return self._get_section(
+            "network_capture",
+            {
+                "enabled": False,
+                "output_dir": "reports/network",
+                "save_har": True,
+                "timeseries_file": "reports/network/timeseries.jsonl",
+                "budgets": {},
+                "regression_tolerance_pct": 0,
+                "history": 20,
+            },
+        )
+
+    def get_recovery_settings(self):
+        """Retrieves the order of the action recovery strategies from the configuration file."""
+        return self._get_section(
+            "recovery", {"strategies": ["wait_for_overlay", "scroll", "action_chains", "js_click"]}
+        )
+
+    def get_screenshot_settings(self):
+        """Retrieves the failure screenshot settings from the configuration file."""
+        return self._get_section(
+            "screenshots", {"format": "webp", "quality": 70, "max_workers": 2, "budget_mb": 100, "deduplicate": True}
+        )
+
+    def get_dom_snapshot_settings(self):
+        """Retrieves the failure DOM snapshot settings from the configuration file."""
+        return self._get_section("dom_snapshots", {"on_failure": True, "compress_level": 6})
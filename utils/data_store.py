@@ -0,0 +1,90 @@
+import copy
+import csv
+import json
+import os
+import threading
+
+from utils.logger_instance import logger
+
+
+STREAMING_FORMATS = (".jsonl", ".csv")
+
+
+class DataStore:
+    def __init__(self, data_dir="data"):
+        """Parses every test data file once per process and caches the key indexes built on top of it.
+
+        JSON files are loaded whole. JSON Lines and CSV files are streamed row by row; each row names the
+        group it belongs to in its "key" column (the equivalent of a top-level key of a JSON file).
+        """
+        self.logger = logger
+        self.data_dir = data_dir
+        self._documents = {}
+        self._indexes = {}
+        self._lock = threading.Lock()
+
+    def path(self, file_name):
+        return os.path.join(self.data_dir, file_name)
+
+    def load(self, file_name):
+        """Returns a copy of the parsed content of a JSON file, so callers cannot change the cached document."""
+        return copy.deepcopy(self._document(file_name))
+
+    def _document(self, file_name):
+        """Returns the cached parsed content of a JSON file, parsing it on first use only."""
+        document = self._documents.get(file_name)
+        if document is None:
+            with self._lock:
+                document = self._documents.get(file_name)
+                if document is None:
+                    self.logger.info("Parsing the test data file %s", self.path(file_name))
+                    with open(self.path(file_name), "r") as data_file:
+                        document = json.load(data_file)
+                    self._documents[file_name] = document
+        return document
+
+    def get_records(self, file_name, main_key):
+        """Returns a copy of the list of records under main_key, or None if the key is missing."""
+        return copy.deepcopy(self._records(file_name, main_key))
+
+    def _records(self, file_name, main_key):
+        if file_name.endswith(STREAMING_FORMATS):
+            return list(self.iter_rows(file_name, main_key)) or None
+        document = self._document(file_name)
+        if not isinstance(document, dict):
+            return None
+        return document.get(main_key)
+
+    def get_tuples(self, file_name, main_key, data_keys):
+        """Returns the records under main_key as tuples of the data_keys values, from a cached index."""
+        index_key = (file_name, main_key, tuple(data_keys))
+        index = self._indexes.get(index_key)
+        if index is None:
+            records = self._records(file_name, main_key) or []
+            index = [tuple(record[key] for key in data_keys) for record in records]
+            self._indexes[index_key] = index
+        return copy.deepcopy(index)
+
+    def iter_rows(self, file_name, main_key=None):
+        """Streams the rows of a JSON Lines or CSV file without loading the whole file into memory."""
+        with open(self.path(file_name), "r", newline="") as data_file:
+            if file_name.endswith(".csv"):
+                rows = csv.DictReader(data_file)
+            else:
+                rows = (json.loads(line) for line in data_file if line.strip())
+            for row in rows:
+                if main_key is None or row.get("key") == main_key:
+                    yield row
+
+    def iter_tuples(self, file_name, main_key, data_keys):
+        """Streams the rows under main_key as tuples of the data_keys values."""
+        for row in self.iter_rows(file_name, main_key):
+            yield tuple(row[key] for key in data_keys)
+
+    def clear(self):
+        """Forgets every parsed file and index."""
+        self._documents.clear()
+        self._indexes.clear()
+
+
+data_store = DataStore()
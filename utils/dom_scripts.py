@@ -0,0 +1,163 @@
+from selenium.webdriver.common.by import By
+
+
+# Resolves every element matching a locator and reads text, attributes, visibility and the bounding box
+# of each one, plus the text of optional child fields (resolved relative to the element, see to_js_query), so a
+# whole list is read in one round-trip.
+BULK_READ_SCRIPT = """
+const [kind, query, attributes, fields] = arguments;
+function resolve(root, kind, query) {
+    if (kind === "xpath") {
+        const found = document.evaluate(query, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        const nodes = [];
+        for (let i = 0; i < found.snapshotLength; i++) nodes.push(found.snapshotItem(i));
+        return nodes;
+    }
+    return Array.from(root.querySelectorAll(query));
+}
+function isVisible(el) {
+    const style = window.getComputedStyle(el);
+    return style.display !== "none" && style.visibility !== "hidden" && style.opacity !== "0"
+        && el.getClientRects().length > 0;
+}
+return resolve(document, kind, query).map((el) => {
+    const rect = el.getBoundingClientRect();
+    const data = {
+        text: (el.innerText || "").trim(),
+        visible: isVisible(el),
+        rect: {x: rect.x, y: rect.y, width: rect.width, height: rect.height},
+        attributes: {},
+        fields: {},
+    };
+    for (const name of attributes) data.attributes[name] = el.getAttribute(name);
+    for (const [name, [fieldKind, fieldQuery]] of Object.entries(fields)) {
+        const child = resolve(el, fieldKind, fieldQuery)[0];
+        data.fields[name] = child ? (child.innerText || "").trim() : null;
+    }
+    return data;
+});
+"""
+
+# Returns the text of every option of a <select> element, or null if the element isn't a <select>.
+SELECT_OPTIONS_SCRIPT = """
+const select = arguments[0];
+if (select.tagName.toLowerCase() !== "select") return null;
+return Array.from(select.options).map((option) => option.text.trim());
+"""
+
+# SmartWait.until_dom condition body: returns the first element matching args = [kind, query] once it is visible.
+VISIBLE_ELEMENT_CONDITION = """
+const [kind, query] = args;
+const el = kind === "xpath"
+    ? document.evaluate(query, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+    : document.querySelector(query);
+if (!el) return null;
+const style = window.getComputedStyle(el);
+const visible = style.display !== "none" && style.visibility !== "hidden" && el.getClientRects().length > 0;
+return visible ? el : null;
+"""
+
+# Serializes the document into nested [tag, attributes, visible, children] arrays (text nodes are plain strings,
+# visible is 0 for hidden, 1 for inline and 2 for block-level elements),
+# with the live value of form fields, checked and selected states and the computed visibility of every element.
+DOM_SNAPSHOT_SCRIPT = """
+const SKIPPED = new Set(["SCRIPT", "STYLE", "NOSCRIPT", "TEMPLATE"]);
+function isVisible(el) {
+    const style = window.getComputedStyle(el);
+    return style.display !== "none" && style.visibility !== "hidden" && style.opacity !== "0"
+        && el.getClientRects().length > 0;
+}
+function serialize(node) {
+    if (node.nodeType === Node.TEXT_NODE) return node.nodeValue || null;
+    if (node.nodeType !== Node.ELEMENT_NODE || SKIPPED.has(node.tagName)) return null;
+    const attributes = {};
+    for (const attribute of node.attributes) attributes[attribute.name] = attribute.value;
+    if (["INPUT", "TEXTAREA", "SELECT"].includes(node.tagName)) attributes.value = node.value;
+    if (node.type === "checkbox" || node.type === "radio") {
+        if (node.checked) attributes.checked = "checked"; else delete attributes.checked;
+    }
+    if (node.tagName === "OPTION") {
+        if (node.selected) attributes.selected = "selected"; else delete attributes.selected;
+    }
+    const children = [];
+    for (const child of node.childNodes) {
+        const serialized = serialize(child);
+        if (serialized !== null) children.push(serialized);
+    }
+    const visible = isVisible(node) ? (window.getComputedStyle(node).display.startsWith("inline") ? 1 : 2) : 0;
+    return [node.tagName.toLowerCase(), attributes, visible, children];
+}
+return {url: location.href, title: document.title, root: serialize(document.documentElement)};
+"""
+
+
+def to_js_query(locator, relative=False):
+    """Translates a Selenium locator into a ("css" | "xpath", query) pair that can be resolved in the page.
+
+    With relative=True, XPaths are made relative to the element they are resolved from, as
+    find_element does when called on a WebElement.
+    """
+    by, value = locator
+    if by == By.XPATH:
+        return "xpath", _relative_xpath(value) if relative else value
+    if by == By.CSS_SELECTOR:
+        return "css", value
+    if by == By.ID:
+        return "css", f'[id="{_css_string(value)}"]'
+    if by == By.NAME:
+        return "css", f'[name="{_css_string(value)}"]'
+    if by == By.CLASS_NAME:
+        return "css", f'[class~="{_css_string(value)}"]'
+    if by == By.TAG_NAME:
+        return "css", value
+    if by == By.LINK_TEXT:
+        return "xpath", f"{'.' if relative else ''}//a[normalize-space(.)={_xpath_literal(value)}]"
+    if by == By.PARTIAL_LINK_TEXT:
+        return "xpath", f"{'.' if relative else ''}//a[contains(., {_xpath_literal(value)})]"
+    raise ValueError(f"The locator strategy {by} can't be resolved inside the page.")
+
+
+def _css_string(value):
+    """Escapes a value for a double-quoted CSS string."""
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def _xpath_literal(value):
+    """Quotes a value as an XPath 1.0 string literal, which has no escapes, using concat() if needed."""
+    if '"' not in value:
+        return f'"{value}"'
+    if "'" not in value:
+        return f"'{value}'"
+    parts = value.split('"')
+    return "concat(" + ", '\"', ".join(f'"{part}"' for part in parts) + ")"
+
+
+def _relative_xpath(xpath):
+    """Prefixes every absolute location path of an XPath with "." so it is resolved from the context element.
+
+    Handles unions and parenthesized paths such as "(//a)[1] | //b"; paths inside predicates are left as they are.
+    """
+    result = []
+    quote = None
+    brackets = 0
+    path_start = True
+    for char in xpath:
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char == "[":
+            brackets += 1
+        elif char == "]":
+            brackets -= 1
+        elif char == "|" and not brackets:
+            path_start = True
+            result.append(char)
+            continue
+        if path_start and not char.isspace() and char != "(":
+            if char == "/":
+                result.append(".")
+            path_start = False
+        result.append(char)
+    return "".join(result)
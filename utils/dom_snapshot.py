@@ -0,0 +1,259 @@
+import gzip
+import json
+import os
+import re
+import time
+import xml.etree.ElementTree as ET
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from utils.logger_instance import logger
+
+
+_CSS_TOKEN = re.compile(
+    r"\s*(?P<combinator>>)\s*"
+    r"|(?P<space>\s+)"
+    r"|(?P<tag>\*|[a-zA-Z][\w-]*)"
+    r"|#(?P<id>[\w-]+)"
+    r"|\.(?P<class>[\w-]+)"
+    r"|\[\s*(?P<attr>[\w-]+)\s*(?:(?P<op>[~^$*|]?=)\s*(?P<quote>[\"']?)(?P<value>.*?)(?P=quote)\s*)?\]"
+)
+
+
+def _parse_compound_selectors(selector):
+    """Parses one CSS selector into [(combinator, compound)] from left to right, where a compound is a dict."""
+    steps = []
+    compound = {}
+    combinator = " "
+    position = 0
+    selector = selector.strip()
+    while position < len(selector):
+        match = _CSS_TOKEN.match(selector, position)
+        if match is None or match.end() == position:
+            raise ValueError(f"The CSS selector {selector!r} isn't supported by the DOM snapshot engine.")
+        position = match.end()
+        if match.group("combinator") or match.group("space"):
+            if compound:
+                steps.append((combinator, compound))
+            compound = {}
+            combinator = ">" if match.group("combinator") else " "
+        elif match.group("tag"):
+            compound["tag"] = match.group("tag").lower()
+        elif match.group("id"):
+            compound.setdefault("attributes", []).append(("id", "=", match.group("id")))
+        elif match.group("class"):
+            compound.setdefault("attributes", []).append(("class", "~=", match.group("class")))
+        else:
+            compound.setdefault("attributes", []).append((match.group("attr"), match.group("op"), match.group("value")))
+    if not compound:
+        raise ValueError(f"The CSS selector {selector!r} is empty or ends with a combinator.")
+    steps.append((combinator, compound))
+    return steps
+
+
+def _attribute_matches(actual, operator, expected):
+    if actual is None:
+        return False
+    if operator is None:
+        return True
+    if operator == "=":
+        return actual == expected
+    if operator == "~=":
+        return expected in actual.split()
+    if operator == "^=":
+        return actual.startswith(expected)
+    if operator == "$=":
+        return actual.endswith(expected)
+    if operator == "*=":
+        return expected in actual
+    return actual == expected or actual.startswith(expected + "-")
+
+
+def _compound_matches(element, compound):
+    if compound.get("tag", "*") not in ("*", element.tag):
+        return False
+    return all(
+        _attribute_matches(element.get(name), operator, expected)
+        for name, operator, expected in compound.get("attributes", ())
+    )
+
+
+def _normalize_space(text):
+    return " ".join(text.split())
+
+
+class DomSnapshot:
+    def __init__(self, payload, captured_at=None):
+        """Read-only copy of a page's DOM, visibility and form state, captured in a single round-trip.
+
+        Assertions can query it with Selenium locators (ID, NAME, CLASS_NAME, TAG_NAME, simple CSS selectors,
+        the XPath subset of ElementTree and link texts) without going back to the browser.
+        """
+        self.logger = logger
+        self.payload = payload
+        self.url = payload.get("url", "")
+        self.title = payload.get("title", "")
+        self.captured_at = captured_at or time.time()
+        self._visible = {}
+        self._block = set()
+        self.root = self._build(payload["root"])
+        self._parents = {child: parent for parent in self.root.iter() for child in parent}
+
+    @classmethod
+    def load(cls, path):
+        """Loads a snapshot saved with save(), for offline debugging of a failure."""
+        with gzip.open(path, "rt", encoding="utf-8") as snapshot_file:
+            data = json.load(snapshot_file)
+        return cls(data["payload"], captured_at=data.get("captured_at"))
+
+    def _build(self, node):
+        tag, attributes, visible, children = node
+        element = ET.Element(tag, attributes)
+        self._visible[element] = bool(visible)
+        if visible == 2:
+            self._block.add(element)
+        last_child = None
+        for child in children:
+            if isinstance(child, str):
+                if last_child is None:
+                    element.text = (element.text or "") + child
+                else:
+                    last_child.tail = (last_child.tail or "") + child
+            else:
+                last_child = self._build(child)
+                element.append(last_child)
+        return element
+
+    def find_all(self, locator):
+        """Returns every element of the snapshot that has this locator, in document order."""
+        by, value = locator
+        if by == By.ID:
+            return [element for element in self.root.iter() if element.get("id") == value]
+        if by == By.NAME:
+            return [element for element in self.root.iter() if element.get("name") == value]
+        if by == By.CLASS_NAME:
+            return [element for element in self.root.iter() if value in element.get("class", "").split()]
+        if by == By.TAG_NAME:
+            return list(self.root.iter(value.lower()))
+        if by == By.CSS_SELECTOR:
+            return self._select_css(value)
+        if by == By.XPATH:
+            return self._select_xpath(value)
+        if by == By.LINK_TEXT:
+            return [element for element in self.root.iter("a") if self._visible_text(element) == value]
+        if by == By.PARTIAL_LINK_TEXT:
+            return [element for element in self.root.iter("a") if value in self._visible_text(element)]
+        raise ValueError(f"The locator strategy {by} isn't supported by the DOM snapshot engine.")
+
+    def find(self, locator):
+        """Returns the first element that has this locator, or raises NoSuchElementException."""
+        elements = self.find_all(locator)
+        if not elements:
+            raise NoSuchElementException(f"No element with the locator {locator} in the DOM snapshot of {self.url}.")
+        return elements[0]
+
+    def _select_css(self, selector):
+        selectors = [_parse_compound_selectors(part) for part in selector.split(",")]
+        return [
+            element for element in self.root.iter() if any(self._matches_steps(element, steps) for steps in selectors)
+        ]
+
+    def _matches_steps(self, element, steps):
+        combinator, compound = steps[-1]
+        if not _compound_matches(element, compound):
+            return False
+        if len(steps) == 1:
+            return True
+        parent = self._parents.get(element)
+        if combinator == ">":
+            return parent is not None and self._matches_steps(parent, steps[:-1])
+        while parent is not None:
+            if self._matches_steps(parent, steps[:-1]):
+                return True
+            parent = self._parents.get(parent)
+        return False
+
+    def _select_xpath(self, xpath):
+        if xpath == "//html":
+            return [self.root]
+        if xpath.startswith("/html"):
+            path = "." + xpath[len("/html"):]
+        elif xpath.startswith("//"):
+            path = "." + xpath
+        elif xpath.startswith("/"):
+            raise ValueError(f"The XPath {xpath!r} doesn't start at the html element.")
+        else:
+            path = xpath
+        try:
+            elements = self.root.findall(path)
+        except (SyntaxError, KeyError, TypeError) as e:
+            raise ValueError(f"The XPath {xpath!r} isn't supported by the DOM snapshot engine. Error: {e}")
+        return elements
+
+    def _visible_text(self, element):
+        """Concatenates the visible text like WebElement.text, with block-level elements on their own "line"."""
+        return _normalize_space(self._raw_visible_text(element))
+
+    def _raw_visible_text(self, element):
+        if not self._visible[element]:
+            return ""
+        parts = [element.text or ""]
+        for child in element:
+            child_text = self._raw_visible_text(child)
+            parts.append(f" {child_text} " if child in self._block else child_text)
+            parts.append(child.tail or "")
+        return "".join(parts)
+
+    def exists(self, locator):
+        return bool(self.find_all(locator))
+
+    def count(self, locator):
+        return len(self.find_all(locator))
+
+    def is_visible(self, locator):
+        """Returns True if the first element that has this locator was rendered when the snapshot was taken."""
+        elements = self.find_all(locator)
+        return bool(elements) and self._visible[elements[0]]
+
+    def text(self, locator):
+        """Returns the visible text of the first element that has this locator, as WebElement.text would.
+
+        Whitespace is collapsed, so the line breaks WebElement.text puts between block-level elements are spaces.
+        """
+        return self._visible_text(self.find(locator))
+
+    def texts(self, locator, visible_only=True):
+        """Returns the text of every element that has this locator."""
+        return [
+            self._visible_text(element) if visible_only else _normalize_space("".join(element.itertext()))
+            for element in self.find_all(locator)
+            if self._visible[element] or not visible_only
+        ]
+
+    def value(self, locator):
+        """Returns the current value of the form field that has this locator."""
+        return self.find(locator).get("value", "")
+
+    def attribute(self, locator, name):
+        return self.find(locator).get(name)
+
+    def is_checked(self, locator):
+        return self.find(locator).get("checked") is not None
+
+    def selected_options(self, locator):
+        """Returns the text of the selected options of the dropdown that has this locator."""
+        return [
+            _normalize_space("".join(option.itertext()))
+            for option in self.find(locator).iter("option")
+            if option.get("selected") is not None
+        ]
+
+    def save(self, path, compress_level=6):
+        """Writes the snapshot as gzipped JSON and returns the path."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        data = {"captured_at": self.captured_at, "payload": self.payload}
+        with gzip.open(path, "wt", encoding="utf-8", compresslevel=compress_level) as snapshot_file:
+            json.dump(data, snapshot_file, separators=(",", ":"))
+        self.logger.info("The DOM snapshot of %s has been saved to %s", self.url, path)
+        return path
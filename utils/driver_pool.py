@@ -0,0 +1,139 @@
+import os
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.logger_instance import logger
+from utils.process_watchdog import process_watchdog
+from utils.warm_profile import release_profile_clone
+from utils.webdriver_initializer import WebDriverInitializer
+
+
+class DriverPool:
+    CLEAR_STORAGE_SCRIPT = (
+        "try { window.localStorage.clear(); } catch (e) {}"
+        "try { window.sessionStorage.clear(); } catch (e) {}"
+    )
+
+    def __init__(self, max_uses=20, max_idle=1, window_size=None):
+        """Keeps warm WebDriver sessions alive for the whole test session and hands out clean ones.
+
+        Reused sessions get their window resized to window_size, or maximized when it is None.
+        """
+        self.logger = logger
+        self.window_size = window_size
+        self.max_uses = max_uses
+        self.max_idle = max_idle
+        self.worker_id = os.getenv("PYTEST_XDIST_WORKER", "main")
+        self._idle = []
+        self._uses = {}
+        self.launches = 0
+        self.acquisitions = 0
+        self.recycled = 0
+        self.crashed = 0
+
+    @property
+    def launches_saved(self):
+        """Returns how many browser launches were avoided by reusing warm sessions."""
+        return self.acquisitions - self.launches
+
+    def acquire(self):
+        """Returns a clean WebDriver session, reusing an idle one when possible."""
+        self.logger.log_method_entry(self.acquire.__name__)
+        while self._idle:
+            web_driver = self._idle.pop()
+            try:
+                self._reset_session(web_driver)
+                self.logger.info(f"[{self.worker_id}] Reusing a warm WebDriver session: {web_driver.session_id}")
+                self.acquisitions += 1
+                return web_driver
+            except WebDriverException as e:
+                self.logger.warning(f"[{self.worker_id}] A pooled WebDriver session couldn't be reset. Error: {e}")
+                self.crashed += 1
+                self._discard(web_driver)
+        web_driver = self._launch()
+        self.acquisitions += 1
+        return web_driver
+
+    def release(self, web_driver, healthy=True):
+        """Returns a WebDriver session to the pool, or recycles it if it's worn out or crashed."""
+        self.logger.log_method_entry(self.release.__name__)
+        self._uses[web_driver] = self._uses.get(web_driver, 0) + 1
+        if not healthy and not self._is_alive(web_driver):
+            self.logger.warning(f"[{self.worker_id}] The WebDriver session crashed. Recycling it.")
+            self.crashed += 1
+            self._discard(web_driver)
+        elif self._uses[web_driver] >= self.max_uses:
+            self.logger.info(
+                f"[{self.worker_id}] The WebDriver session reached {self.max_uses} uses. Recycling it."
+            )
+            self.recycled += 1
+            self._discard(web_driver)
+        elif len(self._idle) >= self.max_idle:
+            self._discard(web_driver)
+        else:
+            self._idle.append(web_driver)
+
+    def shutdown(self):
+        """Quits every idle WebDriver session kept by the pool."""
+        self.logger.log_method_entry(self.shutdown.__name__)
+        while self._idle:
+            self._discard(self._idle.pop())
+        self.logger.info(
+            f"[{self.worker_id}] Driver pool summary: {self.acquisitions} sessions handed out, "
+            f"{self.launches} browser launches, {self.launches_saved} launches saved."
+        )
+
+    def summary(self):
+        """Returns the pool statistics as a dictionary."""
+        return {
+            "worker": self.worker_id,
+            "acquisitions": self.acquisitions,
+            "launches": self.launches,
+            "launches_saved": self.launches_saved,
+            "recycled": self.recycled,
+            "crashed": self.crashed,
+        }
+
+    def _launch(self):
+        """Launches a brand-new WebDriver session."""
+        self.logger.info(f"[{self.worker_id}] Launching a new WebDriver session...")
+        web_driver = WebDriverInitializer().initialize_webdriver()
+        self.launches += 1
+        self._uses[web_driver] = 0
+        return web_driver
+
+    def _reset_session(self, web_driver):
+        """Clears cookies, web storage and extra windows so the session looks freshly launched."""
+        handles = web_driver.window_handles
+        for handle in handles[1:]:
+            web_driver.switch_to.window(handle)
+            web_driver.close()
+        web_driver.switch_to.window(handles[0])
+        web_driver.execute_script(self.CLEAR_STORAGE_SCRIPT)
+        if hasattr(web_driver, "execute_cdp_cmd"):
+            web_driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        else:
+            web_driver.delete_all_cookies()
+        web_driver.get("about:blank")
+        if self.window_size is None:
+            web_driver.maximize_window()
+        else:
+            web_driver.set_window_size(*self.window_size)
+
+    def _is_alive(self, web_driver):
+        """Returns True if the WebDriver session still answers commands."""
+        try:
+            web_driver.window_handles
+            return True
+        except WebDriverException:
+            return False
+
+    def _discard(self, web_driver):
+        """Quits a WebDriver session and forgets about it."""
+        self._uses.pop(web_driver, None)
+        try:
+            web_driver.quit()
+        except WebDriverException as e:
+            self.logger.warning(f"[{self.worker_id}] Failed to quit a WebDriver session cleanly. Error: {e}")
+        process_watchdog.reap(web_driver)
+        release_profile_clone(web_driver)
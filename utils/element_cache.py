@@ -0,0 +1,85 @@
+from selenium.common.exceptions import StaleElementReferenceException, WebDriverException
+
+from utils.logger_instance import logger
+
+
+class ElementCacheStats:
+    def __init__(self):
+        """Counts element cache hits and misses across every page object of the process."""
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.invalidations = 0
+
+    def summary(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+            "invalidations": self.invalidations,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "round_trips_saved": self.hits,
+        }
+
+
+element_cache_stats = ElementCacheStats()
+
+
+class ElementCache:
+    def __init__(self, driver, track_url=False):
+        """Per-page cache of resolved WebElements, keyed by locator.
+
+        A cached element is only returned after a single is_displayed() call proves it is still attached and
+        visible, which replaces the find_element round-trip. Stale elements are dropped as soon as they are
+        detected. With track_url the whole cache is also dropped when the URL changes, at the cost of one
+        extra round-trip per lookup; navigation done through BasePage invalidates the cache either way.
+        """
+        self.driver = driver
+        self.track_url = track_url
+        self.logger = logger
+        self._elements = {}
+        self._url = None
+
+    def get(self, locator, clickable=False):
+        """Returns the cached WebElement of the locator if it is still usable, otherwise None."""
+        web_element = self._elements.get(locator)
+        if web_element is not None and self.track_url and self.driver.current_url != self._url:
+            self.invalidate()
+            web_element = None
+        if web_element is None:
+            element_cache_stats.misses += 1
+            return None
+        try:
+            usable = web_element.is_displayed() and (not clickable or web_element.is_enabled())
+        except StaleElementReferenceException:
+            self.logger.debug("The cached WebElement of %s went stale.", locator)
+            element_cache_stats.stale += 1
+            usable = False
+        except WebDriverException:
+            usable = False
+        if not usable:
+            self._elements.pop(locator, None)
+            element_cache_stats.misses += 1
+            return None
+        element_cache_stats.hits += 1
+        return web_element
+
+    def put(self, locator, web_element):
+        if self.track_url and not self._elements:
+            self._url = self.driver.current_url
+        self._elements[locator] = web_element
+        return web_element
+
+    def invalidate(self, locator=None):
+        """Drops the cached WebElement of one locator, or of every locator when none is given."""
+        if locator is not None:
+            self._elements.pop(locator, None)
+            return
+        if self._elements:
+            element_cache_stats.invalidations += 1
+        self._elements.clear()
+        self._url = None
+
+    def __len__(self):
+        return len(self._elements)
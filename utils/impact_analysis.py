@@ -0,0 +1,252 @@
+import ast
+import functools
+import glob
+import inspect
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+
+from utils.logger_instance import logger
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HUNK_HEADER = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+
+
+class ImpactRecorder:
+    def __init__(self, tracked_dirs=("pages",)):
+        """Records which page classes, page methods and locators every test touches.
+
+        Dependencies are stored as "<file>::<qualified name>", for example "pages/cart_page.py::CartPage.finish_button",
+        so they can be matched against the symbols changed in a git diff.
+        """
+        self.logger = logger
+        self.enabled = False
+        self.current_test = None
+        self.tracked_dirs = tuple(os.path.join(PROJECT_ROOT, tracked_dir) + os.sep for tracked_dir in tracked_dirs)
+        self.tests = {}
+        self._file_names = {}
+        self._locator_names = {}
+
+    def record(self, page=None, locator=None, method=None):
+        """Records the page class, the page method being called and the ones on the call stack, and the locator
+        for the current test."""
+        if not self.enabled or self.current_test is None:
+            return
+        dependencies = self.tests.setdefault(self.current_test, {"files": set(), "classes": set(), "symbols": set()})
+        if method is not None:
+            file_name = self._relative_file(method.__code__.co_filename)
+            if file_name is not None:
+                dependencies["symbols"].add(f"{file_name}::{method.__qualname__}")
+        for klass in type(page).__mro__[:-1] if page is not None else ():
+            file_name = self._relative_file(sys.modules[klass.__module__].__dict__.get("__file__", ""))
+            if file_name is not None:
+                dependencies["files"].add(file_name)
+                dependencies["classes"].add(f"{file_name}::{klass.__qualname__}")
+        frame = sys._getframe(1)
+        while frame is not None:
+            file_name = self._relative_file(frame.f_code.co_filename)
+            if file_name is not None:
+                dependencies["symbols"].add(f"{file_name}::{frame.f_code.co_qualname}")
+            frame = frame.f_back
+        if isinstance(locator, tuple):
+            locator_name = self._locator_name(type(page), locator)
+            if locator_name is not None:
+                dependencies["symbols"].add(locator_name)
+
+    def _relative_file(self, file_path):
+        if file_path not in self._file_names:
+            absolute_path = os.path.abspath(file_path) if file_path else ""
+            self._file_names[file_path] = (
+                os.path.relpath(absolute_path, PROJECT_ROOT).replace(os.sep, "/")
+                if absolute_path.startswith(self.tracked_dirs)
+                else None
+            )
+        return self._file_names[file_path]
+
+    def _locator_name(self, page_class, locator):
+        """Returns the "<file>::<Class>.<attribute>" name of a locator declared on the page class or its bases."""
+        names = self._locator_names.get(page_class)
+        if names is None:
+            names = {}
+            for klass in reversed(page_class.__mro__[:-1]):
+                file_name = self._relative_file(sys.modules[klass.__module__].__dict__.get("__file__", ""))
+                for name, value in vars(klass).items():
+                    if file_name is not None and isinstance(value, tuple) and len(value) == 2:
+                        names[value] = f"{file_name}::{klass.__qualname__}.{name}"
+            self._locator_names[page_class] = names
+        return names.get(locator)
+
+    def save(self, file_path):
+        """Writes the dependencies of the tests that ran, merged over the ones recorded by earlier runs."""
+        if not self.tests:
+            return
+        impact_map = _read_map_file(file_path) if os.path.exists(file_path) else {}
+        recorded_at = time.time()
+        for test, dependencies in self.tests.items():
+            impact_map[test] = {key: sorted(values) for key, values in dependencies.items()}
+            impact_map[test]["recorded_at"] = recorded_at
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+        with open(file_path, "w") as map_file:
+            json.dump(impact_map, map_file, indent=4, sort_keys=True)
+        self.logger.info("Saved the page-object dependencies of %s tests to %s", len(self.tests), file_path)
+
+
+impact_recorder = ImpactRecorder()
+
+
+def track_page_methods(page_class):
+    """Makes every public method declared on a page class record itself, so a test depends on the page
+    methods it calls even when they never reach @profiled or SmartWait."""
+    for name, value in list(vars(page_class).items()):
+        if name.startswith("_") or not inspect.isfunction(value) or getattr(value, "records_impact", False):
+            continue
+        setattr(page_class, name, _recording(value))
+
+
+def _recording(method):
+    @functools.wraps(method)
+    def wrapper(page, *args, **kwargs):
+        if impact_recorder.enabled:
+            impact_recorder.record(page, method=method)
+        return method(page, *args, **kwargs)
+
+    wrapper.records_impact = True
+    return wrapper
+
+
+def load_impact_map(map_dir):
+    """Loads and merges the impact maps written by every worker under map_dir, keeping the newest entry per test."""
+    impact_map = {}
+    for file_path in glob.glob(os.path.join(map_dir, "**", "impact_map.json"), recursive=True):
+        for test, dependencies in _read_map_file(file_path).items():
+            if test not in impact_map or dependencies["recorded_at"] > impact_map[test]["recorded_at"]:
+                impact_map[test] = dependencies
+    return impact_map
+
+
+def _read_map_file(file_path):
+    try:
+        with open(file_path) as map_file:
+            return json.load(map_file)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning("The impact map %s can't be read and will be ignored. Error: %s", file_path, e)
+        return {}
+
+
+def get_changed_lines(base="HEAD"):
+    """Returns {file: set of changed line numbers} for the working tree against base; None means the whole file.
+
+    Untracked files other than new Python modules are ignored, as they are usually logs and reports.
+    """
+    diff = subprocess.run(
+        ["git", "diff", "--unified=0", "--no-color", base],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+    ).stdout
+    untracked = subprocess.run(
+        ["git", "ls-files", "--others", "--exclude-standard"],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+    ).stdout
+    changed_lines = {file_name: None for file_name in untracked.splitlines() if file_name.endswith(".py")}
+    file_name = None
+    for line in diff.splitlines():
+        if line.startswith("+++ "):
+            file_name = None if line[4:] == "/dev/null" else line[6:]
+            if file_name is not None:
+                changed_lines.setdefault(file_name, set())
+        elif line.startswith("--- ") and line[4:] != "/dev/null":
+            changed_lines.setdefault(line[6:], set())
+        elif file_name is not None and changed_lines.get(file_name) is not None:
+            match = HUNK_HEADER.match(line)
+            if match:
+                start, count = int(match.group(1)), int(match.group(2) or 1)
+                # A pure deletion touches the lines around it.
+                changed_lines[file_name].update(range(start, start + count) if count else (start, start + 1))
+    return changed_lines
+
+
+def get_changed_symbols(file_name, lines):
+    """Returns the "<file>::<qualified name>" symbols of a Python module touched by the changed lines.
+
+    A change to a class body outside its methods and attributes returns the class itself, and a change
+    outside any class returns the file name, which every test using the module depends on. Changed
+    attributes (locators) also mark every method of the module that reads them as changed.
+    """
+    try:
+        with open(os.path.join(PROJECT_ROOT, file_name)) as source_file:
+            tree = ast.parse(source_file.read())
+    except (OSError, SyntaxError):
+        return {file_name}
+    symbols = set()
+    changed_attributes = set()
+    methods = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            if lines is None or _touches(node, lines):
+                symbols.add(file_name)
+            continue
+        for member in node.body:
+            if isinstance(member, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                methods.append((f"{file_name}::{node.name}.{member.name}", member))
+            names = _member_names(member)
+            if lines is None or _touches(member, lines):
+                if names:
+                    symbols.update(f"{file_name}::{node.name}.{name}" for name in names)
+                    if not isinstance(member, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                        changed_attributes.update(names)
+                else:
+                    symbols.add(f"{file_name}::{node.name}")
+        if lines is not None and any(line in lines for line in range(node.lineno, node.body[0].lineno)):
+            symbols.add(f"{file_name}::{node.name}")
+    for symbol, method in methods:
+        if any(isinstance(node, ast.Attribute) and node.attr in changed_attributes for node in ast.walk(method)):
+            symbols.add(symbol)
+    return symbols
+
+
+def select_tests(items, impact_map, changed_lines, tracked_dirs=("pages",)):
+    """Returns the test items affected by the changed lines, or None when every test has to run.
+
+    Tests missing from the impact map always run. Changes to files outside the tracked page-object
+    directories and the tests themselves can't be attributed, so they select every test.
+    """
+    changed_symbols = set()
+    changed_test_files = set()
+    for file_name, lines in changed_lines.items():
+        if file_name.startswith(tuple(f"{tracked_dir}/" for tracked_dir in tracked_dirs)) and file_name.endswith(".py"):
+            changed_symbols.update(get_changed_symbols(file_name, lines))
+        elif file_name.startswith("tests/test_") and file_name.endswith(".py"):
+            changed_test_files.add(file_name)
+        elif not file_name.endswith((".md", ".txt")):
+            logger.info("%s changed and can't be mapped to tests, so every test is selected.", file_name)
+            return None
+    selected = []
+    for item in items:
+        dependencies = impact_map.get(item.nodeid)
+        if (
+            dependencies is None
+            or item.nodeid.split("::")[0] in changed_test_files
+            or changed_symbols.intersection(dependencies["symbols"])
+            or changed_symbols.intersection(dependencies["classes"])
+            or changed_symbols.intersection(dependencies["files"])
+        ):
+            selected.append(item)
+    return selected
+
+
+def _touches(node, lines):
+    first_line = min([node.lineno] + [decorator.lineno for decorator in getattr(node, "decorator_list", [])])
+    return any(line in lines for line in range(first_line, node.end_lineno + 1))
+
+
+def _member_names(member):
+    if isinstance(member, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        return [member.name]
+    if isinstance(member, ast.Assign):
+        return [target.id for target in member.targets if isinstance(target, ast.Name)]
+    if isinstance(member, ast.AnnAssign) and isinstance(member.target, ast.Name):
+        return [member.target.id]
+    return []
@@ -0,0 +1,142 @@
+import json
+import os
+from urllib.parse import quote
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.logger_instance import logger
+
+
+RESOURCE_TYPE_PATTERNS = {
+    "image": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico"],
+    "font": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+    "media": ["*.mp4", "*.webm", "*.ogg", "*.mp3", "*.wav"],
+    "stylesheet": ["*.css"],
+}
+
+FIREFOX_RESOURCE_TYPE_PREFS = {
+    "image": {"permissions.default.image": 2},
+    "font": {"gfx.downloadable_fonts.enabled": False},
+    "media": {"media.autoplay.default": 5, "media.preload.default": 0},
+}
+
+RESOURCE_ENTRIES_SCRIPT = (
+    "return performance.getEntriesByType('resource').map((entry) => [entry.name, entry.transferSize || 0]);"
+)
+
+CHROMIUM_BROWSERS = ("chrome", "chromium", "brave", "edge")
+
+
+class LeanMode:
+    def __init__(self, settings, browser):
+        """Blocks resources that tests never assert on, such as images, fonts and third-party analytics.
+
+        Chromium-based browsers block through DevTools (Network.setBlockedURLs), Firefox through prefs and a
+        PAC script that sends blocked URLs to a black-hole proxy. With learn_catalog, the transfer sizes of
+        resources seen while lean mode is off are kept in a catalog, which is used to estimate the bytes avoided
+        while it is on.
+        """
+        self.logger = logger
+        self.browser = browser
+        self.enabled = settings["enabled"]
+        self.resource_types = settings["blocked_resource_types"]
+        self.url_patterns = settings["blocked_url_patterns"]
+        self.learn_catalog = settings["learn_catalog"]
+        self.catalog_file = settings["catalog_file"]
+        self._catalog = None
+
+    @property
+    def blocked_patterns(self):
+        """Returns every URL pattern to block, including the ones derived from the blocked resource types."""
+        patterns = list(self.url_patterns)
+        for resource_type in self.resource_types:
+            patterns.extend(RESOURCE_TYPE_PATTERNS.get(resource_type, []))
+        return patterns
+
+    def apply_to_options(self, options):
+        """Adds the lean mode browser prefs and capabilities to the browser options."""
+        if not self.enabled:
+            return
+        if self.browser in CHROMIUM_BROWSERS:
+            if "image" in self.resource_types:
+                options.add_argument("--blink-settings=imagesEnabled=false")
+            logging_prefs_key = "ms:loggingPrefs" if self.browser == "edge" else "goog:loggingPrefs"
+            options.set_capability(logging_prefs_key, {"performance": "ALL"})
+        elif self.browser == "firefox":
+            for resource_type in self.resource_types:
+                for name, value in FIREFOX_RESOURCE_TYPE_PREFS.get(resource_type, {}).items():
+                    options.set_preference(name, value)
+            if self.url_patterns:
+                options.set_preference("network.proxy.type", 2)
+                options.set_preference("network.proxy.autoconfig_url", self._pac_url())
+
+    def activate(self, driver):
+        """Turns on DevTools request blocking for a freshly created Chromium session."""
+        if not self.enabled or not hasattr(driver, "execute_cdp_cmd"):
+            return
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocked_patterns})
+        self.logger.info("Lean mode is blocking these URL patterns: %s", self.blocked_patterns)
+
+    def collect(self, driver, performance_log=None):
+        """Returns the requests and bytes avoided since the last call. When disabled, returns None and only
+        learns resource sizes if learn_catalog is set, so a normal run pays no extra round-trip per test.
+
+        Blocked requests are only observable on Chromium; other browsers report None. A performance log that
+        was already drained by someone else (such as the network capture) can be passed in.
+        """
+        try:
+            if not self.enabled:
+                if self.learn_catalog:
+                    self.catalog.update(dict(driver.execute_script(RESOURCE_ENTRIES_SCRIPT)))
+                return None
+            if not hasattr(driver, "execute_cdp_cmd"):
+                return {"requests_avoided": None, "bytes_avoided": None}
+            if performance_log is None:
+                performance_log = driver.get_log("performance")
+            blocked_urls = self._blocked_urls(performance_log)
+        except WebDriverException as e:
+            self.logger.warning("Couldn't collect the lean mode statistics. Error: %s", e)
+            return None
+        return {
+            "requests_avoided": len(blocked_urls),
+            "bytes_avoided": sum(self.catalog.get(url, 0) for url in blocked_urls),
+        }
+
+    @property
+    def catalog(self):
+        """Known transfer sizes of resources, keyed by URL."""
+        if self._catalog is None:
+            try:
+                with open(self.catalog_file) as catalog_file:
+                    self._catalog = json.load(catalog_file)
+            except (FileNotFoundError, json.JSONDecodeError):
+                self._catalog = {}
+        return self._catalog
+
+    def save_catalog(self):
+        """Persists the learned resource sizes for later lean mode runs."""
+        if not self._catalog:
+            return
+        os.makedirs(os.path.dirname(self.catalog_file) or ".", exist_ok=True)
+        with open(self.catalog_file, "w") as catalog_file:
+            json.dump(self._catalog, catalog_file, indent=4, sort_keys=True)
+
+    def _blocked_urls(self, performance_log):
+        """Extracts the URLs that DevTools blocked from the Chromium performance log."""
+        urls = {}
+        blocked = []
+        for entry in performance_log:
+            message = json.loads(entry["message"])["message"]
+            params = message.get("params", {})
+            if message["method"] == "Network.requestWillBeSent":
+                urls[params["requestId"]] = params["request"]["url"]
+            elif message["method"] == "Network.loadingFailed" and params.get("blockedReason"):
+                blocked.append(urls.get(params["requestId"], params["requestId"]))
+        return blocked
+
+    def _pac_url(self):
+        """Builds a data: PAC script that sends every blocked URL to an unreachable proxy."""
+        conditions = " || ".join(f'shExpMatch(url, "{pattern}")' for pattern in self.url_patterns)
+        pac = f'function FindProxyForURL(url, host) {{ return ({conditions}) ? "PROXY 127.0.0.1:9" : "DIRECT"; }}'
+        return "data:application/x-ns-proxy-autoconfig," + quote(pac)
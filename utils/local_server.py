@@ -0,0 +1,72 @@
+import functools
+import os
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+from utils.logger_instance import logger
+
+
+SITE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "local_site")
+
+
+class _SiteRequestHandler(SimpleHTTPRequestHandler):
+    """Serves the bundled SauceDemo stand-in and fills the template values of app.js."""
+
+    template_values = {}
+
+    def do_GET(self):
+        if self.path.split("?")[0] != "/static/app.js":
+            return super().do_GET()
+        with open(os.path.join(SITE_DIR, "static", "app.js"), encoding="utf-8") as script_file:
+            script = script_file.read()
+        for name, value in self.template_values.items():
+            script = script.replace("{{" + name + "}}", str(value))
+        body = script.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/javascript; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug("Local SauceDemo: " + format, *args)
+
+
+class LocalSauceDemoServer:
+    def __init__(self, host="127.0.0.1", port=0, performance_glitch_delay_ms=2500):
+        """Lightweight HTTP server serving a local replica of SauceDemo, on an ephemeral port by default."""
+        self.logger = logger
+        self.host = host
+        self.port = port
+        self.performance_glitch_delay_ms = performance_glitch_delay_ms
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self):
+        return f"http://{self.host}:{self._server.server_address[1]}"
+
+    def start(self):
+        """Starts serving in a background thread and returns the base URL."""
+        self.logger.log_method_entry(self.start.__name__)
+        handler = type(
+            "SiteRequestHandler",
+            (_SiteRequestHandler,),
+            {"template_values": {"PERFORMANCE_GLITCH_DELAY_MS": self.performance_glitch_delay_ms}},
+        )
+        self._server = ThreadingHTTPServer((self.host, self.port), functools.partial(handler, directory=SITE_DIR))
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="local-saucedemo", daemon=True)
+        self._thread.start()
+        self.logger.info("The local SauceDemo server is listening on %s", self.base_url)
+        return self.base_url
+
+    def stop(self):
+        """Stops the server and waits for its thread to finish."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self.logger.info("The local SauceDemo server has been stopped.")
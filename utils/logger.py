@@ -1,13 +1,112 @@
 import os
+import queue
 import logging
+import logging.handlers
 from datetime import datetime
 
 
+class _BatchFlushMixin:
+    """Lets a stream handler skip its per-record flush while the listener writes a batch."""
+
+    in_batch = False
+
+    def flush(self):
+        if not self.in_batch:
+            super().flush()
+
+
+class BatchStreamHandler(_BatchFlushMixin, logging.StreamHandler):
+    pass
+
+
+class BatchFileHandler(_BatchFlushMixin, logging.FileHandler):
+    pass
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    def __init__(self, log_queue, overflow_policy="block"):
+        """Puts records onto a bounded queue, either blocking or dropping them when the queue is full."""
+        super().__init__(log_queue)
+        self.overflow_policy = overflow_policy
+        self.dropped = 0
+
+    def prepare(self, record):
+        """Hands the record over untouched, the queue never leaves the process so nothing is pickled."""
+        return record
+
+    def enqueue(self, record):
+        if self.overflow_policy == "drop":
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                self.dropped += 1
+        else:
+            self.queue.put(record)
+
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    def __init__(self, log_queue, *handlers, batch_size=100):
+        """Background listener that drains records in batches and flushes its handlers once per batch."""
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.batch_size = batch_size
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+    def _monitor(self):
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = self._write_batch(batch)
+            for _ in batch:
+                self.queue.task_done()
+            if stop:
+                break
+
+    def _write_batch(self, batch):
+        """Writes a batch of records and returns True if the stop sentinel was part of it."""
+        stop = False
+        for handler in self.handlers:
+            handler.in_batch = True
+        try:
+            for record in batch:
+                if record is self._sentinel:
+                    stop = True
+                else:
+                    self.handle(record)
+        finally:
+            for handler in self.handlers:
+                handler.in_batch = False
+                handler.flush()
+        return stop
+
+
 class Logger:
-    def __init__(self, name, log_level=logging.INFO, log_file_path="logs"):
-        """Logger class to log messages to console and file."""
+    def __init__(
+        self,
+        name,
+        log_level=logging.INFO,
+        log_file_path="logs",
+        async_mode=False,
+        queue_size=10000,
+        overflow_policy="block",
+        batch_size=100,
+        quiet=False,
+    ):
+        """Logger class to log messages to console and file.
+
+        In async mode records are put onto a bounded in-memory queue and written out by a background
+        listener thread. When the queue is full the "block" policy applies back-pressure to the caller,
+        while the "drop" policy discards the record and counts it. Quiet mode skips the method-entry
+        and action banners entirely.
+        """
 
         self.logger = logging.getLogger(name)
+        self.quiet = quiet
 
         self.logger.setLevel(log_level)
         self.logger.propagate = False
@@ -19,44 +118,98 @@ class Logger:
         if not os.path.exists(log_file_path):
             os.makedirs(log_file_path)
 
-        console_handler = logging.StreamHandler()
+        self.queue_handler = None
+        self.listener = None
+
+        console_handler = BatchStreamHandler() if async_mode else logging.StreamHandler()
         console_handler.setFormatter(log_format)
 
-        log_file_name = os.path.join(log_file_path, f"app_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.log")
-        file_handler = logging.FileHandler(log_file_name)
+        worker_id = os.getenv("PYTEST_XDIST_WORKER", "main")
+        log_file_name = os.path.join(
+            log_file_path, f"app_{worker_id}_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.log"
+        )
+        file_handler = BatchFileHandler(log_file_name) if async_mode else logging.FileHandler(log_file_name)
         file_handler.setFormatter(log_format)
 
         if not self.logger.handlers:
-            self.logger.addHandler(console_handler)
-            self.logger.addHandler(file_handler)
+            if async_mode:
+                log_queue = queue.Queue(maxsize=queue_size)
+                self.queue_handler = BoundedQueueHandler(log_queue, overflow_policy)
+                self.listener = BatchingQueueListener(log_queue, console_handler, file_handler, batch_size=batch_size)
+                self.logger.addHandler(self.queue_handler)
+                self.listener.start()
+            else:
+                self.logger.addHandler(console_handler)
+                self.logger.addHandler(file_handler)
+
+    def flush(self):
+        """Blocks until every queued record has been written out."""
+        if self.listener is not None and self.listener._thread is not None:
+            self.listener.queue.join()
+        for handler in self.logger.handlers:
+            handler.flush()
+
+    def stop(self):
+        """Writes out every queued record and stops the background listener thread."""
+        if self.listener is None or self.listener._thread is None:
+            return
+        self.listener.stop()
+        if self.queue_handler.dropped:
+            for handler in self.listener.handlers:
+                handler.handle(
+                    self.logger.makeRecord(
+                        self.logger.name,
+                        logging.WARNING,
+                        __file__,
+                        0,
+                        f"{self.queue_handler.dropped} log records were dropped because the log queue was full.",
+                        None,
+                        None,
+                    )
+                )
+
+    def debug(self, message, *args):
+        """Log a debug message. Any args are %-formatted into the message only if it gets emitted."""
+        self.logger.debug(message, *args)
+
+    def info(self, message, *args):
+        """Log an info message. Any args are %-formatted into the message only if it gets emitted."""
+        self.logger.info(message, *args)
+
+    def warning(self, message, *args):
+        """Log a warning message. Any args are %-formatted into the message only if it gets emitted."""
+        self.logger.warning(message, *args)
+
+    def error(self, message, *args):
+        """Log an error message. Any args are %-formatted into the message only if it gets emitted."""
+        self.logger.error(message, *args)
+
+    def critical(self, message, *args):
+        """Log a critical message. Any args are %-formatted into the message only if it gets emitted."""
+        self.logger.critical(message, *args)
 
+    def log_method_entry(self, method_name, width=30):
+        """Logs the entry into the current method with the method name centered."""
+        if self.quiet or not self.logger.isEnabledFor(logging.INFO):
+            return
+        self.logger.info("Method Name: %s", _Centered(method_name, width, "-"))
 
-    def debug(self, message):
-        """Log a debug message."""
-        self.logger.debug(message)
-
-    def info(self, message):
-        """Log an info message."""
-        self.logger.info(message)
+    def log_action(self, action_name, width=92):
+        """Logs the start of an action with the action name centered."""
+        if self.quiet or not self.logger.isEnabledFor(logging.INFO):
+            return
+        self.logger.info("Action: %s", _Centered(action_name, width, "*"))
 
-    def warning(self, message):
-        """Log a warning message."""
-        self.logger.warning(message)
 
-    def error(self, message):
-        """Log an error message."""
-        self.logger.error(message)
+class _Centered:
+    """Centers a banner name only when the log record is actually formatted."""
 
-    def critical(self, message):
-        """Log a critical message."""
-        self.logger.critical(message)
+    __slots__ = ("name", "width", "fill_char")
 
-    def log_method_entry(self, method_name, width=30):
-        """Logs the entry into the current method with the method name centered."""
-        centered_name = method_name.center(width, "-")
-        self.logger.info(f"Method Name: {centered_name}")
+    def __init__(self, name, width, fill_char):
+        self.name = name
+        self.width = width
+        self.fill_char = fill_char
 
-    def log_action(self, action_name, width=92):
-        """Logs the start of an action with the action name centered."""
-        centered_name = action_name.center(width, "*")
-        self.logger.info(f"Action: {centered_name}")
+    def __str__(self):
+        return self.name.center(self.width, self.fill_char)
@@ -1,3 +1,15 @@
+import os
+import atexit
+
 from utils.logger import Logger
 
-logger = Logger("DMS")
+logger = Logger(
+    "DMS",
+    async_mode=os.getenv("LOG_ASYNC", "false").lower() == "true",
+    queue_size=int(os.getenv("LOG_QUEUE_SIZE", "10000")),
+    overflow_policy=os.getenv("LOG_OVERFLOW_POLICY", "block"),
+    batch_size=int(os.getenv("LOG_BATCH_SIZE", "100")),
+    log_level=os.getenv("LOG_LEVEL", "INFO").upper(),
+    quiet=os.getenv("LOG_QUIET", "false").lower() == "true",
+)
+atexit.register(logger.stop)
@@ -0,0 +1,426 @@
+import json
+import os
+import re
+import statistics
+import time
+from datetime import datetime, timezone
+from urllib.parse import urldefrag, urlsplit
+
+from selenium.common.exceptions import WebDriverException
+
+import variables
+from utils.logger_instance import logger
+
+
+CHROMIUM_BROWSERS = ("chrome", "chromium", "brave", "edge")
+TIMING_METRICS = ("dns_ms", "connect_ms", "ttfb_ms", "dom_content_loaded_ms", "load_ms", "long_task_ms")
+TIMESERIES_COLUMNS = ("time", "page", "test") + TIMING_METRICS + ("long_tasks", "requests", "transfer_bytes")
+
+# Installed on every new document on Chromium, where long tasks are observable.
+LONG_TASK_OBSERVER_SCRIPT = """
+window.__longTasks = [];
+try {
+    new PerformanceObserver((list) => {
+        for (const entry of list.getEntries()) window.__longTasks.push(entry.duration);
+    }).observe({type: "longtask", buffered: true});
+} catch (e) {}
+"""
+
+# Reads the Navigation Timing entry, long tasks and resource timings of the current document.
+NAVIGATION_SAMPLE_SCRIPT = """
+const nav = performance.getEntriesByType("navigation")[0];
+if (!nav) return null;
+const longTasks = window.__longTasks || null;
+return {
+    url: location.href,
+    time_origin: performance.timeOrigin,
+    dns_ms: nav.domainLookupEnd - nav.domainLookupStart,
+    connect_ms: nav.connectEnd - nav.connectStart,
+    ttfb_ms: nav.responseStart,
+    dom_content_loaded_ms: nav.domContentLoadedEventEnd || null,
+    load_ms: nav.loadEventEnd || null,
+    long_tasks: longTasks ? longTasks.length : null,
+    long_task_ms: longTasks ? longTasks.reduce((total, duration) => total + duration, 0) : null,
+    transfer_bytes: nav.transferSize || 0,
+    status: nav.responseStatus || 0,
+    resources: performance.getEntriesByType("resource").map(
+        (entry) => [entry.name, entry.initiatorType, entry.startTime, entry.duration, entry.transferSize || 0]
+    ),
+};
+"""
+
+
+def page_for_url(url):
+    """Returns the name of the variables.py URL (such as "url_inventory_page") a URL belongs to, or its path."""
+    url = urldefrag(url)[0].split("?")[0]
+    for name, value in vars(variables).items():
+        if name.startswith("url_") and isinstance(value, str) and url == value:
+            return name
+    return urlsplit(url).path or "/"
+
+
+def _iso_time(epoch_seconds):
+    return datetime.fromtimestamp(epoch_seconds, tz=timezone.utc).isoformat(timespec="milliseconds")
+
+
+def _headers(headers):
+    return [{"name": name, "value": str(value)} for name, value in (headers or {}).items()]
+
+
+def _phase(start, end):
+    return round(end - start, 3) if start is not None and start >= 0 and end >= start else -1
+
+
+def build_har_entries(performance_log):
+    """Turns the DevTools Network events of a Chromium performance log into HAR entries."""
+    requests = {}
+    for log_entry in performance_log:
+        message = json.loads(log_entry["message"])["message"]
+        params = message.get("params", {})
+        request = requests.get(params.get("requestId"))
+        if message["method"] == "Network.requestWillBeSent":
+            requests[params["requestId"]] = {
+                "request": params["request"],
+                "type": params.get("type", ""),
+                "wall_time": params.get("wallTime", time.time()),
+                "start": params["timestamp"],
+                "end": params["timestamp"],
+                "response": None,
+                "size": 0,
+                "error": None,
+            }
+        elif request is None:
+            continue
+        elif message["method"] == "Network.responseReceived":
+            request["response"] = params["response"]
+        elif message["method"] == "Network.loadingFinished":
+            request["end"] = params["timestamp"]
+            request["size"] = params.get("encodedDataLength", 0)
+        elif message["method"] == "Network.loadingFailed":
+            request["end"] = params["timestamp"]
+            request["error"] = params.get("blockedReason") or params.get("errorText")
+    return [_har_entry(request) for request in requests.values()]
+
+
+def _har_entry(request):
+    response = request["response"] or {}
+    total_ms = round((request["end"] - request["start"]) * 1000, 3)
+    timing = response.get("timing")
+    if timing:
+        wait = _phase(timing["sendEnd"], timing["receiveHeadersEnd"])
+        timings = {
+            "blocked": -1,
+            "dns": _phase(timing["dnsStart"], timing["dnsEnd"]),
+            "connect": _phase(timing["connectStart"], timing["connectEnd"]),
+            "ssl": _phase(timing["sslStart"], timing["sslEnd"]),
+            "send": max(_phase(timing["sendStart"], timing["sendEnd"]), 0),
+            "wait": max(wait, 0),
+            "receive": round(max(total_ms - timing["receiveHeadersEnd"], 0), 3),
+        }
+    else:
+        timings = {"send": 0, "wait": total_ms, "receive": 0}
+    entry = {
+        "startedDateTime": _iso_time(request["wall_time"]),
+        "time": total_ms,
+        "request": {
+            "method": request["request"].get("method", "GET"),
+            "url": request["request"]["url"],
+            "httpVersion": response.get("protocol", ""),
+            "headers": _headers(request["request"].get("headers")),
+            "queryString": [],
+            "cookies": [],
+            "headersSize": -1,
+            "bodySize": -1,
+        },
+        "response": {
+            "status": response.get("status", 0),
+            "statusText": response.get("statusText", ""),
+            "httpVersion": response.get("protocol", ""),
+            "headers": _headers(response.get("headers")),
+            "cookies": [],
+            "content": {"size": request["size"], "mimeType": response.get("mimeType", "")},
+            "redirectURL": "",
+            "headersSize": -1,
+            "bodySize": request["size"],
+        },
+        "cache": {},
+        "timings": timings,
+        "_resourceType": request["type"].lower(),
+    }
+    if request["error"]:
+        entry["_error"] = request["error"]
+    return entry
+
+
+def _resource_timing_entries(sample):
+    """Builds HAR entries from the Resource Timing API, for browsers without DevTools network events."""
+    entries = []
+    documents = [[sample["url"], "document", 0, sample["load_ms"] or 0, sample["transfer_bytes"]]]
+    for url, resource_type, start_ms, duration_ms, size in documents + sample["resources"]:
+        entries.append({
+            "startedDateTime": _iso_time((sample["time_origin"] + start_ms) / 1000),
+            "time": round(duration_ms, 3),
+            "request": {"method": "GET", "url": url, "httpVersion": "", "headers": [], "queryString": [],
+                        "cookies": [], "headersSize": -1, "bodySize": -1},
+            "response": {"status": sample["status"] if resource_type == "document" else 0, "statusText": "",
+                         "httpVersion": "", "headers": [], "cookies": [], "content": {"size": size, "mimeType": ""},
+                         "redirectURL": "", "headersSize": -1, "bodySize": size},
+            "cache": {},
+            "timings": {"send": 0, "wait": round(duration_ms, 3), "receive": 0},
+            "_resourceType": resource_type,
+        })
+    return entries
+
+
+class NetworkCapture:
+    def __init__(
+        self,
+        enabled=False,
+        output_dir="reports/network",
+        save_har=True,
+        timeseries_file="reports/network/timeseries.jsonl",
+        budgets=None,
+        regression_tolerance_pct=0,
+        history=20,
+    ):
+        """Records the network activity and navigation timings of every test, opt-in.
+
+        Chromium sessions report every request through the DevTools performance log and long tasks through
+        an observer installed on each new document; other browsers fall back to the Navigation and Resource
+        Timing APIs. The current document is sampled before and after each driver.get() and when the test
+        ends. Samples are appended to a time series per variables.py page, and checked against the page's
+        budgets (in ms, "*" applies to every page) and, optionally, against the median of its recent history.
+        """
+        self.logger = logger
+        self._sessions = {}
+        self._history = None
+        self.session_rows = []
+        self.budget_failures = []
+        self.configure(enabled, output_dir, save_har, timeseries_file, budgets, regression_tolerance_pct, history)
+
+    def configure(self, enabled, output_dir, save_har, timeseries_file, budgets, regression_tolerance_pct, history):
+        self.enabled = enabled
+        self.output_dir = output_dir
+        self.save_har = save_har
+        self.timeseries_file = timeseries_file
+        self.budgets = budgets or {}
+        self.regression_tolerance_pct = regression_tolerance_pct
+        self.history = history
+
+    def apply_to_options(self, options, browser):
+        """Turns on the DevTools performance log, which carries the Network events, on Chromium browsers."""
+        if self.enabled and browser in CHROMIUM_BROWSERS:
+            logging_prefs_key = "ms:loggingPrefs" if browser == "edge" else "goog:loggingPrefs"
+            options.set_capability(logging_prefs_key, {"performance": "ALL"})
+
+    def activate(self, web_driver):
+        """Installs the long task observer and makes every driver.get() sample the documents it leaves and loads."""
+        if not self.enabled:
+            return
+        if hasattr(web_driver, "execute_cdp_cmd"):
+            try:
+                web_driver.execute_cdp_cmd("Network.enable", {})
+                web_driver.execute_cdp_cmd(
+                    "Page.addScriptToEvaluateOnNewDocument", {"source": LONG_TASK_OBSERVER_SCRIPT}
+                )
+            except WebDriverException as e:
+                self.logger.warning("Couldn't install the network capture hooks. Error: %s", e)
+        self._sessions[web_driver.session_id] = {"samples": [], "performance_log": []}
+        get = web_driver.get
+
+        def get_and_sample(url):
+            self.sample(web_driver)
+            get(url)
+            self.sample(web_driver)
+
+        web_driver.get = get_and_sample
+
+    def begin_test(self, web_driver):
+        """Drops what a pooled session recorded before this test."""
+        session = self._sessions.get(getattr(web_driver, "session_id", None))
+        if session is not None:
+            session["samples"] = []
+            session["performance_log"] = []
+            self._drain_performance_log(web_driver)
+
+    def sample(self, web_driver):
+        """Records the timings of the current document, updating an earlier sample of the same document.
+
+        A sample belongs to the page its document was loaded for. When a single-page app switched routes
+        without loading a new document, the new route is recorded in the sample's "route_changes" instead,
+        so the document's timings are never attributed to the route the test ended on.
+        """
+        session = self._sessions.get(getattr(web_driver, "session_id", None))
+        if session is None:
+            return None
+        try:
+            sample = web_driver.execute_script(NAVIGATION_SAMPLE_SCRIPT)
+        except WebDriverException as e:
+            self.logger.debug("Couldn't sample the navigation timings. Error: %s", e)
+            return None
+        if not sample or not sample["url"].startswith(("http:", "https:")):
+            return None
+        page = page_for_url(sample["url"])
+        samples = session["samples"]
+        if samples and samples[-1]["time_origin"] == sample["time_origin"]:
+            previous = samples[-1]
+            sample.update(url=previous["url"], page=previous["page"], route_changes=previous["route_changes"])
+            current_route = sample["route_changes"][-1] if sample["route_changes"] else sample["page"]
+            if page != current_route:
+                sample["route_changes"].append(page)
+            samples[-1] = sample
+        else:
+            sample.update(page=page, route_changes=[])
+            samples.append(sample)
+        return sample
+
+    def check_budgets(self, web_driver):
+        """Samples the current document and returns a message for every budget the test's pages went over."""
+        session = self._sessions.get(getattr(web_driver, "session_id", None))
+        if session is None:
+            return []
+        self.sample(web_driver)
+        violations = []
+        for sample in session["samples"]:
+            budget = {**self.budgets.get("*", {}), **self.budgets.get(sample["page"], {})}
+            for metric, limit in budget.items():
+                value = sample.get(metric)
+                if value is not None and value > limit:
+                    violations.append(f"{sample['page']} {metric} was {value:.0f} ms, over its {limit} ms budget")
+            violations.extend(self._regressions(sample))
+        return violations
+
+    def _regressions(self, sample):
+        if not self.regression_tolerance_pct:
+            return []
+        regressions = []
+        history = [row for row in self._load_history() if row["page"] == sample["page"]][-self.history:]
+        for metric in TIMING_METRICS:
+            values = [row[metric] for row in history if row.get(metric) is not None]
+            if sample.get(metric) is None or len(values) < 3:
+                continue
+            limit = statistics.median(values) * (1 + self.regression_tolerance_pct / 100)
+            if sample[metric] > limit and sample[metric] - limit >= 1:
+                regressions.append(
+                    f"{sample['page']} {metric} was {sample[metric]:.0f} ms, more than "
+                    f"{self.regression_tolerance_pct}% over its recent median of {statistics.median(values):.0f} ms"
+                )
+        return regressions
+
+    def end_test(self, web_driver, test_name):
+        """Saves the test's HAR and time series rows and returns a summary, or None when nothing was captured.
+
+        Also returns the drained Chromium performance log, so lean mode can reuse it.
+        """
+        session = self._sessions.get(getattr(web_driver, "session_id", None))
+        if session is None:
+            return None, None
+        self.sample(web_driver)
+        performance_log = session["performance_log"] + self._drain_performance_log(web_driver)
+        samples, session["samples"], session["performance_log"] = session["samples"], [], []
+        if not samples:
+            return None, performance_log
+        entries = build_har_entries(performance_log) if performance_log else [
+            entry for sample in samples for entry in _resource_timing_entries(sample)
+        ]
+        if self.save_har:
+            self._save_har(test_name, samples, entries)
+        self._append_timeseries(test_name, samples)
+        summary = {
+            "pages": [
+                {
+                    "page": sample["page"],
+                    **{metric: sample[metric] for metric in TIMING_METRICS},
+                    "route_changes": sample["route_changes"],
+                }
+                for sample in samples
+            ],
+            "requests": len(entries),
+            "transfer_bytes": sum(entry["response"]["bodySize"] for entry in entries),
+        }
+        return summary, performance_log
+
+    def summary(self):
+        """Returns the page visits and mean TTFB and load times of every page measured in this session."""
+        pages = {}
+        for row in self.session_rows:
+            pages.setdefault(row["page"], []).append(row)
+        return {
+            page: {
+                "visits": len(rows),
+                "ttfb_ms": statistics.mean(row["ttfb_ms"] for row in rows),
+                "load_ms": statistics.mean([row["load_ms"] for row in rows if row["load_ms"] is not None] or [0]),
+            }
+            for page, rows in sorted(pages.items())
+        }
+
+    def _drain_performance_log(self, web_driver):
+        if not hasattr(web_driver, "execute_cdp_cmd"):
+            return []
+        try:
+            return web_driver.get_log("performance")
+        except WebDriverException as e:
+            self.logger.debug("Couldn't read the performance log. Error: %s", e)
+            return []
+
+    def _save_har(self, test_name, samples, entries):
+        pages = [
+            {
+                "startedDateTime": _iso_time(sample["time_origin"] / 1000),
+                "id": f"page_{index}",
+                "title": sample["url"],
+                "pageTimings": {
+                    "onContentLoad": sample["dom_content_loaded_ms"] or -1,
+                    "onLoad": sample["load_ms"] or -1,
+                },
+            }
+            for index, sample in enumerate(samples)
+        ]
+        har = {"log": {"version": "1.2", "creator": {"name": "saucedemo", "version": "0.1.0"}, "pages": pages,
+                       "entries": entries}}
+        os.makedirs(self.output_dir, exist_ok=True)
+        path = os.path.join(self.output_dir, re.sub(r"[^\w.-]+", "_", test_name) + ".har")
+        with open(path, "w") as har_file:
+            json.dump(har, har_file, separators=(",", ":"))
+        self.logger.info("The HAR of %s has been saved to %s", test_name, path)
+
+    def _append_timeseries(self, test_name, samples):
+        """Appends one compact row per page visit, in TIMESERIES_COLUMNS order."""
+        rows = []
+        for sample in samples:
+            row = {"time": round(time.time(), 1), "page": sample["page"], "test": test_name}
+            for metric in TIMING_METRICS:
+                row[metric] = None if sample[metric] is None else round(sample[metric], 1)
+            row["long_tasks"] = sample["long_tasks"]
+            row["requests"] = len(sample["resources"]) + 1
+            row["transfer_bytes"] = sample["transfer_bytes"] + sum(resource[4] for resource in sample["resources"])
+            rows.append(row)
+        self._load_history().extend(rows)
+        self.session_rows.extend(rows)
+        os.makedirs(os.path.dirname(self.timeseries_file) or ".", exist_ok=True)
+        lines = [json.dumps([row[column] for column in TIMESERIES_COLUMNS], separators=(",", ":")) for row in rows]
+        with open(self.timeseries_file, "a") as timeseries_file:
+            timeseries_file.write("\n".join(lines) + "\n")
+
+    def _load_history(self):
+        if self._history is None:
+            self._history = load_timeseries(self.timeseries_file)
+        return self._history
+
+
+def load_timeseries(path):
+    """Reads a time series file back into a list of dictionaries keyed by TIMESERIES_COLUMNS."""
+    rows = []
+    try:
+        with open(path) as timeseries_file:
+            for line in timeseries_file:
+                try:
+                    rows.append(dict(zip(TIMESERIES_COLUMNS, json.loads(line))))
+                except json.JSONDecodeError:
+                    continue
+    except FileNotFoundError:
+        pass
+    return rows
+
+
+network_capture = NetworkCapture()
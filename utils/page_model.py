@@ -0,0 +1,139 @@
+import difflib
+import dis
+import inspect
+import types
+
+from selenium.webdriver.common.by import By
+
+
+LOCATOR_STRATEGIES = frozenset(
+    value for name, value in vars(By).items() if not name.startswith("_") and isinstance(value, str)
+)
+_SELF_LOADS = ("LOAD_FAST", "LOAD_FAST_CHECK", "LOAD_FAST_BORROW", "LOAD_DEREF", "LOAD_FAST_LOAD_FAST")
+_ATTRIBUTE_LOADS = ("LOAD_ATTR", "LOAD_METHOD")
+
+
+class Locator(tuple):
+    """Immutable (by, value) pair, validated when the page class is defined. Works anywhere a tuple locator does."""
+
+    __slots__ = ()
+
+    def __new__(cls, by, value):
+        if by not in LOCATOR_STRATEGIES:
+            raise ValueError(f"{by!r} isn't a locator strategy. Use one of: {sorted(LOCATOR_STRATEGIES)}.")
+        if not isinstance(value, str) or not value.strip():
+            raise ValueError(f"The {by} locator needs a non-empty string value, not {value!r}.")
+        return super().__new__(cls, (by, value))
+
+    @property
+    def by(self):
+        return self[0]
+
+    @property
+    def value(self):
+        return self[1]
+
+    def __repr__(self):
+        return f"Locator({self[0]!r}, {self[1]!r})"
+
+
+class LocatorTable:
+    """Read-only, __slots__-backed table of the locators a page class declares or inherits."""
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"The locators of {type(self).__name__} are read-only.")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"The locators of {type(self).__name__} are read-only.")
+
+    def __iter__(self):
+        for name in type(self).__slots__:
+            yield name, getattr(self, name)
+
+    def __len__(self):
+        return len(type(self).__slots__)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(f'{name}={locator!r}' for name, locator in self)})"
+
+
+def _is_locator(value):
+    return isinstance(value, tuple) and len(value) == 2 and isinstance(value[0], str) and value[0] in LOCATOR_STRATEGIES
+
+
+def _functions(page_class):
+    """Yields (name, function) for the methods, properties and nested helpers declared on a class."""
+    for name, value in vars(page_class).items():
+        if isinstance(value, (staticmethod, classmethod)):
+            value = value.__func__
+        if isinstance(value, property):
+            for accessor in (value.fget, value.fset, value.fdel):
+                if accessor is not None:
+                    yield name, inspect.unwrap(accessor)
+        elif callable(value) and hasattr(value, "__code__"):
+            yield name, inspect.unwrap(value)
+
+
+def _self_attributes(code):
+    """Returns the attribute names a code object (and the code nested in it) reads and assigns on "self"."""
+    loads, stores = set(), set()
+    instructions = list(dis.get_instructions(code))
+    for previous, instruction in zip(instructions, instructions[1:]):
+        if previous.opname not in _SELF_LOADS:
+            continue
+        receiver = previous.argval[-1] if isinstance(previous.argval, tuple) else previous.argval
+        if receiver != "self":
+            continue
+        if instruction.opname in _ATTRIBUTE_LOADS:
+            loads.add(instruction.argval)
+        elif instruction.opname == "STORE_ATTR":
+            stores.add(instruction.argval)
+    for constant in code.co_consts:
+        if isinstance(constant, types.CodeType):
+            nested_loads, nested_stores = _self_attributes(constant)
+            loads |= nested_loads
+            stores |= nested_stores
+    return loads, stores
+
+
+def compile_page_model(page_class):
+    """Validates a page class and compiles its locators into page_class.locators, once, when it is defined.
+
+    Every (by, value) class attribute becomes a Locator, and every self.<name> a method reads must be a
+    class attribute or assigned on self somewhere in the class hierarchy, so misspelled or missing locators
+    fail at import (and so at test collection) instead of in the middle of a test.
+    """
+    for name, value in list(vars(page_class).items()):
+        if _is_locator(value) and not isinstance(value, Locator):
+            setattr(page_class, name, Locator(*value))
+    locators = {}
+    for klass in reversed(page_class.__mro__[:-1]):
+        for name, value in vars(klass).items():
+            if _is_locator(value):
+                locators[name] = value if isinstance(value, Locator) else Locator(*value)
+    table_class = type(f"{page_class.__name__}Locators", (LocatorTable,), {"__slots__": tuple(locators)})
+    table = object.__new__(table_class)
+    for name, locator in locators.items():
+        object.__setattr__(table, name, locator)
+    page_class.locators = table
+
+    assigned = set()
+    reads = []
+    for klass in page_class.__mro__[:-1]:
+        for method_name, function in _functions(klass):
+            loads, stores = _self_attributes(function.__code__)
+            assigned |= stores
+            if klass is page_class:
+                reads.extend((method_name, name) for name in sorted(loads))
+    known = assigned | set(dir(page_class))
+    for method_name, name in reads:
+        if name not in known:
+            suggestions = difflib.get_close_matches(name, known, n=1)
+            hint = f" Did you mean self.{suggestions[0]}?" if suggestions else ""
+            raise AttributeError(
+                f"{page_class.__qualname__}.{method_name} uses self.{name}, which isn't a locator or attribute "
+                f"of the page.{hint}"
+            )
+    return table
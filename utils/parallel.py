@@ -0,0 +1,71 @@
+import json
+import os
+
+from utils.logger_instance import logger
+
+
+def get_worker_id():
+    """Returns the pytest-xdist worker id of the current process, or "main" when running serially."""
+    return os.getenv("PYTEST_XDIST_WORKER", "main")
+
+
+def is_worker(config):
+    """Returns True if the pytest config belongs to an xdist worker process."""
+    return hasattr(config, "workerinput")
+
+
+def get_worker_dir(base_dir, worker_id=None):
+    """Returns (and creates) a directory under base_dir that belongs to the given worker only."""
+    worker_dir = os.path.join(base_dir, worker_id or get_worker_id())
+    os.makedirs(worker_dir, exist_ok=True)
+    return worker_dir
+
+
+class DurationStore:
+    def __init__(self, file_path="reports/test_durations.json"):
+        """Keeps historical per-test durations used to balance tests across parallel workers."""
+        self.file_path = file_path
+        self.logger = logger
+        self.durations = self._load()
+        self._current = {}
+
+    def _load(self):
+        """Loads the durations recorded by previous runs."""
+        try:
+            with open(self.file_path) as durations_file:
+                return json.load(durations_file)
+        except FileNotFoundError:
+            return {}
+        except json.JSONDecodeError as e:
+            self.logger.warning(f"The durations file {self.file_path} is corrupted and will be ignored. Error: {e}")
+            return {}
+
+    def record(self, nodeid, duration):
+        """Adds the duration of one test phase (setup, call or teardown) to the current run."""
+        self._current[nodeid] = self._current.get(nodeid, 0.0) + duration
+
+    def pytest_runtest_logreport(self, report):
+        """Collects test phase durations, including the ones reported back by xdist workers."""
+        if not report.skipped:
+            self.record(report.nodeid, report.duration)
+
+    def save(self):
+        """Merges the durations of the current run into the durations file."""
+        if not self._current:
+            return
+        self.durations.update({nodeid: round(duration, 4) for nodeid, duration in self._current.items()})
+        os.makedirs(os.path.dirname(self.file_path) or ".", exist_ok=True)
+        with open(self.file_path, "w") as durations_file:
+            json.dump(self.durations, durations_file, indent=4, sort_keys=True)
+        self.logger.info(f"Saved {len(self._current)} test durations to {self.file_path}")
+
+    def sort_longest_first(self, items):
+        """Sorts pytest items in place so that the historically slowest tests are scheduled first.
+
+        Tests without a recorded duration are assumed to take the average duration. The sort is
+        stable and deterministic, so every worker ends up with the same collection order.
+        """
+        if not self.durations:
+            return
+        default = sum(self.durations.values()) / len(self.durations)
+        items.sort(key=lambda item: -self.durations.get(item.nodeid, default))
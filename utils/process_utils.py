@@ -0,0 +1,165 @@
+import os
+import signal
+import time
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+
+def get_driver_service_pid(web_driver):
+    """Returns the PID of the driver service process (chromedriver, geckodriver...) or None for remote drivers."""
+    service = getattr(web_driver, "service", None)
+    process = getattr(service, "process", None)
+    return getattr(process, "pid", None)
+
+
+def process_info_available():
+    """Returns True if process trees and memory can be read, through psutil or the Linux /proc filesystem."""
+    return psutil is not None or os.path.isdir("/proc")
+
+
+def get_process_tree(pid):
+    """Returns the PID and the PIDs of every descendant of a process, or [] when they can't be read."""
+    if psutil is not None:
+        try:
+            return [pid] + [child.pid for child in psutil.Process(pid).children(recursive=True)]
+        except psutil.Error:
+            return []
+    try:
+        entries = os.listdir("/proc")
+    except OSError:
+        return []
+    children = {}
+    for entry in entries:
+        if entry.isdigit():
+            parent = _read_parent_pid(int(entry))
+            if parent is not None:
+                children.setdefault(parent, []).append(int(entry))
+    if not os.path.exists(f"/proc/{pid}"):
+        return []
+    tree, pending = [], [pid]
+    while pending:
+        current = pending.pop()
+        tree.append(current)
+        pending.extend(children.get(current, []))
+    return tree
+
+
+def get_rss_bytes(pid):
+    """Returns the resident memory of one process in bytes, or 0 if it is gone."""
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).memory_info().rss
+        except psutil.Error:
+            return 0
+    try:
+        with open(f"/proc/{pid}/statm") as statm_file:
+            return int(statm_file.read().split()[1]) * PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return 0
+
+
+def get_tree_rss_bytes(pid):
+    """Returns the resident memory of a process and all of its descendants in bytes."""
+    return sum(get_rss_bytes(tree_pid) for tree_pid in get_process_tree(pid))
+
+
+def get_cpu_seconds(pid):
+    """Returns the user and system CPU time used by one process in seconds, or 0 if it is gone."""
+    if psutil is not None:
+        try:
+            cpu_times = psutil.Process(pid).cpu_times()
+            return cpu_times.user + cpu_times.system
+        except psutil.Error:
+            return 0.0
+    fields = _read_stat_fields(pid)
+    if fields is None:
+        return 0.0
+    return (int(fields[11]) + int(fields[12])) / CLOCK_TICKS
+
+
+def get_tree_cpu_seconds(pid):
+    """Returns the CPU time used by a process and all of its descendants in seconds."""
+    return sum(get_cpu_seconds(tree_pid) for tree_pid in get_process_tree(pid))
+
+
+def is_running(pid):
+    """Returns True if the process exists and isn't a zombie."""
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).status() != psutil.STATUS_ZOMBIE
+        except psutil.Error:
+            return False
+    fields = _read_stat_fields(pid)
+    return fields is not None and fields[0] not in ("Z", "X")
+
+
+def get_start_time(pid):
+    """Returns an opaque start time of a process, used to tell it apart from a later process reusing its PID."""
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).create_time()
+        except psutil.Error:
+            return None
+    fields = _read_stat_fields(pid)
+    return int(fields[19]) if fields is not None else None
+
+
+def kill_process(pid, grace_period=2.0):
+    """Terminates a process, killing it if it is still alive after the grace period. Returns True if it is gone."""
+    if psutil is not None:
+        try:
+            process = psutil.Process(pid)
+            process.terminate()
+            process.wait(grace_period)
+        except psutil.TimeoutExpired:
+            process.kill()
+        except psutil.Error:
+            pass
+        return not psutil.pid_exists(pid)
+    try:
+        os.kill(pid, signal.SIGTERM)
+        deadline = time.monotonic() + grace_period
+        while time.monotonic() < deadline and is_running(pid):
+            time.sleep(0.05)
+        if is_running(pid):
+            os.kill(pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+    except PermissionError:
+        return False
+    return True
+
+
+def get_available_memory_bytes():
+    """Returns the memory available for new processes in bytes, or None when it can't be determined."""
+    if psutil is not None:
+        return psutil.virtual_memory().available
+    try:
+        with open("/proc/meminfo") as meminfo_file:
+            for line in meminfo_file:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def _read_stat_fields(pid):
+    """Returns the fields of /proc/<pid>/stat that follow the command name, starting with the state."""
+    try:
+        with open(f"/proc/{pid}/stat") as stat_file:
+            return stat_file.read().rsplit(")", 1)[1].split()
+    except (OSError, IndexError):
+        return None
+
+
+def _read_parent_pid(pid):
+    fields = _read_stat_fields(pid)
+    return int(fields[1]) if fields is not None else None
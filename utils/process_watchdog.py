@@ -0,0 +1,114 @@
+from utils.logger_instance import logger
+from utils.process_utils import (
+    get_cpu_seconds,
+    get_driver_service_pid,
+    get_process_tree,
+    get_rss_bytes,
+    get_start_time,
+    is_running,
+    kill_process,
+    process_info_available,
+)
+
+MIB = 1024 * 1024
+
+
+class ProcessWatchdog:
+    def __init__(self, enabled=True, memory_growth_threshold_mb=150, kill_orphans=True):
+        """Tracks the driver and browser processes of every WebDriver session to catch leaks.
+
+        Every sample remembers the PIDs of the session's process tree, so processes that outlive quit() (or
+        a crashed driver) can still be found and killed afterwards. Per-test samples report RSS and CPU
+        and flag tests whose browser memory grew by more than the threshold.
+        """
+        self.logger = logger
+        self._sessions = {}
+        self.flagged_tests = []
+        self.orphans_killed = 0
+        self.configure(enabled, memory_growth_threshold_mb, kill_orphans)
+
+    def configure(self, enabled, memory_growth_threshold_mb, kill_orphans):
+        """Applies the settings; the watchdog turns itself off where neither psutil nor /proc is available."""
+        if enabled and not process_info_available():
+            self.logger.warning("The process watchdog is off: install psutil to monitor browsers on this platform.")
+            enabled = False
+        self.enabled = enabled
+        self.memory_growth_threshold_mb = memory_growth_threshold_mb
+        self.kill_orphans = kill_orphans
+
+    def track(self, web_driver):
+        """Starts tracking the process tree of a freshly created WebDriver session."""
+        service_pid = get_driver_service_pid(web_driver)
+        if not self.enabled or service_pid is None:
+            return
+        self._sessions[web_driver.session_id] = {"service_pid": service_pid, "known": {}, "test_start": None}
+        self.sample(web_driver)
+
+    def sample(self, web_driver):
+        """Returns the current RSS in bytes and CPU time in seconds of the session's processes."""
+        session = self._sessions.get(getattr(web_driver, "session_id", None))
+        if session is None:
+            return None
+        rss_bytes, cpu_seconds = 0, 0.0
+        for pid in get_process_tree(session["service_pid"]):
+            session["known"].setdefault(pid, get_start_time(pid))
+            rss_bytes += get_rss_bytes(pid)
+            cpu_seconds += get_cpu_seconds(pid)
+        return {"rss_bytes": rss_bytes, "cpu_seconds": cpu_seconds}
+
+    def begin_test(self, web_driver):
+        session = self._sessions.get(getattr(web_driver, "session_id", None))
+        if session is not None:
+            session["test_start"] = self.sample(web_driver)
+
+    def end_test(self, web_driver, test_name):
+        """Returns the memory and CPU figures of the test, flagging it if the browser memory grew too much."""
+        session = self._sessions.get(getattr(web_driver, "session_id", None))
+        if session is None or session["test_start"] is None:
+            return None
+        start, end = session["test_start"], self.sample(web_driver)
+        session["test_start"] = None
+        growth_mb = (end["rss_bytes"] - start["rss_bytes"]) / MIB
+        figures = {
+            "rss_start_mb": round(start["rss_bytes"] / MIB, 1),
+            "rss_end_mb": round(end["rss_bytes"] / MIB, 1),
+            "rss_growth_mb": round(growth_mb, 1),
+            "cpu_seconds": round(end["cpu_seconds"] - start["cpu_seconds"], 2),
+            "flagged": growth_mb > self.memory_growth_threshold_mb,
+        }
+        if figures["flagged"]:
+            self.flagged_tests.append((test_name, figures))
+            self.logger.warning(
+                "The browser memory grew by %.1f MiB during %s, more than the %s MiB threshold.",
+                growth_mb,
+                test_name,
+                self.memory_growth_threshold_mb,
+            )
+        return figures
+
+    def reap(self, web_driver):
+        """Kills the processes of a quit WebDriver session that are still running."""
+        session = self._sessions.pop(getattr(web_driver, "session_id", None), None)
+        if session is not None:
+            self._kill_orphans(session)
+
+    def reap_all(self):
+        """Kills the leftover processes of every session still tracked, at the end of the test session."""
+        while self._sessions:
+            _, session = self._sessions.popitem()
+            self._kill_orphans(session)
+        if self.orphans_killed:
+            self.logger.warning("The process watchdog killed %s orphaned browser processes.", self.orphans_killed)
+
+    def _kill_orphans(self, session):
+        if not self.kill_orphans:
+            return
+        for pid, start_time in session["known"].items():
+            if start_time is None or not is_running(pid) or get_start_time(pid) != start_time:
+                continue
+            self.logger.warning("Killing the orphaned browser process %s.", pid)
+            if kill_process(pid):
+                self.orphans_killed += 1
+
+
+process_watchdog = ProcessWatchdog()
@@ -0,0 +1,159 @@
+import functools
+import json
+import os
+import time
+from contextlib import contextmanager
+
+from utils.impact_analysis import impact_recorder
+from utils.logger_instance import logger
+
+
+class _Frame:
+    __slots__ = ("name", "page", "action", "locator", "start", "wait", "round_trip", "children")
+
+    def __init__(self, page, action, locator):
+        self.page = page
+        self.action = action
+        self.locator = locator
+        self.name = f"{page}.{action}" + (f"({locator[0]}={locator[1]})" if locator else "")
+        self.start = time.perf_counter()
+        self.wait = 0.0
+        self.round_trip = 0.0
+        self.children = 0.0
+
+
+class ActionProfiler:
+    def __init__(self):
+        """Times every page action and splits it between WebDriver round-trips, waits and local overhead.
+
+        Time spent in nested actions (a click that calls find_element) is attributed to the innermost one,
+        so the "self" figures of all actions add up to the real time spent in the page-object layer.
+        """
+        self.logger = logger
+        self.enabled = False
+        self.current_test = None
+        self._stack = []
+        self._in_wait = False
+        self.actions = {}
+        self.locators = {}
+        self.pages = {}
+        self.tests = {}
+        self.stacks = {}
+
+    def instrument_driver(self, driver):
+        """Wraps driver.execute so every WebDriver command round-trip is timed."""
+        if getattr(driver, "_profiler_instrumented", False):
+            return
+        execute = driver.execute
+
+        def timed_execute(driver_command, params=None):
+            start = time.perf_counter()
+            try:
+                return execute(driver_command, params)
+            finally:
+                if self._stack and not self._in_wait:
+                    self._stack[-1].round_trip += time.perf_counter() - start
+
+        driver.execute = timed_execute
+        driver._profiler_instrumented = True
+
+    @contextmanager
+    def action(self, page, action, locator=None):
+        """Times a page action performed by the given page class."""
+        if not self.enabled:
+            yield
+            return
+        frame = _Frame(page, action, locator)
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            self._finish(frame, time.perf_counter() - frame.start)
+
+    @contextmanager
+    def waiting(self):
+        """Marks the enclosed block as waiting time of the current action."""
+        if not self._stack or self._in_wait:
+            yield
+            return
+        start = time.perf_counter()
+        self._in_wait = True
+        try:
+            yield
+        finally:
+            self._in_wait = False
+            self._stack[-1].wait += time.perf_counter() - start
+
+    def _finish(self, frame, total):
+        if self._stack:
+            self._stack[-1].children += total
+        own = max(total - frame.children, 0.0)
+        split = {
+            "total": total,
+            "self": own,
+            "wait": frame.wait,
+            "round_trip": frame.round_trip,
+            "local": max(own - frame.wait - frame.round_trip, 0.0),
+        }
+        _accumulate(self.actions, f"{frame.page}.{frame.action}", split)
+        _accumulate(self.pages, frame.page, split)
+        if frame.locator:
+            _accumulate(self.locators, f"{frame.locator[0]}={frame.locator[1]}", split)
+        if not self._stack:
+            _accumulate(self.tests, self.current_test or "<no test>", split)
+        path = ";".join([self.current_test or "<no test>"] + [parent.name for parent in self._stack] + [frame.name])
+        self.stacks[path] = self.stacks.get(path, 0.0) + own
+
+    def report(self, limit=20):
+        """Returns the profile with the slowest actions, locators, pages and tests ranked by total time."""
+        return {
+            "slowest_actions": _ranked(self.actions, limit),
+            "slowest_locators": _ranked(self.locators, limit),
+            "pages": _ranked(self.pages, None),
+            "tests": _ranked(self.tests, None),
+        }
+
+    def save(self, output_dir):
+        """Writes profile.json and a flame-graph compatible profile.folded (microseconds) to output_dir."""
+        if not self.actions:
+            return
+        os.makedirs(output_dir, exist_ok=True)
+        with open(os.path.join(output_dir, "profile.json"), "w") as profile_file:
+            json.dump(self.report(), profile_file, indent=4)
+        with open(os.path.join(output_dir, "profile.folded"), "w") as folded_file:
+            for path, seconds in sorted(self.stacks.items()):
+                folded_file.write(f"{path.replace(' ', '_')} {max(int(seconds * 1_000_000), 1)}\n")
+        self.logger.info("The page action profile has been written to %s", output_dir)
+
+
+def _accumulate(table, key, split):
+    stats = table.setdefault(key, {"count": 0, "total": 0.0, "self": 0.0, "wait": 0.0, "round_trip": 0.0, "local": 0.0})
+    stats["count"] += 1
+    for name, value in split.items():
+        stats[name] += value
+
+
+def _ranked(table, limit):
+    ranked = sorted(table.items(), key=lambda item: item[1]["total"], reverse=True)
+    return [dict(name=name, mean=stats["total"] / stats["count"], **stats) for name, stats in ranked[:limit]]
+
+
+profiler = ActionProfiler()
+
+
+def profiled(method):
+    """Decorates a page-object method so its calls are timed by the profiler; the locator is the first argument."""
+
+    @functools.wraps(method)
+    def wrapper(page, *args, **kwargs):
+        locator = args[0] if args and isinstance(args[0], tuple) else kwargs.get("locator")
+        if impact_recorder.enabled:
+            impact_recorder.record(page, locator, method)
+        if not profiler.enabled:
+            return method(page, *args, **kwargs)
+        with profiler.action(type(page).__name__, method.__name__, locator):
+            return method(page, *args, **kwargs)
+
+    wrapper.records_impact = True
+    return wrapper
@@ -0,0 +1,194 @@
+import time
+
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    JavascriptException,
+    MoveTargetOutOfBoundsException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support import expected_conditions as EC
+
+from utils.logger_instance import logger
+
+
+# The failures a recovery strategy can get an action past.
+RECOVERABLE_EXCEPTIONS = (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    StaleElementReferenceException,
+)
+_STRATEGY_FAILURES = RECOVERABLE_EXCEPTIONS + (TimeoutException, JavascriptException, MoveTargetOutOfBoundsException)
+
+
+def perform_natively(element, action, text=None):
+    """Performs the action the way a test normally would, through the WebElement."""
+    if action == "click":
+        element.click()
+    else:
+        element.clear()
+        element.send_keys(text)
+
+
+def _locate(page, locator, timeout):
+    return page.wait.until(EC.presence_of_element_located(locator), timeout=timeout, label=("presence", locator))
+
+
+class ScrollIntoViewStrategy:
+    """Scrolls the element to the middle of the viewport, out from under sticky headers, and retries."""
+
+    name = "scroll"
+    actions = ("click", "send_keys")
+
+    def apply(self, page, locator, action, text, timeout):
+        element = _locate(page, locator, timeout)
+        page.driver.execute_script("arguments[0].scrollIntoView({block: 'center', inline: 'center'});", element)
+        perform_natively(element, action, text)
+
+
+class WaitForOverlayStrategy:
+    """Waits for the page's loading overlay to go away, then retries."""
+
+    name = "wait_for_overlay"
+    actions = ("click", "send_keys")
+
+    def apply(self, page, locator, action, text, timeout):
+        start = time.monotonic()
+        page.wait.until(
+            EC.invisibility_of_element_located(page.IS_LOADING_OVERLAY),
+            timeout=timeout,
+            label=("overlay gone", page.IS_LOADING_OVERLAY),
+        )
+        perform_natively(_locate(page, locator, max(timeout - (time.monotonic() - start), 0)), action, text)
+
+
+class JavaScriptClickStrategy:
+    """Dispatches the click from JavaScript, which no overlapping element can intercept.
+
+    It is a last resort: it also "clicks" elements a user couldn't, so it is never promoted by what was learned.
+    """
+
+    name = "js_click"
+    actions = ("click",)
+    last_resort = True
+
+    def apply(self, page, locator, action, text, timeout):
+        page.driver.execute_script("arguments[0].click();", _locate(page, locator, timeout))
+
+
+class ActionChainsStrategy:
+    """Moves the pointer onto the element and acts through ActionChains."""
+
+    name = "action_chains"
+    actions = ("click", "send_keys")
+
+    def apply(self, page, locator, action, text, timeout):
+        start = time.monotonic()
+        element = _locate(page, locator, timeout)
+        # The pointer move is animated (250ms by default), so it only gets what is left of the budget.
+        duration = int(max(min(timeout - (time.monotonic() - start), 0.25), 0) * 1000)
+        chain = ActionChains(page.driver, duration=duration).move_to_element(element).click()
+        if action == "send_keys":
+            chain.key_down(Keys.CONTROL).send_keys("a").key_up(Keys.CONTROL).send_keys(text)
+        chain.perform()
+
+
+class RecoveryEngine:
+    def __init__(self, strategies=("wait_for_overlay", "scroll", "action_chains", "js_click")):
+        """Gets page actions past interceptions and non-interactable elements within one time budget.
+
+        The strategies are tried in the configured order, except that for every (action, locator) the ones
+        that already recovered it are tried first, fastest first, and last-resort strategies always come last.
+        Every strategy only gets the time left of the action's budget, and none is started once it ran out.
+        """
+        self.logger = logger
+        self.available = {}
+        for strategy in (
+            WaitForOverlayStrategy(), ScrollIntoViewStrategy(), ActionChainsStrategy(), JavaScriptClickStrategy()
+        ):
+            self.register(strategy)
+        self.strategies = list(strategies)
+        self._memory = {}
+        self.stats = {}
+
+    def configure(self, strategies):
+        unknown = [name for name in strategies if name not in self.available]
+        if unknown:
+            raise ValueError(f"Unknown recovery strategies: {unknown}. Available: {sorted(self.available)}")
+        self.strategies = list(strategies)
+
+    def register(self, strategy):
+        """Adds a strategy (an object with a name, the actions it supports and apply()) to the available ones."""
+        self.available[strategy.name] = strategy
+
+    def ordered_strategies(self, action, locator):
+        """Returns the strategies to try for this action and locator, the ones that worked before first and the
+        last-resort ones last."""
+        learned = self._memory.get((action, locator), {})
+        candidates = [
+            self.available[name] for name in self.strategies if action in self.available[name].actions
+        ]
+        return sorted(
+            candidates,
+            key=lambda strategy: (
+                getattr(strategy, "last_resort", False),
+                strategy.name not in learned,
+                learned[strategy.name][1] / learned[strategy.name][0] if strategy.name in learned else 0,
+            ),
+        )
+
+    def recover(self, page, locator, action, deadline, error, text=None):
+        """Retries a failed action with each strategy until one succeeds or the deadline passes.
+
+        Returns the name of the strategy that worked, or raises the last error the action failed with.
+        """
+        self.logger.log_method_entry(self.recover.__name__)
+        self.logger.warning("The %s on %s failed, trying to recover. Error: %s", action, locator, error)
+        for strategy in self.ordered_strategies(action, locator):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.logger.warning("The time budget of the %s on %s ran out while recovering.", action, locator)
+                break
+            start = time.monotonic()
+            try:
+                strategy.apply(page, locator, action, text, remaining)
+            except _STRATEGY_FAILURES as e:
+                self._record(strategy.name, False, time.monotonic() - start)
+                self.logger.debug(
+                    "The %s strategy didn't recover the %s on %s. Error: %s", strategy.name, action, locator, e
+                )
+                if isinstance(e, RECOVERABLE_EXCEPTIONS):
+                    error = e
+                if time.monotonic() >= deadline:
+                    self.logger.warning(
+                        "The %s strategy used up the time budget of the %s on %s.", strategy.name, action, locator
+                    )
+                    break
+                continue
+            elapsed = time.monotonic() - start
+            self._record(strategy.name, True, elapsed)
+            if time.monotonic() > deadline:
+                self.logger.warning(
+                    "The %s strategy recovered the %s on %s but overran its time budget by %.2fs.",
+                    strategy.name, action, locator, time.monotonic() - deadline,
+                )
+            if not getattr(strategy, "last_resort", False):
+                learned = self._memory.setdefault((action, locator), {}).setdefault(strategy.name, [0, 0.0])
+                learned[0] += 1
+                learned[1] += elapsed
+            self.logger.info(
+                "Recovered the %s on %s with the %s strategy in %.2fs.", action, locator, strategy.name, elapsed
+            )
+            return strategy.name
+        raise error
+
+    def _record(self, name, recovered, elapsed):
+        stats = self.stats.setdefault(name, {"recovered": 0, "failed": 0, "seconds": 0.0})
+        stats["recovered" if recovered else "failed"] += 1
+        stats["seconds"] += elapsed
+
+
+recovery_engine = RecoveryEngine()
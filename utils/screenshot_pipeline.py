@@ -0,0 +1,123 @@
+import hashlib
+import io
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.logger_instance import logger
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+
+IMAGE_FORMATS = {
+    "webp": ("WEBP", "image/webp", "webp"),
+    "jpeg": ("JPEG", "image/jpeg", "jpg"),
+    "png": ("PNG", "image/png", "png"),
+}
+
+
+class ScreenshotPipeline:
+    def __init__(self, output_dir, image_format="webp", quality=70, max_workers=2, budget_mb=100, deduplicate=True):
+        """Captures raw screenshots on the caller's thread and compresses them on a background thread pool.
+
+        Encoding to WebP or JPEG needs Pillow; without it screenshots are kept as PNG. Identical frames are
+        written once, and once the per-session size budget is used up further screenshots are dropped.
+        """
+        if image_format.lower() not in IMAGE_FORMATS:
+            raise ValueError(
+                f"The screenshot format {image_format!r} isn't supported. Use one of: {sorted(IMAGE_FORMATS)}."
+            )
+        self.logger = logger
+        self.output_dir = output_dir
+        self.image_format = image_format.lower() if Image is not None else "png"
+        self.quality = quality
+        self.budget_bytes = int(budget_mb * 1024 * 1024)
+        self.deduplicate = deduplicate
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="screenshot")
+        self._lock = threading.Lock()
+        self._frames = {}
+        self.bytes_written = 0
+        self.captured = 0
+        self.deduplicated = 0
+        self.over_budget = 0
+        if Image is None and image_format.lower() != "png":
+            self.logger.warning("Pillow isn't installed, failure screenshots will be kept as PNG.")
+
+    def capture(self, driver, name, element=None):
+        """Grabs a screenshot (optionally cropped to a WebElement) and returns a Future of the saved file.
+
+        The Future resolves to a (path, mime_type, extension) tuple, or None if the screenshot was dropped.
+        """
+        try:
+            raw_png = driver.get_screenshot_as_png()
+            crop_box = self._crop_box(driver, element) if element is not None else None
+        except WebDriverException as e:
+            self.logger.error("Couldn't take a screenshot for %s. Error: %s", name, e)
+            return None
+        self.captured += 1
+        digest = hashlib.sha1(raw_png + repr(crop_box).encode()).hexdigest()
+        with self._lock:
+            if self.deduplicate and digest in self._frames:
+                self.deduplicated += 1
+                return self._frames[digest]
+            future = self._executor.submit(self._encode_and_save, raw_png, name, crop_box)
+            self._frames[digest] = future
+        return future
+
+    def submit(self, function, *args):
+        """Runs another failure artifact writer on the screenshot threads and returns its Future."""
+        return self._executor.submit(function, *args)
+
+    def shutdown(self):
+        """Waits until every pending screenshot has been written."""
+        self._executor.shutdown(wait=True)
+        self.logger.info(
+            "Screenshots: %s captured, %s deduplicated, %s over budget, %s KiB written.",
+            self.captured,
+            self.deduplicated,
+            self.over_budget,
+            self.bytes_written // 1024,
+        )
+
+    def _crop_box(self, driver, element):
+        """Returns the element's box in screenshot pixels, taking the device pixel ratio into account."""
+        rect = element.rect
+        ratio = driver.execute_script("return window.devicePixelRatio || 1;")
+        return tuple(
+            int(value * ratio)
+            for value in (rect["x"], rect["y"], rect["x"] + rect["width"], rect["y"] + rect["height"])
+        )
+
+    def _encode_and_save(self, raw_png, name, crop_box):
+        pil_format, mime_type, extension = IMAGE_FORMATS[self.image_format]
+        if Image is not None and (crop_box is not None or self.image_format != "png"):
+            image = Image.open(io.BytesIO(raw_png))
+            if crop_box is not None:
+                image = image.crop(crop_box)
+            if pil_format == "JPEG":
+                image = image.convert("RGB")
+            buffer = io.BytesIO()
+            image.save(buffer, format=pil_format, quality=self.quality, optimize=True)
+            data = buffer.getvalue()
+        else:
+            data = raw_png
+        with self._lock:
+            if self.bytes_written + len(data) > self.budget_bytes:
+                self.over_budget += 1
+                self.logger.warning("The screenshot budget is used up, dropping the screenshot of %s.", name)
+                return None
+            self.bytes_written += len(data)
+        os.makedirs(self.output_dir, exist_ok=True)
+        file_path = os.path.join(self.output_dir, f"{_safe_file_name(name)}.{extension}")
+        with open(file_path, "wb") as screenshot_file:
+            screenshot_file.write(data)
+        return file_path, mime_type, extension
+
+
+def _safe_file_name(name):
+    return "".join(char if char.isalnum() or char in "-_." else "_" for char in name)
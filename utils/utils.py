@@ -1,13 +1,15 @@
+import itertools
 import json
 import pytest
 
+from utils.data_store import STREAMING_FORMATS, data_store
+
 
 def read_json(file_name):
-    """Reads a JSON file and returns the data."""
+    """Reads a JSON file and returns a copy of the data. The file is only parsed once per process."""
     file_path = f"data/{file_name}"
     try:
-        with open(file_path, "r") as file:
-            return json.load(file)
+        return data_store.load(file_name)
     except FileNotFoundError:
         print(f"File not found: {file_path}")
         return []
@@ -17,7 +19,15 @@ def read_json(file_name):
 
 
 def get_test_data(file_name, main_key, data_keys=None, key_val=False):
-    """Obtain parameterized data tuples from a JSON file."""
+    """Obtain parameterized data tuples from a JSON, JSON Lines or CSV file.
+
+    JSON Lines and CSV files are read row by row instead of being parsed as one document and cached, but
+    pytest.mark.parametrize turns the returned iterator into a list at collection, so every selected row is
+    still held in memory while the tests run.
+    """
+    if file_name.endswith(STREAMING_FORMATS):
+        return _get_streamed_test_data(file_name, main_key, data_keys, key_val)
+
     test_data = read_json(file_name)
 
     if not test_data or main_key not in test_data:
@@ -30,12 +40,24 @@ def get_test_data(file_name, main_key, data_keys=None, key_val=False):
     if not key_val:
         return data_list
 
-    extracted_data = []
+    try:
+        return data_store.get_tuples(file_name, main_key, data_keys)
+    except KeyError as e:
+        pytest.skip(f"Missing expected key {e} in data under key '{main_key}' in '{file_name}'.")
 
-    for item in data_list:
-        try:
-            extracted_data.append(tuple(item[key] for key in data_keys))
-        except KeyError as e:
-            pytest.skip(f"Missing expected key {e} in data item: {item}")
 
-    return extracted_data
+def _get_streamed_test_data(file_name, main_key, data_keys, key_val):
+    """Returns an iterator over the rows of a streaming data file, skipping if there are none."""
+    try:
+        if key_val:
+            rows = data_store.iter_tuples(file_name, main_key, data_keys)
+        else:
+            rows = data_store.iter_rows(file_name, main_key)
+        first_row = next(rows)
+    except FileNotFoundError:
+        pytest.skip(f"Skipping tests: File not found: data/{file_name}")
+    except StopIteration:
+        pytest.skip(f"Skipping tests: No data found under key '{main_key}' in '{file_name}'.")
+    except KeyError as e:
+        pytest.skip(f"Missing expected key {e} in data under key '{main_key}' in '{file_name}'.")
+    return itertools.chain([first_row], rows)
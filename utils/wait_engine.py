@@ -0,0 +1,193 @@
+import json
+import os
+import time
+
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
+
+from utils.impact_analysis import impact_recorder
+from utils.logger_instance import logger
+from utils.profiler import profiler
+
+
+# Resolves as soon as the condition (the body of a function receiving the extra arguments as "args") returns
+# a truthy value, re-checking on every DOM mutation instead of polling from the client.
+DOM_CONDITION_SCRIPT = """
+const done = arguments[arguments.length - 1];
+const [conditionBody, timeoutMs, ...args] = Array.prototype.slice.call(arguments, 0, -1);
+const condition = new Function("args", conditionBody);
+function evaluate() {
+    try { return condition(args); } catch (e) { return null; }
+}
+const initial = evaluate();
+if (initial) { done({satisfied: true, value: initial}); return; }
+let timer = null;
+const observer = new MutationObserver(() => {
+    const value = evaluate();
+    if (value) { observer.disconnect(); clearTimeout(timer); done({satisfied: true, value: value}); }
+});
+observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+timer = setTimeout(() => { observer.disconnect(); done({satisfied: false, value: null}); }, timeoutMs);
+"""
+
+
+def format_label(label):
+    """Formats a wait label, which is a string or a tuple of parts such as ("find_element", locator)."""
+    return " ".join(str(part) for part in label) if isinstance(label, tuple) else label
+
+
+def default_label(method):
+    """Labels an unlabeled wait after its condition. expected_conditions factories all return a closure named
+    _predicate, so those are labeled with the factory name and the locator (or other values) it closes over."""
+    qualified_name = getattr(method, "__qualname__", "")
+    if "<locals>" not in qualified_name:
+        return getattr(method, "__name__", None) or type(method).__name__
+    parts = [qualified_name.split(".<locals>", 1)[0]]
+    for cell in method.__closure__ or ():
+        try:
+            value = cell.cell_contents
+        except ValueError:
+            continue
+        if callable(value):
+            continue
+        try:
+            hash(value)
+        except TypeError:
+            value = repr(value)
+        parts.append(value)
+    return tuple(parts)
+
+
+class WaitStats:
+    def __init__(self):
+        """Records how long every wait actually took, grouped by label.
+
+        Labels given as tuples of parts are only formatted when the stats are read, not on every wait.
+        """
+        self.waits = {}
+
+    def record(self, label, elapsed, timeout, polls, timed_out):
+        stats = self.waits.setdefault(
+            label, {"count": 0, "total": 0.0, "max": 0.0, "polls": 0, "timeouts": 0, "timeout": timeout}
+        )
+        stats["count"] += 1
+        stats["total"] += elapsed
+        stats["max"] = max(stats["max"], elapsed)
+        stats["polls"] += polls
+        stats["timeouts"] += int(timed_out)
+
+    def slowest(self, limit=10):
+        """Returns the labels with the highest total wait time, slowest first."""
+        ranked = sorted(self.waits.items(), key=lambda item: item[1]["total"], reverse=True)
+        return [
+            dict(label=format_label(label), mean=stats["total"] / stats["count"], **stats)
+            for label, stats in ranked[:limit]
+        ]
+
+    def save(self, file_path):
+        """Writes every recorded wait, slowest first, to a JSON file."""
+        if not self.waits:
+            return
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+        with open(file_path, "w") as stats_file:
+            json.dump(self.slowest(limit=None), stats_file, indent=4)
+
+
+wait_stats = WaitStats()
+
+
+class SmartWait:
+    def __init__(self, driver, timeout=10, initial_poll=0.05, max_poll=0.5, backoff=1.5, ignored_exceptions=None):
+        """Shared wait engine with adaptive polling: tight polls first, backing off towards max_poll.
+
+        Works with the same condition callables as WebDriverWait (expected_conditions included) and
+        records the duration of every wait in wait_stats.
+        """
+        self.driver = driver
+        self.timeout = timeout
+        self.initial_poll = initial_poll
+        self.max_poll = max_poll
+        self.backoff = backoff
+        self.ignored_exceptions = (NoSuchElementException,) + tuple(ignored_exceptions or ())
+        self.logger = logger
+
+    def until(self, method, message="", timeout=None, label=None):
+        """Calls method(driver) until it returns a truthy value, which is returned."""
+        if impact_recorder.enabled:
+            impact_recorder.record()
+        with profiler.waiting():
+            return self._poll(method, message, timeout, label, negate=False)
+
+    def until_not(self, method, message="", timeout=None, label=None):
+        """Calls method(driver) until it returns a falsy value or raises an ignored exception."""
+        if impact_recorder.enabled:
+            impact_recorder.record()
+        with profiler.waiting():
+            return self._poll(method, message, timeout, label, negate=True)
+
+    def until_dom(self, condition_body, *args, timeout=None, label=None, message=""):
+        """Waits inside the page: one execute_async_script call that resolves on a MutationObserver condition.
+
+        condition_body is the body of a JavaScript function that receives the extra arguments as "args" and
+        returns a truthy value once the condition holds. Falls back to client-side polling if the script gets
+        interrupted, for example by a navigation.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        label = label or "until_dom"
+        start = time.monotonic()
+        try:
+            self._ensure_script_timeout(timeout)
+            with profiler.waiting():
+                result = self.driver.execute_async_script(
+                    DOM_CONDITION_SCRIPT, condition_body, int(timeout * 1000), *args
+                )
+        except TimeoutException:
+            result = {"satisfied": False, "value": None}
+        except WebDriverException as e:
+            self.logger.warning(
+                "The page-side wait %s was interrupted, falling back to polling. Error: %s", format_label(label), e
+            )
+            remaining = max(timeout - (time.monotonic() - start), 0)
+            polling_script = f"return (function (args) {{ {condition_body} }})(arguments);"
+            return self.until(
+                lambda driver: driver.execute_script(polling_script, *args), message, timeout=remaining, label=label
+            )
+        elapsed = time.monotonic() - start
+        wait_stats.record(label, elapsed, timeout, 1, not result["satisfied"])
+        if not result["satisfied"]:
+            raise TimeoutException(
+                message or f"The page-side condition {format_label(label)} wasn't met within {timeout} seconds."
+            )
+        return result["value"]
+
+    def _poll(self, method, message, timeout, label, negate):
+        timeout = self.timeout if timeout is None else timeout
+        label = label or default_label(method)
+        start = time.monotonic()
+        end_time = start + timeout
+        poll = self.initial_poll
+        polls = 0
+        while True:
+            polls += 1
+            try:
+                value = method(self.driver)
+                if bool(value) != negate:
+                    wait_stats.record(label, time.monotonic() - start, timeout, polls, False)
+                    return value if not negate else True
+            except self.ignored_exceptions:
+                if negate:
+                    wait_stats.record(label, time.monotonic() - start, timeout, polls, False)
+                    return True
+            remaining = end_time - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(poll, remaining))
+            poll = min(poll * self.backoff, self.max_poll)
+        wait_stats.record(label, time.monotonic() - start, timeout, polls, True)
+        raise TimeoutException(message)
+
+    def _ensure_script_timeout(self, timeout):
+        """Raises the async script timeout above the wait timeout, once per driver session."""
+        needed = timeout + 1
+        if getattr(self.driver, "_smart_wait_script_timeout", 0) < needed:
+            self.driver.set_script_timeout(needed)
+            self.driver._smart_wait_script_timeout = needed
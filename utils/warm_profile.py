@@ -0,0 +1,257 @@
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from contextlib import contextmanager
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.logger_instance import logger
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+CHROMIUM_BROWSERS = ("chrome", "chromium", "brave", "edge")
+PROFILE_LOCK_FILES = ("SingletonLock", "SingletonCookie", "SingletonSocket", "lock", ".parentlock", "parent.lock")
+METADATA_FILE = "warm_profile.json"
+FIRST_PAINT_SCRIPT = (
+    "const entry = performance.getEntriesByName('first-contentful-paint')[0]"
+    " || performance.getEntriesByType('paint')[0];"
+    "return entry ? entry.startTime : null;"
+)
+
+
+def read_first_paint(web_driver):
+    """Returns the first (contentful) paint of the current document in milliseconds, or None."""
+    try:
+        return web_driver.execute_script(FIRST_PAINT_SCRIPT)
+    except WebDriverException:
+        return None
+
+
+def instrument_first_paint(web_driver):
+    """Makes the first driver.get() after every reset record the first paint of the page it loads."""
+    get = web_driver.get
+
+    def get_and_measure(url):
+        get(url)
+        if web_driver.first_paint_ms is None and not url.startswith(("about:", "data:")):
+            web_driver.first_paint_ms = read_first_paint(web_driver)
+
+    web_driver.get = get_and_measure
+    web_driver.first_paint_ms = None
+
+
+class FirstPaintStats:
+    def __init__(self):
+        """Collects the first paint of every test, to compare warm-profile runs with cold ones."""
+        self.samples = {"warm": [], "cold": []}
+        self.template_cold_first_paint = None
+
+    def record(self, first_paint_ms, warm):
+        if first_paint_ms is not None:
+            self.samples["warm" if warm else "cold"].append(first_paint_ms)
+
+    def summary(self):
+        return {
+            mode: {"tests": len(samples), "mean_ms": sum(samples) / len(samples)}
+            for mode, samples in self.samples.items()
+            if samples
+        }
+
+
+first_paint_stats = FirstPaintStats()
+_profile_clones = {}
+
+
+def register_profile_clone(web_driver, profile_dir):
+    _profile_clones[web_driver.session_id] = profile_dir
+
+
+def release_profile_clone(web_driver):
+    """Deletes the warm profile clone of a quit WebDriver session."""
+    profile_dir = _profile_clones.pop(getattr(web_driver, "session_id", None), None)
+    if profile_dir is not None:
+        shutil.rmtree(profile_dir, ignore_errors=True)
+
+
+def release_all_profile_clones():
+    while _profile_clones:
+        _, profile_dir = _profile_clones.popitem()
+        shutil.rmtree(profile_dir, ignore_errors=True)
+
+
+class WarmProfileManager:
+    def __init__(self, settings, browser):
+        """Keeps a pre-warmed browser profile template and hands every session a cheap clone of it.
+
+        The template is built once, by a browser that visits the warm-up URLs so their scripts, styles and
+        images land in the HTTP cache, and rebuilt when it gets older than max_age_hours. Clones use a
+        copy-on-write reflink where the file system supports it. Otherwise only the write-once blobs of Chromium's
+        legacy block-file cache (f_*) are hard-linked and everything else is copied, so a session can never modify
+        the template. Current Chrome uses the Simple Cache, whose entries are updated in place, so there the
+        "hardlink" method amounts to a full copy (and is reported as one).
+        """
+        self.logger = logger
+        self.browser = browser
+        self.enabled = settings["enabled"]
+        self.template_dir = os.path.abspath(os.path.join(settings["template_dir"], browser))
+        self.clone_dir = settings["clone_dir"] or None
+        self.clone_method = settings["clone_method"]
+        self.warm_urls = settings["warm_urls"]
+        self.login = settings["login"]
+        self.max_age = settings["max_age_hours"] * 3600
+        self.measure_first_paint = settings["measure_first_paint"]
+
+    def apply_to_options(self, options, profile_dir):
+        """Points the browser options at the given profile directory."""
+        if self.browser in CHROMIUM_BROWSERS:
+            options.add_argument(f"--user-data-dir={profile_dir}")
+        elif self.browser == "firefox":
+            options.add_argument("-profile")
+            options.add_argument(profile_dir)
+
+    def ensure_template(self, launch):
+        """Builds the template with launch(profile_dir) -> WebDriver unless a fresh one already exists."""
+        with self._build_lock():
+            if self._template_is_fresh():
+                return
+            self.logger.info("Building the warm %s profile template in %s", self.browser, self.template_dir)
+            build_dir = f"{self.template_dir}.building"
+            shutil.rmtree(build_dir, ignore_errors=True)
+            os.makedirs(build_dir)
+            web_driver = launch(build_dir)
+            try:
+                cold_first_paint = self._warm_up(web_driver)
+            finally:
+                web_driver.quit()
+            self._remove_lock_files(build_dir)
+            with open(os.path.join(build_dir, METADATA_FILE), "w") as metadata_file:
+                json.dump({"built_at": time.time(), "cold_first_paint_ms": cold_first_paint}, metadata_file)
+            shutil.rmtree(self.template_dir, ignore_errors=True)
+            os.replace(build_dir, self.template_dir)
+
+    def clone(self):
+        """Returns a new private copy of the template for one browser session."""
+        profile_dir = tempfile.mkdtemp(prefix=f"warm-{self.browser}-", dir=self.clone_dir)
+        os.rmdir(profile_dir)
+        method = self._clone_tree(self.template_dir, profile_dir)
+        self.logger.debug("Cloned the warm profile template to %s using %s.", profile_dir, method)
+        return profile_dir
+
+    @property
+    def template_cold_first_paint(self):
+        metadata = self._read_metadata()
+        return metadata.get("cold_first_paint_ms") if metadata else None
+
+    def _warm_up(self, web_driver):
+        from pages.login_page import LoginPage
+        import variables
+
+        web_driver.get(variables.url_login_page)
+        cold_first_paint = read_first_paint(web_driver)
+        if self.login:
+            LoginPage(web_driver).login(variables.valid_username, variables.valid_password)
+        for url in self.warm_urls:
+            web_driver.get(url)
+        if self.login:
+            # Only the HTTP cache of the logged-in pages is wanted; clones must not start with a session.
+            web_driver.delete_all_cookies()
+            web_driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        return cold_first_paint
+
+    def _template_is_fresh(self):
+        metadata = self._read_metadata()
+        return metadata is not None and time.time() - metadata["built_at"] < self.max_age
+
+    def _read_metadata(self):
+        try:
+            with open(os.path.join(self.template_dir, METADATA_FILE)) as metadata_file:
+                return json.load(metadata_file)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    @contextmanager
+    def _build_lock(self):
+        """Makes sure only one process (one xdist worker) builds the template at a time.
+
+        Uses flock where fcntl exists and an atomically created lock directory elsewhere, such as on Windows.
+        """
+        os.makedirs(os.path.dirname(self.template_dir), exist_ok=True)
+        if fcntl is None:
+            with _directory_lock(f"{self.template_dir}.lockdir"):
+                yield
+            return
+        with open(f"{self.template_dir}.lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _clone_tree(self, source, destination):
+        if self.clone_method in ("auto", "reflink") and shutil.which("cp") is not None:
+            try:
+                result = subprocess.run(
+                    ["cp", "-a", "--reflink=always", source, destination], capture_output=True, check=False
+                )
+            except OSError as e:
+                self.logger.debug("Couldn't reflink the warm profile template. Error: %s", e)
+            else:
+                if result.returncode == 0:
+                    return "reflink"
+            shutil.rmtree(destination, ignore_errors=True)
+        if self.clone_method in ("auto", "reflink", "hardlink"):
+            linked = []
+            shutil.copytree(
+                source, destination, copy_function=lambda src, dst: _link_cache_blob_or_copy(src, dst, linked)
+            )
+            return "hardlink" if linked else "copy"
+        shutil.copytree(source, destination)
+        return "copy"
+
+    def _remove_lock_files(self, profile_dir):
+        for directory, _, file_names in os.walk(profile_dir):
+            for file_name in file_names:
+                if file_name in PROFILE_LOCK_FILES:
+                    os.remove(os.path.join(directory, file_name))
+
+
+@contextmanager
+def _directory_lock(lock_dir, stale_after=600, poll=0.2):
+    """Portable inter-process lock: os.mkdir is atomic everywhere. Locks older than stale_after are broken."""
+    while True:
+        try:
+            os.mkdir(lock_dir)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - os.stat(lock_dir).st_mtime > stale_after:
+                    os.rmdir(lock_dir)
+                    continue
+            except OSError:
+                continue
+            time.sleep(poll)
+    try:
+        yield
+    finally:
+        os.rmdir(lock_dir)
+
+
+def _link_cache_blob_or_copy(source, destination, linked):
+    """Hard-links the external blobs of Chromium's legacy block-file cache (f_*), which are written once and
+    never modified, and copies every other file because browsers update them in place. Linked files are
+    appended to linked."""
+    if os.path.basename(source).startswith("f_") and os.sep + "cache" in source.lower():
+        try:
+            os.link(source, destination)
+            linked.append(destination)
+            return destination
+        except OSError:
+            pass
+    return shutil.copy2(source, destination)
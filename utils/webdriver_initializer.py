@@ -1,3 +1,6 @@
+import shutil
+import time
+
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
@@ -6,8 +9,18 @@ from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.edge.options import Options as EdgeOptions
+from selenium.webdriver.common.driver_finder import DriverFinder
 
+from utils.async_webdriver import AsyncWebDriver
+from utils.browser_presets import BrowserPreset, preset_stats
+from utils.command_executor import use_pooled_connection
 from utils.config_loader import ConfigLoader
+from utils.lean_mode import LeanMode
+from utils.logger_instance import logger
+from utils.network_capture import network_capture
+from utils.process_utils import get_driver_service_pid, get_tree_rss_bytes
+from utils.process_watchdog import process_watchdog
+from utils.warm_profile import WarmProfileManager, instrument_first_paint, register_profile_clone
 
 
 class WebDriverInitializer:
@@ -15,6 +28,11 @@ class WebDriverInitializer:
         """Initializes the WebDriverInitializer by loading the browser configuration."""
         self.config = ConfigLoader()
         self.browser = self.config.get_specified_browser().lower()
+        self.lean_mode = LeanMode(self.config.get_lean_mode_settings(), self.browser)
+        self.preset = BrowserPreset(self.config.get_browser_preset_settings()["name"], self.browser)
+        self.command_executor_settings = self.config.get_command_executor_settings()
+        self.warm_profile = WarmProfileManager(self.config.get_warm_profile_settings(), self.browser)
+        self.logger = logger
 
     def _get_browser_options(self):
         """Creates and returns browser-specific options based on the specified browser in the config.json file."""
@@ -32,24 +50,104 @@ class WebDriverInitializer:
                 options = ChromeOptions()
             else:
                 raise KeyError(f"The browser {self.browser} is not supported.")
+            self.preset.apply_to_options(options)
             for option in browser_options:
                 options.add_argument(option)
+            self.lean_mode.apply_to_options(options)
+            network_capture.apply_to_options(options, self.browser)
             return options
         except KeyError as e:
             raise KeyError(f"The browser_options option wasn't found in the config.json file. Error: {e}")
 
     def initialize_webdriver(self):
         """Initializes and returns a WebDriver instance for the specified browser."""
+        try:
+            options = self._get_browser_options()
+            profile_dir = None
+            if self.warm_profile.enabled:
+                self.warm_profile.ensure_template(self._launch_with_profile)
+                profile_dir = self.warm_profile.clone()
+                self.warm_profile.apply_to_options(options, profile_dir)
+            start = time.perf_counter()
+            try:
+                web_driver = self._create_driver(options)
+            except WebDriverException:
+                if profile_dir is not None:
+                    shutil.rmtree(profile_dir, ignore_errors=True)
+                raise
+            if profile_dir is not None:
+                register_profile_clone(web_driver, profile_dir)
+            if self.warm_profile.enabled and self.warm_profile.measure_first_paint:
+                instrument_first_paint(web_driver)
+            process_watchdog.track(web_driver)
+            if self.command_executor_settings["pooled"]:
+                use_pooled_connection(
+                    web_driver,
+                    self.browser,
+                    pool_size=self.command_executor_settings["pool_size"],
+                    timeout=self.command_executor_settings["timeout"],
+                )
+            self.preset.apply_window(web_driver)
+            self._report_startup(web_driver, time.perf_counter() - start)
+            self.lean_mode.activate(web_driver)
+            network_capture.activate(web_driver)
+            return web_driver
+        except WebDriverException as e:
+            raise WebDriverException(f"An error occurred while trying to initialize the WebDriver. Error: {e}")
+
+    def _create_driver(self, options):
+        if self.browser == "chrome":
+            return webdriver.Chrome(service=ChromeService(), options=options)
+        if self.browser == "firefox":
+            return webdriver.Firefox(service=FirefoxService(), options=options)
+        if self.browser == "edge":
+            return webdriver.Edge(service=EdgeService(), options=options)
+        raise KeyError(f"The browser {self.browser} is not supported.")
+
+    def _launch_with_profile(self, profile_dir):
+        """Launches a browser on the given profile directory, used to build the warm profile template."""
+        options = self._get_browser_options()
+        self.warm_profile.apply_to_options(options, profile_dir)
+        return self._create_driver(options)
+
+    def start_driver_service(self):
+        """Starts a local driver server (chromedriver, geckodriver...) that can host many async sessions."""
         try:
             options = self._get_browser_options()
             if self.browser == "chrome":
-                web_driver = webdriver.Chrome(service=ChromeService(), options=options)
+                service = ChromeService()
             elif self.browser == "firefox":
-                web_driver = webdriver.Firefox(service=FirefoxService(), options=options)
+                service = FirefoxService()
             elif self.browser == "edge":
-                web_driver = webdriver.Edge(service=EdgeService(), options=options)
+                service = EdgeService()
             else:
                 raise KeyError(f"The browser {self.browser} is not supported.")
+            service.path = service.env_path() or DriverFinder(service, options).get_driver_path()
+            service.start()
+            return service
+        except WebDriverException as e:
+            raise WebDriverException(f"An error occurred while trying to start the driver service. Error: {e}")
+
+    async def initialize_async_webdriver(self, transport, server_url):
+        """Opens an AsyncWebDriver session with the configured browser options on a running driver server."""
+        try:
+            capabilities = self._get_browser_options().to_capabilities()
+            web_driver = await AsyncWebDriver.create(transport, server_url, capabilities)
+            if self.preset.viewport is not None:
+                await web_driver.set_window_size(*self.preset.viewport)
             return web_driver
         except WebDriverException as e:
-            raise WebDriverException(f"An error occurred while trying to initialize the WebDriver. Error: {e}")
+            raise WebDriverException(f"An error occurred while trying to initialize the async WebDriver. Error: {e}")
+
+    def _report_startup(self, web_driver, startup_seconds):
+        """Logs and records how long the browser took to start and how much memory its processes use."""
+        service_pid = get_driver_service_pid(web_driver)
+        rss_bytes = get_tree_rss_bytes(service_pid) if service_pid else 0
+        preset_stats.record(self.preset.name, self.browser, startup_seconds, rss_bytes)
+        self.logger.info(
+            "Started %s with the %s preset in %.2f s, using %.1f MiB of resident memory.",
+            self.browser,
+            self.preset.name or "default",
+            startup_seconds,
+            rss_bytes / (1024 * 1024),
+        )
@@ -1,3 +1,5 @@
+import os
+
 # Test data values
 
 #TEST data variables
@@ -13,9 +15,17 @@ id_item_to_be_added = 'add-to-cart-sauce-labs-backpack'
 
 
 #URLS BEING DEFINED
-url_inventory_page ="https://www.saucedemo.com/inventory.html"
-url_cart_page = "https://www.saucedemo.com/cart.html"
-url_checkout_page_one = 'https://www.saucedemo.com/checkout-step-one.html'
-url_checkout_page_two = 'https://www.saucedemo.com/checkout-step-two.html'
-url_checkout_complete = 'https://www.saucedemo.com/checkout-complete.html'
+def set_base_url(new_base_url):
+    """Points every URL at a SauceDemo deployment, such as the bundled local replica."""
+    global base_url, url_login_page, url_inventory_page, url_cart_page
+    global url_checkout_page_one, url_checkout_page_two, url_checkout_complete
+    base_url = new_base_url.rstrip("/")
+    url_login_page = f"{base_url}/"
+    url_inventory_page = f"{base_url}/inventory.html"
+    url_cart_page = f"{base_url}/cart.html"
+    url_checkout_page_one = f"{base_url}/checkout-step-one.html"
+    url_checkout_page_two = f"{base_url}/checkout-step-two.html"
+    url_checkout_complete = f"{base_url}/checkout-complete.html"
+
 
+set_base_url(os.getenv("SAUCEDEMO_BASE_URL", "https://www.saucedemo.com"))